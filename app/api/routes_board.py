@@ -439,9 +439,10 @@ async def analyze_images_hybrid(
     board_id: Optional[int] = None,
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None
-) -> Tuple[bool, str, List[int]]:
+) -> Tuple[bool, str]:
     """
     이미지 하이브리드 분석 (NSFW 1차 + Vision API 2차)
+    분석 로그는 큐에 넣어 백그라운드에서 일괄 저장합니다 (응답이 DB 저장을 기다리지 않음).
     
     Args:
         saved_images: 저장된 이미지 정보 리스트
@@ -450,13 +451,11 @@ async def analyze_images_hybrid(
         user_agent: User Agent
         
     Returns:
-        (차단 여부, 차단 사유, 로그 ID 리스트)
+        (차단 여부, 차단 사유)
     """
     if not IMAGE_ANALYSIS_AVAILABLE:
         print("[WARN] 이미지 분석 모듈 사용 불가 - 분석 건너뜀")
-        return False, "", []
-    
-    log_ids = []
+        return False, ""
     
     for image in saved_images:
         start_time = time.time()
@@ -525,28 +524,21 @@ async def analyze_images_hybrid(
             # 분석 시간 계산
             response_time = time.time() - start_time
             
-            # 로그 저장 (비동기 처리)
-            loop = asyncio.get_event_loop()
-            log_id = await loop.run_in_executor(
-                background_executor,
-                lambda: image_logger.log_analysis(
-                    filename=image['filename'],
-                    original_name=image['original_name'],
-                    file_size=image['size'],
-                    board_id=board_id,
-                    nsfw_result=nsfw_result,
-                    vision_result=vision_result,
-                    is_blocked=is_blocked,
-                    block_reason=block_reason,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    response_time=response_time
-                )
+            # 로그 저장 (큐에 넣고 백그라운드에서 일괄 INSERT)
+            image_logger.enqueue_analysis(
+                filename=image['filename'],
+                original_name=image['original_name'],
+                file_size=image['size'],
+                board_id=board_id,
+                nsfw_result=nsfw_result,
+                vision_result=vision_result,
+                is_blocked=is_blocked,
+                block_reason=block_reason,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                response_time=response_time
             )
             
-            if log_id:
-                log_ids.append(log_id)
-            
             # 차단된 이미지 발견 시 즉시 반환
             if is_blocked:
                 # 모든 이미지 삭제
@@ -557,13 +549,13 @@ async def analyze_images_hybrid(
                     except:
                         pass
                 
-                return True, block_reason, log_ids
+                return True, block_reason
                 
         except Exception as e:
             print(f"[ERROR] 이미지 분석 실패: {image['filename']}, {e}")
             # 분석 실패 시 로그만 남기고 통과
             try:
-                log_id = image_logger.log_analysis(
+                image_logger.enqueue_analysis(
                     filename=image['filename'],
                     original_name=image['original_name'],
                     file_size=image['size'],
@@ -572,12 +564,10 @@ async def analyze_images_hybrid(
                     ip_address=ip_address,
                     user_agent=user_agent
                 )
-                if log_id:
-                    log_ids.append(log_id)
             except:
                 pass
     
-    return False, "", log_ids
+    return False, ""
 
 
 def analyze_and_update_comment(comment_id: int, text: str, ip_address: str = None):
@@ -1261,7 +1251,7 @@ async def create_post(
     
     # 이미지 윤리/스팸 분석 (하이브리드: NSFW + Vision API)
     if saved_images:
-        images_blocked, image_block_reason, image_log_ids = await analyze_images_hybrid(
+        images_blocked, image_block_reason = await analyze_images_hybrid(
             saved_images=saved_images,
             board_id=post_id,
             ip_address=client_ip,
@@ -1493,7 +1483,7 @@ async def update_post(
         client_ip = request.client.host if request.client else None
         user_agent = request.headers.get('user-agent')
         
-        images_blocked, image_block_reason, image_log_ids = await analyze_images_hybrid(
+        images_blocked, image_block_reason = await analyze_images_hybrid(
             saved_images=new_images,
             board_id=post_id,
             ip_address=client_ip,
@@ -4,7 +4,10 @@ match_backend 모듈을 사용하여 신고 검증 기능 제공
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Optional
+import asyncio
+import json
 import os
 from dotenv import load_dotenv
 
@@ -17,19 +20,41 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from match_backend.core import (
-    analyze_with_ai,
+    analyze_with_ai_batched,
+    analyze_with_ai_stream,
     save_report_to_db,
     save_analysis_only_to_db,
     load_reports_db,
+    list_reports_by_status,
+    list_reports_by_priority,
     save_reports_db,
     update_report_status,
     get_report_by_id,
     get_reports_with_filters,
+    iter_reports_with_filters,
     get_dashboard_stats
 )
 from match_backend.models import ReportRequest, ReportResponse
 
-router = APIRouter(tags=["wmaa"])
+# 앱 전체와 같은 orjson 응답 설정 사용 (orjson이 없으면 표준 json)
+from app.responses import AppJSONResponse, dumps_bytes as _dumps_bytes
+
+# 전체 목록 스트리밍 시 한 번에 직렬화/전송할 신고 수
+_STREAM_CHUNK_SIZE = 200
+
+
+def _stream_reports_json(reports: list):
+    """
+    {"success": true, "data": [...], "total": N} 응답 본문을 신고 _STREAM_CHUNK_SIZE개 단위로 생성
+    (전체 직렬화가 끝나기 전에 전송을 시작 — 목록이 커도 첫 바이트가 바로 나감)
+    """
+    yield b'{"success":true,"data":['
+    for start in range(0, len(reports), _STREAM_CHUNK_SIZE):
+        chunk = b','.join(map(_dumps_bytes, reports[start:start + _STREAM_CHUNK_SIZE]))
+        yield chunk if start == 0 else b',' + chunk
+    yield b'],"total":%d}' % len(reports)
+
+router = APIRouter(tags=["wmaa"], default_response_class=AppJSONResponse)
 
 # ============================================
 # 🔍 신고 분석 API
@@ -52,11 +77,11 @@ async def analyze_report(report: ReportRequest):
                 detail="OpenAI API 키가 설정되지 않았습니다. match_config.env 파일에 실제 API 키를 입력하세요."
             )
         
-        # AI 분석 수행
-        result = analyze_with_ai(report.post_content, report.reason)
+        # AI 분석 수행 (비동기 — 동시에 들어온 분석 요청은 한 번의 API 호출로 묶어서 처리)
+        result = await analyze_with_ai_batched(report.post_content, report.reason)
         
         # 분석 결과만 저장 (테스트용)
-        saved_analysis = save_analysis_only_to_db(result)
+        saved_analysis = await asyncio.to_thread(save_analysis_only_to_db, result)
         
         return ReportResponse(
             id=saved_analysis['id'],
@@ -75,6 +100,50 @@ async def analyze_report(report: ReportRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/analyze/stream")
+async def analyze_report_stream(report: ReportRequest):
+    """
+    신고 내용 AI 분석 - 스트리밍 (테스트용)
+    
+    - NDJSON으로 진행 상황을 전송: 점수가 확정되면 {"event": "score"} 를 먼저 보내고,
+      분석이 끝나면 /analyze와 같은 필드의 {"event": "result"} 를 보냄
+    - 오류 시 {"event": "error", "detail"} 로 종료
+    """
+    api_key = os.getenv('OPENAI_API_KEY', '')
+    if not api_key or api_key == 'your-api-key-here':
+        raise HTTPException(
+            status_code=500, 
+            detail="OpenAI API 키가 설정되지 않았습니다. match_config.env 파일에 실제 API 키를 입력하세요."
+        )
+    
+    async def events():
+        try:
+            async for event in analyze_with_ai_stream(report.post_content, report.reason):
+                if event['event'] == 'result':
+                    result = event['result']
+                    saved_analysis = await asyncio.to_thread(save_analysis_only_to_db, result)
+                    event = {
+                        'event': 'result',
+                        'data': ReportResponse(
+                            id=saved_analysis['id'],
+                            post_content=report.post_content,
+                            reason=report.reason,
+                            result_type=result['type'],
+                            score=result['score'],
+                            analysis=result['analysis'],
+                            css_class=result['css_class'],
+                            timestamp=saved_analysis['reportDate'],
+                            status='test_analysis',
+                            post_action='테스트 분석 완료'
+                        ).model_dump()
+                    }
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        except Exception as e:
+            yield json.dumps({'event': 'error', 'detail': str(e)}, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 # ============================================
 # 📋 예시 데이터 API
 # ============================================
@@ -116,19 +185,55 @@ async def get_examples():
 # ============================================
 
 @router.get("/reports/list")
-async def get_reports_list():
+async def get_reports_list(
+    status: Optional[str] = Query(None, description="처리 상태 (pending, completed, rejected)"),
+    priority: Optional[str] = Query(None, description="우선순위 (high, normal, low)"),
+    limit: Optional[int] = Query(None, description="페이지 크기 (지정 시 페이지 단위 조회)", ge=1, le=1000),
+    offset: int = Query(0, description="오프셋", ge=0)
+):
     """
     전체 신고 목록 조회
     
     관리자 대시보드에서 사용
+    - status / priority: 지정 시 해당 신고만 반환
+    - limit / offset: 지정 시 전체 목록 대신 최신순 한 페이지만 조회 (pagination 포함)
+    - postAction: 두 방식 모두 원본 값(delete, keep, none)
+      (/reports/detail, /reports/filtered는 안내 문구로 반환)
     """
     try:
-        reports = load_reports_db()
-        return {
-            'success': True,
-            'data': reports,
-            'total': len(reports)
-        }
+        if limit is not None:
+            # 전체 목록을 메모리에 올리지 않고 해당 페이지만 조회 (postAction은 전체 목록과 같은 원본 값)
+            result = await asyncio.to_thread(
+                get_reports_with_filters,
+                status_filter=status,
+                priority_filter=priority,
+                limit=limit,
+                offset=offset,
+                post_action_message=False
+            )
+            return AppJSONResponse({
+                'success': True,
+                'data': result['reports'],
+                'total': result['total'],
+                'pagination': {
+                    'total': result['total'],
+                    'limit': result['limit'],
+                    'offset': result['offset'],
+                    'has_more': result['offset'] + result['limit'] < result['total']
+                }
+            })
+        
+        if status:
+            reports = await asyncio.to_thread(list_reports_by_status, status)
+            if priority:
+                reports = [r for r in reports if r['priority'] == priority]
+        elif priority:
+            reports = await asyncio.to_thread(list_reports_by_priority, priority)
+        else:
+            reports = await asyncio.to_thread(load_reports_db)
+        # 신고 데이터는 이미 JSON 호환 값(날짜는 ISO 문자열)이므로 jsonable_encoder를 거치지 않고
+        # 직렬화하면서 바로 전송 (동기 제너레이터는 StreamingResponse가 스레드풀에서 순회)
+        return StreamingResponse(_stream_reports_json(reports), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 로드 중 오류: {str(e)}")
 
@@ -141,7 +246,7 @@ async def get_report_detail(report_id: int):
     - report_id: 신고 ID
     """
     try:
-        report = get_report_by_id(report_id)
+        report = await asyncio.to_thread(get_report_by_id, report_id)
         
         if report:
             return {
@@ -186,14 +291,16 @@ async def update_report(
             )
         
         # 신고 상태 업데이트
-        updated_report = update_report_status(report_id, status, processing_note)
+        updated_report = await asyncio.to_thread(update_report_status, report_id, status, processing_note)
         
         return {
             'success': True,
             'data': updated_report,
             'message': '신고가 성공적으로 업데이트되었습니다.'
         }
-        
+
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -212,7 +319,7 @@ async def get_reports_stats():
     대시보드 카드에 표시할 요약 통계
     """
     try:
-        stats = get_dashboard_stats()
+        stats = await asyncio.to_thread(get_dashboard_stats)
         
         return {
             'success': True,
@@ -254,27 +361,18 @@ async def get_filtered_reports(
     관리자 페이지에서 다양한 조건으로 신고를 필터링하여 조회
     """
     try:
-        # AI 결과 필터를 MySQL enum 형식으로 변환
-        mysql_ai_result = None
-        if ai_result:
-            ai_result_mapping = {
-                '일치': 'match',
-                '부분일치': 'partial_match',
-                '불일치': 'mismatch'
-            }
-            mysql_ai_result = ai_result_mapping.get(ai_result, ai_result)
-        
-        result = get_reports_with_filters(
+        result = await asyncio.to_thread(
+            get_reports_with_filters,
             status_filter=status,
             type_filter=report_type,
-            ai_result_filter=mysql_ai_result,
+            ai_result_filter=ai_result,
             start_date=start_date,
             end_date=end_date,
             limit=limit,
             offset=offset
         )
         
-        return {
+        return AppJSONResponse({
             'success': True,
             'data': result['reports'],
             'pagination': {
@@ -283,12 +381,38 @@ async def get_filtered_reports(
                 'offset': result['offset'],
                 'has_more': result['offset'] + result['limit'] < result['total']
             }
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"필터링된 신고 조회 중 오류: {str(e)}")
 
 
+@router.get("/reports/export")
+async def export_filtered_reports(
+    status: Optional[str] = Query(None, description="상태 필터 (pending, completed, rejected)"),
+    report_type: Optional[str] = Query(None, description="신고 유형 필터"),
+    ai_result: Optional[str] = Query(None, description="AI 결과 필터 (match, partial_match, mismatch)"),
+    start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)")
+):
+    """
+    필터링된 신고 전체 내보내기 (NDJSON 스트리밍)
+    
+    /reports/filtered와 같은 필터를 사용하며, 페이징 없이 한 줄에 신고 하나씩 전송
+    (DB에서 읽는 대로 보내므로 전체 결과를 메모리에 올리지 않음)
+    """
+    reports = iter_reports_with_filters(
+        status_filter=status,
+        type_filter=report_type,
+        ai_result_filter=ai_result,
+        start_date=start_date,
+        end_date=end_date
+    )
+    # 동기 제너레이터는 StreamingResponse가 스레드풀에서 순회하므로 이벤트 루프를 막지 않음
+    lines = (json.dumps(report, ensure_ascii=False, default=str) + "\n" for report in reports)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 # ============================================
 # 📊 관리자 API - 대시보드 통계
 # ============================================
@@ -301,7 +425,7 @@ async def get_dashboard_statistics():
     차트와 지표에 사용할 상세한 통계 데이터
     """
     try:
-        stats = get_dashboard_stats()
+        stats = await asyncio.to_thread(get_dashboard_stats)
         
         return {
             'success': True,
@@ -31,7 +31,7 @@ logging.getLogger('chrun_backend.rag_pipeline.rag_decider').setLevel(logging.INF
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 import os
@@ -42,13 +42,17 @@ import secrets
 # 환경 변수 로드 (match_config.env 파일)
 load_dotenv('match_config.env')
 
+# 기본 JSON 응답 클래스 (orjson이 있으면 사용 — 라우터와 같은 설정, app/responses.py)
+from app.responses import AppJSONResponse
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="Community Admin Frontend",
     description="커뮤니티 관리자용 API 서비스 프론트엔드",
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
-    redoc_url="/redoc"  # ReDoc
+    redoc_url="/redoc",  # ReDoc
+    default_response_class=AppJSONResponse
 )
 
 # 세션 미들웨어 추가 (인증에 필요)
@@ -227,6 +231,13 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     print("\nServer shutting down...")
+    
+    # 큐에 남은 이미지 분석 로그 저장
+    try:
+        from ethics.image_db_logger import image_logger
+        image_logger.flush_logs()
+    except Exception as e:
+        print(f"[WARN] 이미지 분석 로그 flush 실패: {e}")
 
 # 직접 실행 시
 if __name__ == "__main__":
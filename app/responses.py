@@ -0,0 +1,31 @@
+"""
+공용 JSON 응답 클래스
+- app/main.py(앱 기본 응답)와 라우터(default_response_class)가 같은 설정을 쓰도록 한 곳에서 정의
+"""
+
+import json
+
+from fastapi.responses import JSONResponse
+
+# orjson이 있으면 직렬화에 사용 (없으면 표준 json)
+# (ORJSONResponse는 FastAPI에서 deprecated — 응답마다 경고가 나므로 JSONResponse.render를 직접 교체)
+try:
+    import orjson
+
+    # 표준 json처럼 문자열이 아닌 dict 키(int 등)를 허용하고 numpy 값도 직렬화
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps_bytes(obj) -> bytes:
+        """응답 본문용 compact JSON 바이트"""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    class AppJSONResponse(JSONResponse):
+        """orjson으로 직렬화하는 JSONResponse"""
+        def render(self, content) -> bytes:
+            return dumps_bytes(content)
+except ImportError:
+    def dumps_bytes(obj) -> bytes:
+        """응답 본문용 compact JSON 바이트"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    AppJSONResponse = JSONResponse
@@ -0,0 +1,19 @@
+-- 신고 관리 조회 성능 개선용 인덱스 추가
+-- 실행: mysql -u root -p1234 wmai -e "source db/migration_add_report_indexes.sql"
+--
+-- 기존 인덱스: idx_report_status_created (status, created_at DESC), idx_report_type (report_type),
+--             idx_report_analysis_report (report_id)
+
+-- 1. 필터 없는 신고 목록 (ORDER BY created_at DESC LIMIT ...) 정렬을 인덱스로 처리
+CREATE INDEX idx_report_created ON report(created_at DESC);
+
+-- 2. 날짜 범위 필터 / 대시보드 최근 7일 트렌드 (report_date >= ...)
+CREATE INDEX idx_report_date ON report(report_date);
+
+-- 3. AI 결과 필터 조인 (report_id로 조인하면서 result까지 인덱스에서 확인)
+--    report_id로 시작하므로 외래 키 인덱스 역할도 대신함 → 기존 단일 컬럼 인덱스는 제거
+ALTER TABLE report_analysis
+    ADD INDEX idx_report_analysis_report_result (report_id, result),
+    DROP INDEX idx_report_analysis_report;
+
+SELECT '✅ 마이그레이션 완료: report / report_analysis 조회 인덱스가 추가되었습니다.' AS status;
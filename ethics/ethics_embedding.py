@@ -19,6 +19,20 @@ EMBEDDING_DIMENSION = 1536
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# OpenAI 클라이언트 캐시 (호출마다 새 클라이언트/연결 풀을 만들지 않도록 재사용, 키가 바뀌면 재생성)
+_client = None
+_client_key: Optional[str] = None
+
+
+def _get_client(api_key: str):
+    """OpenAI 클라이언트 싱글톤 반환 (openai 패키지가 없으면 ImportError)"""
+    global _client, _client_key
+    if _client is None or _client_key != api_key:
+        from openai import OpenAI
+        _client = OpenAI(api_key=api_key)
+        _client_key = api_key
+    return _client
+
 
 def get_embedding(text: str) -> List[float]:
     """
@@ -43,16 +57,13 @@ def get_embedding(text: str) -> List[float]:
         return _get_dummy_embedding()
     
     try:
-        # OpenAI 클라이언트 import
+        # OpenAI 클라이언트 (재사용)
         try:
-            from openai import OpenAI
+            client = _get_client(api_key)
         except ImportError:
             logger.error("OpenAI 패키지가 설치되지 않았습니다. pip install openai 실행 필요")
             return _get_dummy_embedding()
         
-        # OpenAI 클라이언트 초기화
-        client = OpenAI(api_key=api_key)
-        
         # 임베딩 API 호출
         logger.debug(f"임베딩 생성 시작: {text[:50]}...")
         
@@ -128,16 +139,13 @@ def get_embeddings_batch(texts: List[str]) -> List[List[float]]:
         return [_get_dummy_embedding() for _ in texts]
     
     try:
-        # OpenAI 클라이언트 import
+        # OpenAI 클라이언트 (재사용)
         try:
-            from openai import OpenAI
+            client = _get_client(api_key)
         except ImportError:
             logger.error("OpenAI 패키지가 설치되지 않았습니다. pip install openai 실행 필요")
             return [_get_dummy_embedding() for _ in texts]
         
-        # OpenAI 클라이언트 초기화
-        client = OpenAI(api_key=api_key)
-        
         # ⚡ 배치 임베딩 API 호출 (한 번에 모든 텍스트 처리)
         logger.debug(f"배치 임베딩 생성 시작: {len(valid_texts)}개 텍스트")
         
@@ -42,7 +42,7 @@ class EthicsPredictor:
         self.tokenizer = BertTokenizer.from_pretrained(self.model_name)
         
         # 이진 분류 모델 로드
-        checkpoint = torch.load(model_path, map_location=self.device)
+        checkpoint = self._load_checkpoint(model_path)
         self.model = EthicsClassifier(self.model_name, num_classes=2)
         
         # state_dict 키 이름 변환 (fc -> classifier)
@@ -61,6 +61,18 @@ class EthicsPredictor:
         
         print(f"[INFO] 모델 로드 완료 (정확도: {checkpoint.get('val_acc', 0):.4f})")
     
+    @staticmethod
+    def _load_checkpoint(model_path):
+        """
+        체크포인트를 mmap으로 로드 (PyTorch 2.1+)
+        파일 전체를 메모리로 복사하지 않고 필요한 가중치만 페이지 단위로 읽습니다.
+        구버전 PyTorch나 구형(pickle) 체크포인트는 일반 로드로 대체합니다.
+        """
+        try:
+            return torch.load(model_path, map_location='cpu', mmap=True)
+        except (TypeError, RuntimeError):
+            return torch.load(model_path, map_location='cpu')
+    
     def predict(self, text):
         """단일 텍스트 예측"""
         encoding = self.tokenizer.encode_plus(
@@ -5,10 +5,16 @@ ChromaDB를 사용한 비윤리/스팸 케이스 저장 및 검색
 """
 
 import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Dict, List, Optional
 from datetime import datetime
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 
@@ -16,33 +22,261 @@ from chromadb.config import Settings
 PERSIST_DIR = "./ethics_chroma_store"
 COLLECTION_NAME = "ethics_spam_cases"
 
+# 새 컬렉션 생성 시 HNSW 인덱스 설정 (기존 컬렉션에는 적용되지 않음)
+# - M: 노드당 이웃 수 (클수록 그래프가 커지지만 recall 향상)
+# - construction_ef / search_ef: 색인/검색 시 탐색 폭 (클수록 정확, 느림)
+# 거리 함수(hnsw:space)는 기본값(l2)을 유지 — 바꾸면 score(1 - distance)의 의미가 달라짐
+COLLECTION_METADATA = {
+    "description": "비윤리/스팸 케이스들을 저장하는 컬렉션",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 100,
+}
+
+# 컬렉션 통계 누적값과 created_at 정렬 인덱스를 보관하는 사이드카 SQLite 파일 (전체 스캔 방지)
+STATS_DB_PATH = os.path.join(PERSIST_DIR, "ethics_stats.sqlite3")
+
+# 사이드카 SQLite 스키마 (프로세스당 한 번 실행)
+_SIDECAR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ethics_stats (
+    name TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    confirmed INTEGER NOT NULL DEFAULT 0,
+    sum_immoral REAL NOT NULL DEFAULT 0,
+    sum_spam REAL NOT NULL DEFAULT 0,
+    sum_conf REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS ethics_case_index (
+    name TEXT NOT NULL,
+    id TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT '',
+    confirmed INTEGER NOT NULL DEFAULT 0,
+    admin_action TEXT NOT NULL DEFAULT '',
+    source_type TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (name, id)
+);
+CREATE INDEX IF NOT EXISTS idx_ethics_case_created
+ON ethics_case_index (name, confirmed, created_at);
+CREATE TABLE IF NOT EXISTS ethics_generation (
+    name TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# 사이드카 연결은 스레드별로 재사용 (_close_sidecar가 epoch를 올리면 다시 연결)
+_sidecar_local = threading.local()
+_sidecar_lock = threading.Lock()
+_sidecar_conns: List[sqlite3.Connection] = []
+_sidecar_ready = False
+_sidecar_epoch = 0
+
+# 서버 모드 Chroma (AsyncHttpClient) 접속 정보
+CHROMA_HOST = os.getenv("CHROMA_HOST", "localhost")
+CHROMA_PORT = int(os.getenv("CHROMA_PORT", "8000"))
+
+# 이 개수를 넘는 메타데이터는 NumPy로 합계를 계산 (소량은 순수 Python이 더 빠름)
+NUMPY_STATS_THRESHOLD = 1000
+
+_STATS_DTYPE = np.dtype([
+    ("confirmed", "?"),
+    ("immoral", "f8"),
+    ("spam", "f8"),
+    ("conf", "f8"),
+])
+
+# upsert 시 float로 저장하는 메타데이터 키
+_FLOAT_META_KEYS = (
+    "immoral_score",
+    "spam_score",
+    "immoral_confidence",
+    "spam_confidence",
+    "confidence",
+    "original_immoral_score",
+    "original_spam_score",
+)
+
+# upsert 시 문자열로 저장하는 메타데이터 키와 기본값
+_STR_META_DEFAULTS = (
+    ("post_id", ""),
+    ("user_id", ""),
+    ("feedback_type", "auto_saved"),
+    ("admin_action", ""),
+    ("note", ""),
+)
+
+# Chroma SQLite 튜닝 PRAGMA (fsync 횟수 감소, 임시/캐시 메모리 사용)
+# journal_mode=WAL은 DB 파일에 영구 저장되고, 나머지는 연결 단위 설정
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-65536",
+)
+
+# 대량 적재 전용 PRAGMA (내구성 완화: 적재 중 비정상 종료 시 DB가 손상될 수 있음)
+SQLITE_BULK_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-262144",
+)
+SQLITE_BULK_RESTORE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+)
+
+# 클라이언트/컬렉션 싱글톤 (매 호출마다 get_collection 왕복 방지)
+_client_instance = None
+_client_lock = threading.Lock()
+_collection_cache: Dict[str, tuple] = {}
+_async_client_instance = None
+_async_collection_cache: Dict[str, object] = {}
+
+# 유사 케이스 검색 결과 LRU 캐시 (양자화된 임베딩 → 결과)
+QUERY_CACHE_SIZE = 512
+_query_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+_query_cache_lock = threading.Lock()
+_query_cache_hits = 0
+_query_cache_misses = 0
+
+# 소규모 컬렉션은 임베딩 행렬을 메모리에 올려 NumPy 행렬-벡터 곱으로 전수 검색
+MATRIX_SEARCH_MAX_ROWS = 50_000
+
+# 행렬을 행별 스케일의 int8로 저장 (메모리 1/4, 대신 검색 시 블록 단위 역양자화로 더 느림)
+MATRIX_SEARCH_INT8 = os.getenv("ETHICS_MATRIX_INT8", "false").lower() == "true"
+_INT8_BLOCK_ROWS = 4096
+
+# upsert를 행렬 복사 없이 덧붙이기 위한 여유 행 (최소 개수, 또는 현재 행 수의 1/8)
+_MATRIX_SPARE_ROWS = 1024
+# 교체/삭제로 검색에서 빠진 행이 이 비율을 넘으면 다음 검색 때 다시 적재
+_MATRIX_MAX_DEAD_RATIO = 0.25
+_matrix_cache: Dict[str, Optional[Dict]] = {}
+_matrix_lock = threading.Lock()
+
 
 def get_client() -> chromadb.ClientAPI:
     """
-    ChromaDB 클라이언트를 생성하고 반환합니다.
+    ChromaDB 클라이언트 싱글톤을 반환합니다 (최초 호출 시 생성).
     
     Returns:
         chromadb.ClientAPI: ChromaDB 클라이언트 인스턴스
     """
-    try:
-        # 디렉토리가 없으면 생성
-        import os
-        if not os.path.exists(PERSIST_DIR):
-            os.makedirs(PERSIST_DIR, exist_ok=True)
-            print(f"[INFO] ChromaDB 디렉토리 생성: {PERSIST_DIR}")
-        
-        client = chromadb.PersistentClient(
-            path=PERSIST_DIR,
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True
-            )
-        )
-        return client
+    global _client_instance
+    if _client_instance is not None:
+        return _client_instance
+    
+    with _client_lock:
+        if _client_instance is not None:
+            return _client_instance
         
+        try:
+            # 디렉토리가 없으면 생성
+            if not os.path.exists(PERSIST_DIR):
+                os.makedirs(PERSIST_DIR, exist_ok=True)
+                print(f"[INFO] ChromaDB 디렉토리 생성: {PERSIST_DIR}")
+            
+            _client_instance = chromadb.PersistentClient(
+                path=PERSIST_DIR,
+                settings=Settings(
+                    anonymized_telemetry=False,
+                    allow_reset=True
+                )
+            )
+            _tune_sqlite(_client_instance)
+            return _client_instance
+            
+        except Exception as e:
+            print(f"[ERROR] ChromaDB 클라이언트 생성 실패: {type(e).__name__}: {e}")
+            raise
+
+
+def _tune_sqlite(client: chromadb.ClientAPI) -> None:
+    """
+    Chroma가 사용하는 SQLite에 WAL 모드와 완화된 동기화 설정을 적용합니다.
+    - journal_mode=WAL: 파일에 기록되므로 Chroma 버전과 무관하게 적용
+    - 연결 단위 PRAGMA: Python sysdb 연결 풀이 있는 버전(0.4/0.5)에서만 적용
+      (1.x는 Rust 바인딩이 SQLite를 직접 관리)
+    내부 속성은 버전마다 바뀔 수 있으므로 실패해도 무시합니다.
+    """
+    db_path = os.path.join(PERSIST_DIR, "chroma.sqlite3")
+    try:
+        if os.path.exists(db_path):
+            conn = sqlite3.connect(db_path, timeout=10)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            finally:
+                conn.close()
+    except sqlite3.Error as e:
+        print(f"[WARN] ChromaDB WAL 설정 실패: {e}")
+    
+    conn = _sysdb_connection(client)
+    if conn is not None:
+        try:
+            for pragma in SQLITE_CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+        except Exception:
+            pass
+
+
+def _sysdb_connection(client: chromadb.ClientAPI):
+    """Python sysdb 연결 풀의 SQLite 연결 (0.4/0.5 전용, 없으면 None)"""
+    try:
+        return client._server._sysdb._conn_pool.connect()
+    except Exception:
+        return None
+
+
+@contextmanager
+def bulk_ingest_mode(client: chromadb.ClientAPI):
+    """
+    대량 적재 동안 Chroma SQLite의 저널/동기화를 끄고, 끝나면 기본 설정으로 되돌립니다.
+    연결 단위 설정이므로 Python sysdb 연결 풀이 있는 버전에서만 적용되며,
+    그 외 버전에서는 경고만 출력하고 기본 설정으로 진행합니다.
+    
+    Yields:
+        bool: PRAGMA 적용 여부
+    """
+    conn = _sysdb_connection(client)
+    if conn is None:
+        print("[WARN] 이 ChromaDB 버전은 대량 적재 PRAGMA를 지원하지 않습니다 (기본 설정으로 진행)")
+        yield False
+        return
+    
+    try:
+        for pragma in SQLITE_BULK_PRAGMAS:
+            conn.execute(pragma)
     except Exception as e:
-        print(f"[ERROR] ChromaDB 클라이언트 생성 실패: {type(e).__name__}: {e}")
-        raise
+        print(f"[WARN] 대량 적재 PRAGMA 적용 실패: {e}")
+    
+    try:
+        yield True
+    finally:
+        try:
+            for pragma in SQLITE_BULK_RESTORE_PRAGMAS:
+                conn.execute(pragma)
+        except Exception as e:
+            print(f"[WARN] SQLite 기본 PRAGMA 복원 실패: {e}")
+
+
+def reset_client_cache() -> None:
+    """
+    캐시된 클라이언트/컬렉션 핸들을 폐기합니다.
+    저장소 디렉토리를 삭제하거나 컬렉션을 재생성한 뒤 호출해야 합니다.
+    """
+    global _client_instance
+    with _client_lock:
+        _client_instance = None
+        _collection_cache.clear()
+        _matrix_cache.clear()
+        clear_query_cache()
+        _close_sidecar()
+        try:
+            # 같은 경로의 PersistentClient가 이전 시스템을 재사용하지 않도록 정리
+            from chromadb.api.client import SharedSystemClient
+            SharedSystemClient.clear_system_cache()
+        except Exception:
+            pass
 
 
 def get_collection(client: chromadb.ClientAPI, name: str = COLLECTION_NAME) -> chromadb.Collection:
@@ -56,6 +290,10 @@ def get_collection(client: chromadb.ClientAPI, name: str = COLLECTION_NAME) -> c
     Returns:
         chromadb.Collection: ChromaDB 컬렉션 인스턴스
     """
+    cached = _collection_cache.get(name)
+    if cached is not None and cached[0] is client:
+        return cached[1]
+    
     try:
         # 기존 컬렉션이 있으면 반환
         collection = client.get_collection(name=name)
@@ -63,9 +301,10 @@ def get_collection(client: chromadb.ClientAPI, name: str = COLLECTION_NAME) -> c
         # 컬렉션이 없으면 새로 생성
         collection = client.create_collection(
             name=name,
-            metadata={"description": "비윤리/스팸 케이스들을 저장하는 컬렉션"}
+            metadata=COLLECTION_METADATA
         )
     
+    _collection_cache[name] = (client, collection)
     return collection
 
 
@@ -79,10 +318,716 @@ def build_chunk_id(sentence: str, post_id: str = "") -> str:
         
     Returns:
         str: SHA-256 해시 기반의 고유 ID
+        
+    Note:
+        기존에 저장된 ID와 호환되도록 "문장|post_id"의 SHA-256 전체 hex 값을 유지합니다.
+        (hashlib은 CPU가 지원하면 SHA-NI 가속을 사용)
+    """
+    h = hashlib.sha256(sentence.strip().encode('utf-8'))
+    h.update(b'|')
+    h.update(str(post_id).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _sidecar_connect() -> sqlite3.Connection:
+    """
+    현재 스레드의 사이드카 SQLite 연결을 반환합니다.
+    연결은 스레드마다 하나를 재사용하고, 스키마 생성은 프로세스당 한 번만 실행합니다.
+    """
+    conn = getattr(_sidecar_local, "conn", None)
+    if conn is not None and getattr(_sidecar_local, "epoch", None) == _sidecar_epoch:
+        return conn
+    
+    global _sidecar_ready
+    with _sidecar_lock:
+        os.makedirs(PERSIST_DIR, exist_ok=True)
+        # reset_client_cache()가 다른 스레드에서 닫을 수 있도록 check_same_thread=False
+        conn = sqlite3.connect(STATS_DB_PATH, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not _sidecar_ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SIDECAR_SCHEMA)
+            _sidecar_ready = True
+        _sidecar_conns.append(conn)
+        _sidecar_local.conn = conn
+        _sidecar_local.epoch = _sidecar_epoch
+    return conn
+
+
+def _close_sidecar() -> None:
+    """열린 사이드카 연결을 모두 닫습니다 (저장소 디렉토리 삭제/이동 전 호출)."""
+    global _sidecar_ready, _sidecar_epoch
+    with _sidecar_lock:
+        for conn in _sidecar_conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _sidecar_conns.clear()
+        _sidecar_ready = False
+        _sidecar_epoch += 1
+
+
+def _read_generation(name: str) -> Optional[int]:
+    """컬렉션 쓰기 세대 번호 (조회 실패 시 None)"""
+    try:
+        row = _sidecar_connect().execute(
+            "SELECT generation FROM ethics_generation WHERE name = ?", (name,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[WARN] ChromaDB 세대 번호 조회 실패: {e}")
+        return None
+    return row[0] if row else 0
+
+
+def _bump_generation(name: str) -> Optional[int]:
+    """
+    컬렉션 쓰기 세대 번호를 1 올리고 새 값을 반환합니다 (실패 시 None).
+    다른 프로세스(백필/적재 스크립트)의 쓰기를 감지하는 데 사용합니다.
+    """
+    try:
+        conn = _sidecar_connect()
+        with conn:
+            conn.execute("""
+                INSERT INTO ethics_generation (name, generation) VALUES (?, 1)
+                ON CONFLICT(name) DO UPDATE SET generation = generation + 1
+            """, (name,))
+            return conn.execute(
+                "SELECT generation FROM ethics_generation WHERE name = ?", (name,)
+            ).fetchone()[0]
+    except sqlite3.Error as e:
+        print(f"[WARN] ChromaDB 세대 번호 갱신 실패: {e}")
+        return None
+
+
+def _stats_values(meta: Optional[Dict]) -> tuple:
+    """메타데이터 한 건이 통계에 기여하는 (count, confirmed, immoral, spam, conf) 값"""
+    if not meta:
+        return (0, 0, 0.0, 0.0, 0.0)
+    return (
+        1,
+        1 if meta.get("confirmed") else 0,
+        meta.get("immoral_score") or 0.0,
+        meta.get("spam_score") or 0.0,
+        meta.get("confidence") or 0.0,
+    )
+
+
+def _apply_stats_delta(name: str, old_meta: Optional[Dict], new_meta: Optional[Dict]) -> None:
+    """
+    upsert/delete 결과를 사이드카 누적값에 반영합니다.
+    행이 없으면 (아직 부트스트랩 전) 아무것도 하지 않으며, 다음 통계 조회 시 전체 스캔으로 생성됩니다.
+    """
+    old = _stats_values(old_meta)
+    new = _stats_values(new_meta)
+    _add_stats(name, tuple(n - o for n, o in zip(new, old)))
+
+
+def _add_stats(name: str, delta: tuple) -> None:
+    """(count, confirmed, immoral, spam, conf) 증감분을 사이드카 누적값에 더합니다."""
+    if not any(delta):
+        return
+    
+    try:
+        conn = _sidecar_connect()
+        with conn:
+            conn.execute("""
+                UPDATE ethics_stats
+                SET count = count + ?, confirmed = confirmed + ?,
+                    sum_immoral = sum_immoral + ?, sum_spam = sum_spam + ?, sum_conf = sum_conf + ?
+                WHERE name = ?
+            """, (*delta, name))
+    except sqlite3.Error as e:
+        print(f"[WARN] ChromaDB 통계 사이드카 갱신 실패: {e}")
+
+
+def _rebuild_stats(collection: chromadb.Collection, name: str) -> tuple:
+    """전체 메타데이터를 스캔하여 사이드카 행을 다시 만듭니다 (부트스트랩/불일치 복구용)."""
+    all_data = collection.get(include=['metadatas'])
+    metadatas = all_data.get('metadatas') or []
+    
+    if len(metadatas) > NUMPY_STATS_THRESHOLD:
+        arr = np.fromiter(
+            (_stats_values(meta)[1:] for meta in metadatas),
+            dtype=_STATS_DTYPE,
+            count=len(metadatas)
+        )
+        row = (
+            len(metadatas),
+            int(arr["confirmed"].sum()),
+            float(arr["immoral"].sum()),
+            float(arr["spam"].sum()),
+            float(arr["conf"].sum()),
+        )
+    else:
+        totals = [0, 0, 0.0, 0.0, 0.0]
+        for meta in metadatas:
+            for i, value in enumerate(_stats_values(meta)):
+                totals[i] += value
+        row = (len(metadatas), *totals[1:])
+    
+    try:
+        conn = _sidecar_connect()
+        with conn:
+            conn.execute("""
+                INSERT INTO ethics_stats (name, count, confirmed, sum_immoral, sum_spam, sum_conf)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    count = excluded.count, confirmed = excluded.confirmed,
+                    sum_immoral = excluded.sum_immoral, sum_spam = excluded.sum_spam,
+                    sum_conf = excluded.sum_conf
+            """, (name, *row))
+    except sqlite3.Error as e:
+        print(f"[WARN] ChromaDB 통계 사이드카 저장 실패: {e}")
+    
+    return row
+
+
+def _read_stats(name: str) -> Optional[tuple]:
+    """사이드카에서 (count, confirmed, sum_immoral, sum_spam, sum_conf) 행을 읽습니다."""
+    try:
+        return _sidecar_connect().execute(
+            "SELECT count, confirmed, sum_immoral, sum_spam, sum_conf FROM ethics_stats WHERE name = ?",
+            (name,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[WARN] ChromaDB 통계 사이드카 조회 실패: {e}")
+        return None
+
+
+def _case_index_row(name: str, chunk_id: str, meta: Dict) -> tuple:
+    """정렬/필터용 인덱스 행"""
+    return (
+        name,
+        chunk_id,
+        str(meta.get("created_at") or ""),
+        1 if meta.get("confirmed") else 0,
+        str(meta.get("admin_action") or ""),
+        str(meta.get("source_type") or ""),
+    )
+
+
+def _index_case(name: str, chunk_id: str, meta: Optional[Dict]) -> None:
+    """케이스를 사이드카 인덱스에 반영합니다 (meta가 None이면 제거)."""
+    try:
+        conn = _sidecar_connect()
+        with conn:
+            if meta is None:
+                conn.execute(
+                    "DELETE FROM ethics_case_index WHERE name = ? AND id = ?",
+                    (name, chunk_id)
+                )
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ethics_case_index VALUES (?, ?, ?, ?, ?, ?)",
+                    _case_index_row(name, chunk_id, meta)
+                )
+    except sqlite3.Error as e:
+        print(f"[WARN] ChromaDB 사이드카 인덱스 갱신 실패: {e}")
+
+
+def _index_cases(name: str, rows: List[tuple]) -> None:
+    """여러 케이스의 인덱스 행을 한 트랜잭션으로 반영합니다."""
+    if not rows:
+        return
+    try:
+        conn = _sidecar_connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO ethics_case_index VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+    except sqlite3.Error as e:
+        print(f"[WARN] ChromaDB 사이드카 인덱스 갱신 실패: {e}")
+
+
+def _ensure_case_index(collection: chromadb.Collection, name: str) -> None:
+    """인덱스 행 수가 컬렉션과 다르면 메타데이터를 한 번 스캔하여 재구성합니다."""
+    count = collection.count()
+    conn = _sidecar_connect()
+    indexed = conn.execute(
+        "SELECT COUNT(*) FROM ethics_case_index WHERE name = ?", (name,)
+    ).fetchone()[0]
+    if indexed == count:
+        return
+    
+    raw = collection.get(include=["metadatas"])
+    ids = raw.get("ids") or []
+    metadatas = raw.get("metadatas") or []
+    with conn:
+        conn.execute("DELETE FROM ethics_case_index WHERE name = ?", (name,))
+        conn.executemany(
+            "INSERT OR REPLACE INTO ethics_case_index VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                _case_index_row(name, chunk_id, metadatas[i] if i < len(metadatas) else {})
+                for i, chunk_id in enumerate(ids)
+            ]
+        )
+
+
+def _get_cases_page(
+    collection: chromadb.Collection,
+    name: str,
+    limit: int,
+    offset: int,
+    confirmed_only: bool = False,
+    action: Optional[str] = None,
+    source_type: Optional[str] = None
+) -> List[Dict]:
+    """사이드카 인덱스로 created_at 내림차순 페이지의 ID를 구한 뒤 해당 항목만 Chroma에서 조회합니다."""
+    _ensure_case_index(collection, name)
+    
+    clauses = ["name = ?"]
+    params: list = [name]
+    if confirmed_only:
+        clauses.append("confirmed = 1")
+    if action:
+        clauses.append("admin_action = ?")
+        params.append(action)
+    if source_type:
+        clauses.append("source_type = ?")
+        params.append(source_type)
+    params.extend([limit, offset])
+    
+    page_ids = [
+        row[0] for row in _sidecar_connect().execute(
+            f"SELECT id FROM ethics_case_index WHERE {' AND '.join(clauses)} "
+            "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            params
+        )
+    ]
+    
+    if not page_ids:
+        return []
+    
+    raw = collection.get(ids=page_ids, include=["metadatas", "documents"])
+    ids = raw.get("ids") or []
+    metadatas = raw.get("metadatas") or []
+    documents = raw.get("documents") or []
+    
+    by_id = {
+        chunk_id: {
+            'id': chunk_id,
+            'document': documents[i] if i < len(documents) else '',
+            'metadata': metadatas[i] if i < len(metadatas) else {}
+        }
+        for i, chunk_id in enumerate(ids)
+    }
+    return [by_id[chunk_id] for chunk_id in page_ids if chunk_id in by_id]
+
+
+def _query_cache_key(embedding: List[float], generation: Optional[int], *params) -> Optional[tuple]:
+    """
+    임베딩을 차원별 int8로 양자화하여 거의 같은 질의가 같은 키를 갖도록 합니다.
+    컬렉션 세대 번호를 키에 넣어 다른 프로세스가 쓴 뒤에는 이전 결과를 쓰지 않습니다
+    (세대 번호를 알 수 없으면 None → 캐시를 사용하지 않음).
+    """
+    if generation is None:
+        return None
+    vec = np.asarray(embedding, dtype=np.float32)
+    max_abs = float(np.abs(vec).max()) if vec.size else 0.0
+    if max_abs > 0:
+        vec = vec / max_abs
+    quantized = np.round(vec * 127).astype(np.int8)
+    return (quantized.tobytes(), generation, *params)
+
+
+def clear_query_cache() -> None:
+    """유사 케이스 검색 캐시를 비웁니다 (컬렉션 변경 시 호출)."""
+    with _query_cache_lock:
+        _query_cache.clear()
+
+
+def get_query_cache_hit_rate() -> float:
+    """유사 케이스 검색 캐시 적중률 (0-1)"""
+    total = _query_cache_hits + _query_cache_misses
+    return _query_cache_hits / total if total else 0.0
+
+
+def _cache_get(cache_key: Optional[tuple]) -> Optional[List[Dict]]:
+    """캐시된 검색 결과의 사본을 반환합니다 (없으면 None)."""
+    global _query_cache_hits, _query_cache_misses
+    if cache_key is None:
+        return None
+    with _query_cache_lock:
+        cached = _query_cache.get(cache_key)
+        if cached is not None:
+            _query_cache.move_to_end(cache_key)
+            _query_cache_hits += 1
+            return [dict(item) for item in cached]
+        _query_cache_misses += 1
+        return None
+
+
+def _cache_put(cache_key: Optional[tuple], results: List[Dict]) -> None:
+    """검색 결과를 캐시에 저장하고, 크기를 넘으면 가장 오래된 항목을 제거합니다."""
+    if cache_key is None:
+        return
+    with _query_cache_lock:
+        _query_cache[cache_key] = [dict(item) for item in results]
+        if len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+
+
+def _build_matrix_index(collection: chromadb.Collection, generation: Optional[int]) -> Optional[Dict]:
+    """컬렉션 전체 임베딩을 연속된 float32 행렬로 적재합니다 (비어 있으면 None)."""
+    raw = collection.get(include=["embeddings", "metadatas"])
+    ids = list(raw.get("ids") or [])
+    embeddings = raw.get("embeddings")
+    if not ids or embeddings is None or len(embeddings) == 0:
+        return None
+    
+    matrix = np.ascontiguousarray(np.asarray(embeddings, dtype=np.float32))
+    metadatas = [meta or {} for meta in (raw.get("metadatas") or [{}] * len(ids))]
+    space = (collection.metadata or {}).get("hnsw:space", "l2")
+    return _matrix_index(ids, matrix, metadatas, space, generation)
+
+
+def _quantize_rows(matrix: np.ndarray) -> tuple:
+    """float32 행렬을 행별 스케일(max-abs / 127)의 int8 행렬로 양자화합니다."""
+    scale = np.abs(matrix).max(axis=1) / 127.0
+    scale[scale == 0] = 1.0
+    quantized = np.round(matrix / scale[:, None]).astype(np.int8)
+    return np.ascontiguousarray(quantized), scale.astype(np.float32)
+
+
+def _row_dots(matrix: np.ndarray, scale: Optional[np.ndarray], q: np.ndarray) -> np.ndarray:
+    """각 행과 q의 내적 (int8 행렬은 블록 단위로 역양자화하여 임시 메모리를 제한)"""
+    if scale is None:
+        return matrix @ q
+    out = np.empty(matrix.shape[0], dtype=np.float32)
+    for start in range(0, matrix.shape[0], _INT8_BLOCK_ROWS):
+        end = start + _INT8_BLOCK_ROWS
+        out[start:end] = (matrix[start:end].astype(np.float32) @ q) * scale[start:end]
+    return out
+
+
+def _row_sq_norms(matrix: np.ndarray, scale: Optional[np.ndarray]) -> np.ndarray:
+    """각 행의 제곱 노름"""
+    if scale is None:
+        return np.einsum("ij,ij->i", matrix, matrix)
+    out = np.empty(matrix.shape[0], dtype=np.float32)
+    for start in range(0, matrix.shape[0], _INT8_BLOCK_ROWS):
+        block = matrix[start:start + _INT8_BLOCK_ROWS].astype(np.float32)
+        out[start:start + _INT8_BLOCK_ROWS] = np.einsum("ij,ij->i", block, block)
+    return out * scale * scale
+
+
+def _matrix_capacity(rows: int) -> int:
+    """rows개를 담고 여유 행을 더한 행렬 크기"""
+    return rows + max(_MATRIX_SPARE_ROWS, rows // 8)
+
+
+def _matrix_index(
+    ids: List[str],
+    matrix: np.ndarray,
+    metadatas: List[Dict],
+    space: str,
+    generation: Optional[int],
+    scale: Optional[np.ndarray] = None
+) -> Dict:
     """
-    combined_text = f"{sentence.strip()}|{post_id}"
-    chunk_id = hashlib.sha256(combined_text.encode('utf-8')).hexdigest()
-    return chunk_id
+    행렬 검색에 필요한 보조 배열(노름, 신뢰도, id→행)을 계산합니다.
+    MATRIX_SEARCH_INT8이면 float32 행렬을 int8로 양자화하여 보관합니다.
+    이후 upsert를 복사 없이 덧붙일 수 있도록 여유 행을 미리 확보하며,
+    유효한 행은 앞쪽 size개입니다.
+    """
+    if MATRIX_SEARCH_INT8 and scale is None:
+        matrix, scale = _quantize_rows(matrix)
+    size = matrix.shape[0]
+    capacity = _matrix_capacity(size)
+    
+    buffer = np.zeros((capacity, matrix.shape[1]), dtype=matrix.dtype)
+    buffer[:size] = matrix
+    sq_norms = np.zeros(capacity, dtype=np.float32)
+    sq_norms[:size] = _row_sq_norms(matrix, scale)
+    # 빈 행/툼스톤 행은 신뢰도 -inf (어떤 min_confidence로도 후보가 되지 않음)
+    confidence = np.full(capacity, -np.inf, dtype=np.float32)
+    confidence[:size] = np.fromiter(
+        (meta.get("confidence") or 0.0 for meta in metadatas),
+        dtype=np.float32,
+        count=size
+    )
+    scale_buffer = None
+    if scale is not None:
+        scale_buffer = np.ones(capacity, dtype=np.float32)
+        scale_buffer[:size] = scale
+    
+    return {
+        "ids": list(ids),
+        "matrix": buffer,
+        "scale": scale_buffer,
+        "metadatas": list(metadatas),
+        "space": space,
+        "sq_norms": sq_norms,
+        "confidence": confidence,
+        "row_of": {chunk_id: i for i, chunk_id in enumerate(ids)},
+        "size": size,
+        "dead": 0,
+        "generation": generation,
+    }
+
+
+def _grow_matrix_index(index: Dict) -> Dict:
+    """여유 행이 다 찼을 때 더 큰 배열로 옮긴 새 인덱스를 만듭니다 (기존 인덱스는 읽기 스냅샷으로 유지)."""
+    size = index["size"]
+    capacity = _matrix_capacity(size)
+    grown = dict(index)
+    
+    matrix = np.zeros((capacity, index["matrix"].shape[1]), dtype=index["matrix"].dtype)
+    matrix[:size] = index["matrix"][:size]
+    grown["matrix"] = matrix
+    for key, fill in (("sq_norms", 0.0), ("confidence", -np.inf), ("scale", 1.0)):
+        if index[key] is None:
+            continue
+        arr = np.full(capacity, fill, dtype=np.float32)
+        arr[:size] = index[key][:size]
+        grown[key] = arr
+    return grown
+
+
+def _matrix_index_fresh(index: Optional[Dict], generation: Optional[int], count: int) -> bool:
+    """인덱스가 컬렉션의 현재 상태(세대 번호, 건수)와 일치하는지"""
+    if index is None:
+        return False
+    if index["size"] - index["dead"] != count:
+        return False
+    return generation is None or index["generation"] == generation
+
+
+def _get_matrix_index(
+    collection: chromadb.Collection,
+    name: str,
+    count: int,
+    generation: Optional[int]
+) -> Optional[Dict]:
+    """
+    캐시된 행렬 인덱스를 반환하고, 없거나 오래되었으면 다시 적재합니다.
+    다른 프로세스의 쓰기는 사이드카 세대 번호(generation)와 컬렉션 건수(count)로 감지합니다.
+    """
+    if count > MATRIX_SEARCH_MAX_ROWS:
+        _matrix_cache.pop(name, None)
+        return None
+    
+    index = _matrix_cache.get(name)
+    if _matrix_index_fresh(index, generation, count):
+        return index
+    with _matrix_lock:
+        index = _matrix_cache.get(name)
+        if not _matrix_index_fresh(index, generation, count):
+            index = _build_matrix_index(collection, generation)
+            _matrix_cache[name] = index
+        return index
+
+
+def _update_matrix_index(
+    name: str,
+    chunk_id: str,
+    embedding: Optional[List[float]],
+    meta: Optional[Dict],
+    generation: Optional[int]
+) -> None:
+    """
+    이 프로세스의 upsert/delete를 행렬 인덱스에 반영합니다 (embedding이 None이면 삭제).
+    기존 행은 신뢰도를 -inf로 바꿔 검색에서 빼고(툼스톤), 새 행은 여유 행에 덧붙입니다.
+    읽는 쪽은 검색 시작 시점의 size까지만 보므로 행렬 전체를 복사하지 않습니다.
+    다른 쓰기가 끼어들었거나(세대 번호 불일치) 툼스톤이 많아지면 인덱스를 버리고 다음 검색 때 다시 적재합니다.
+    
+    Args:
+        generation: 이 쓰기로 올린 세대 번호 (_bump_generation 반환값)
+    """
+    with _matrix_lock:
+        index = _matrix_cache.get(name)
+        if index is None:
+            return
+        if (
+            generation is None
+            or index["generation"] != generation - 1
+            or index["dead"] > index["size"] * _MATRIX_MAX_DEAD_RATIO
+        ):
+            _matrix_cache.pop(name, None)
+            return
+        
+        vec = None
+        if embedding is not None:
+            vec = np.asarray(embedding, dtype=np.float32)[None, :]
+            if vec.shape[1] != index["matrix"].shape[1]:
+                _matrix_cache.pop(name, None)
+                return
+        
+        row = index["row_of"].pop(chunk_id, None)
+        if row is not None:
+            index["confidence"][row] = -np.inf
+            index["dead"] += 1
+        
+        if vec is not None:
+            if index["size"] == index["matrix"].shape[0]:
+                index = _grow_matrix_index(index)
+                _matrix_cache[name] = index
+            size = index["size"]
+            vec_scale = None
+            if index["scale"] is not None:
+                vec, vec_scale = _quantize_rows(vec)
+                index["scale"][size] = vec_scale[0]
+            meta = meta or {}
+            index["matrix"][size] = vec[0]
+            index["sq_norms"][size] = _row_sq_norms(vec, vec_scale)[0]
+            index["confidence"][size] = meta.get("confidence") or 0.0
+            index["ids"].append(chunk_id)
+            index["metadatas"].append(meta)
+            index["row_of"][chunk_id] = size
+            # 행을 모두 채운 뒤 size를 올려야 읽는 쪽이 미완성 행을 보지 않음
+            index["size"] = size + 1
+        
+        index["generation"] = generation
+
+
+def _matrix_query(index: Dict, embedding: List[float], n_results: int, min_confidence: float) -> tuple:
+    """
+    Chroma query와 같은 거리 정의로 전수 검색합니다.
+    (l2: 제곱 유클리드 거리, cosine: 1 - 코사인 유사도, ip: 1 - 내적)
+    
+    Returns:
+        tuple: (ids, distances, metadatas) — 거리 오름차순
+    """
+    # 다른 스레드가 행을 덧붙이는 중일 수 있으므로 시작 시점의 size까지만 사용
+    size = index["size"]
+    scale = index["scale"]
+    q = np.asarray(embedding, dtype=np.float32)
+    dots = _row_dots(index["matrix"][:size], None if scale is None else scale[:size], q)
+    sq_norms = index["sq_norms"][:size]
+    space = index["space"]
+    if space == "cosine":
+        denom = np.sqrt(sq_norms) * float(np.linalg.norm(q))
+        distances = 1.0 - dots / np.maximum(denom, 1e-12)
+    elif space == "ip":
+        distances = 1.0 - dots
+    else:
+        distances = sq_norms - 2.0 * dots + float(q @ q)
+    
+    candidates = np.flatnonzero(index["confidence"][:size] >= min_confidence)
+    if candidates.size == 0:
+        return [], [], []
+    cand_dist = distances[candidates]
+    if candidates.size > n_results:
+        part = np.argpartition(cand_dist, n_results - 1)[:n_results]
+    else:
+        part = np.arange(candidates.size)
+    order = part[np.argsort(cand_dist[part])]
+    rows = candidates[order]
+    
+    return (
+        [index["ids"][i] for i in rows],
+        cand_dist[order].astype(float).tolist(),
+        [index["metadatas"][i] for i in rows],
+    )
+
+
+def _prepare_case(metadata: Dict) -> tuple:
+    """
+    upsert용 (chunk_id, sentence, 검증된 메타데이터)를 만듭니다.
+    
+    Raises:
+        ValueError: sentence가 없거나 숫자 필드를 float로 변환할 수 없을 때
+        TypeError: 숫자 필드가 숫자가 아닌 타입일 때
+    """
+    sentence = metadata.get("sentence", "")
+    if not sentence:
+        raise ValueError("메타데이터에 sentence가 필요합니다.")
+    
+    post_id = metadata.get("post_id", "")
+    chunk_id = build_chunk_id(sentence, post_id)
+    
+    # 메타데이터 검증 및 기본값 설정
+    validated_meta = {
+        "chunk_id": chunk_id,
+        "sentence": sentence,
+        "confirmed": bool(metadata.get("confirmed", False)),
+        "admin_id": str(metadata.get("admin_id", "")),
+    }
+    # 숫자 필드는 저장 시점에 한 번만 float로 변환 (조회 시 재변환 없이 그대로 사용)
+    # (numpy/Decimal 값도 float()로 변환 — 변환할 수 없는 값은 0.0으로 바꾸지 않고 예외)
+    for key in _FLOAT_META_KEYS:
+        validated_meta[key] = float(metadata.get(key, 0.0))
+    for key, default in _STR_META_DEFAULTS:
+        validated_meta[key] = metadata.get(key, default)
+    
+    # created_at이 없을 때만 현재 시각 생성
+    created_at = metadata.get("created_at")
+    validated_meta["created_at"] = created_at if created_at is not None else datetime.now().isoformat()
+    
+    return chunk_id, sentence, validated_meta
+
+
+def _format_results(ids: List[str], distances: List[float], metadatas: List[Dict], min_score: float) -> List[Dict]:
+    """query 결과를 검색 결과 항목으로 변환하고 min_score 미만을 제외합니다."""
+    formatted_results = []
+    
+    for i, chunk_id in enumerate(ids):
+        # ChromaDB는 거리(distance)를 반환하므로 유사도 점수로 변환
+        distance = distances[i] if i < len(distances) else 1.0
+        similarity_score = 1.0 - distance  # 유사도 점수로 변환
+        
+        # 최소 점수 필터링
+        if similarity_score < min_score:
+            continue
+        
+        metadata = metadatas[i] if i < len(metadatas) else {}
+        
+        formatted_results.append({
+            "id": chunk_id,
+            "score": similarity_score,
+            "metadata": metadata,
+            "document": metadata.get("sentence", ""),
+            "confirmed": metadata.get("confirmed") is True,
+            "confidence": metadata.get("confidence") or 0.0
+        })
+    
+    return formatted_results
+
+
+def _fill_documents(formatted_results: List[Dict], docs: Dict) -> None:
+    """collection.get(include=["documents"]) 결과로 비어 있는 document를 채웁니다."""
+    doc_map = dict(zip(docs.get("ids") or [], docs.get("documents") or []))
+    for item in formatted_results:
+        if not item["document"]:
+            item["document"] = doc_map.get(item["id"]) or ""
+
+
+def _rank_results(formatted_results: List[Dict], top_k: int, prefer_confirmed: bool) -> List[Dict]:
+    """정렬 후 상위 top_k개를 반환합니다."""
+    # 관리자 확인된 케이스 우선 정렬
+    if prefer_confirmed:
+        formatted_results.sort(
+            key=lambda x: (x["confirmed"], x["score"]),
+            reverse=True
+        )
+    else:
+        # 유사도 점수 내림차순으로 정렬
+        formatted_results.sort(key=lambda x: x["score"], reverse=True)
+    
+    # 상위 top_k개만 반환
+    return formatted_results[:top_k]
+
+
+def _finish_results(
+    collection: chromadb.Collection,
+    ids: List[str],
+    distances: List[float],
+    metadatas: List[Dict],
+    min_score: float,
+    top_k: int,
+    prefer_confirmed: bool
+) -> List[Dict]:
+    """query 결과 한 건 → 포맷팅/필터링, 빠진 document 보충, 정렬 후 상위 top_k"""
+    formatted_results = _format_results(ids, distances, metadatas, min_score)
+    
+    # 메타데이터에 문장이 없는 항목만 document를 별도로 조회
+    missing_ids = [item["id"] for item in formatted_results if not item["document"]]
+    if missing_ids:
+        _fill_documents(formatted_results, collection.get(ids=missing_ids, include=["documents"]))
+    
+    return _rank_results(formatted_results, top_k, prefer_confirmed)
 
 
 def upsert_confirmed_case(
@@ -113,34 +1058,11 @@ def upsert_confirmed_case(
         collection_name (str): 컬렉션 이름
     """
     collection = get_collection(client, collection_name)
+    chunk_id, sentence, validated_meta = _prepare_case(metadata)
     
-    sentence = metadata.get("sentence", "")
-    if not sentence:
-        raise ValueError("메타데이터에 sentence가 필요합니다.")
-    
-    post_id = metadata.get("post_id", "")
-    chunk_id = build_chunk_id(sentence, post_id)
-    
-    # 메타데이터 검증 및 기본값 설정
-    validated_meta = {
-        "chunk_id": chunk_id,
-        "sentence": sentence,
-        "immoral_score": float(metadata.get("immoral_score", 0.0)),
-        "spam_score": float(metadata.get("spam_score", 0.0)),
-        "immoral_confidence": float(metadata.get("immoral_confidence", 0.0)),
-        "spam_confidence": float(metadata.get("spam_confidence", 0.0)),
-        "confidence": float(metadata.get("confidence", 0.0)),
-        "confirmed": bool(metadata.get("confirmed", False)),
-        "post_id": metadata.get("post_id", ""),
-        "user_id": metadata.get("user_id", ""),
-        "created_at": metadata.get("created_at", datetime.now().isoformat()),
-        "feedback_type": metadata.get("feedback_type", "auto_saved"),
-        "admin_id": str(metadata.get("admin_id", "")),
-        "admin_action": metadata.get("admin_action", ""),
-        "original_immoral_score": float(metadata.get("original_immoral_score", 0.0)),
-        "original_spam_score": float(metadata.get("original_spam_score", 0.0)),
-        "note": metadata.get("note", "")
-    }
+    # 기존 항목의 메타데이터 (통계 누적값 보정용)
+    existing = collection.get(ids=[chunk_id], include=["metadatas"])
+    old_meta = existing["metadatas"][0] if existing and existing.get("metadatas") else None
     
     # ChromaDB에 upsert (동일 ID면 업데이트, 없으면 추가)
     collection.upsert(
@@ -149,6 +1071,86 @@ def upsert_confirmed_case(
         metadatas=[validated_meta],
         documents=[sentence]  # 문장을 document로 저장
     )
+    
+    _apply_stats_delta(collection_name, old_meta, validated_meta)
+    _index_case(collection_name, chunk_id, validated_meta)
+    generation = _bump_generation(collection_name)
+    _update_matrix_index(collection_name, chunk_id, embedding, validated_meta, generation)
+    clear_query_cache()
+
+
+def bulk_upsert_confirmed_cases(
+    client: chromadb.ClientAPI,
+    embeddings: List[List[float]],
+    metadatas: List[Dict],
+    collection_name: str = COLLECTION_NAME,
+    batch_size: int = 250
+) -> int:
+    """
+    여러 케이스를 batch_size 단위의 upsert 호출로 저장합니다.
+    건별 upsert_confirmed_case 반복보다 트랜잭션 수가 적어 대량 적재에 사용합니다.
+    
+    Args:
+        client (chromadb.ClientAPI): ChromaDB 클라이언트
+        embeddings (List[List[float]]): 임베딩 벡터 목록
+        metadatas (List[Dict]): 메타데이터 목록 (필드는 upsert_confirmed_case와 동일)
+        collection_name (str): 컬렉션 이름
+        batch_size (int): 한 번의 upsert에 담을 최대 건수
+        
+    Returns:
+        int: 저장된 케이스 수 (같은 ID가 중복되면 마지막 항목만 저장)
+        
+    Raises:
+        ValueError: embeddings와 metadatas 길이가 다르거나 sentence가 없을 때
+    """
+    if len(embeddings) != len(metadatas):
+        raise ValueError("embeddings와 metadatas의 길이가 같아야 합니다.")
+    
+    collection = get_collection(client, collection_name)
+    
+    # 같은 chunk_id가 여러 번 나오면 마지막 항목 기준 (upsert는 배치 내 중복 ID를 허용하지 않음)
+    cases = {}
+    for embedding, metadata in zip(embeddings, metadatas):
+        chunk_id, sentence, validated_meta = _prepare_case(metadata)
+        cases.pop(chunk_id, None)
+        cases[chunk_id] = (embedding, sentence, validated_meta)
+    
+    items = list(cases.items())
+    saved = 0
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        ids = [chunk_id for chunk_id, _ in batch]
+        
+        # 기존 항목의 메타데이터 (통계 누적값 보정용)
+        existing = collection.get(ids=ids, include=["metadatas"])
+        old_metas = dict(zip(existing.get("ids") or [], existing.get("metadatas") or []))
+        
+        collection.upsert(
+            ids=ids,
+            embeddings=[case[0] for _, case in batch],
+            metadatas=[case[2] for _, case in batch],
+            documents=[case[1] for _, case in batch]
+        )
+        
+        delta = [0, 0, 0.0, 0.0, 0.0]
+        for chunk_id, (_, _, meta) in batch:
+            new = _stats_values(meta)
+            old = _stats_values(old_metas.get(chunk_id))
+            for k in range(5):
+                delta[k] += new[k] - old[k]
+        _add_stats(collection_name, tuple(delta))
+        _index_cases(collection_name, [
+            _case_index_row(collection_name, chunk_id, meta) for chunk_id, (_, _, meta) in batch
+        ])
+        saved += len(batch)
+    
+    # 행렬 인덱스는 다음 검색 시 한 번에 다시 적재
+    _bump_generation(collection_name)
+    with _matrix_lock:
+        _matrix_cache.pop(collection_name, None)
+    clear_query_cache()
+    
+    return saved
 
 
 def search_similar_cases(
@@ -179,6 +1181,14 @@ def search_similar_cases(
             - metadata: 저장된 메타데이터
             - document: 문장 내용
     """
+    generation = _read_generation(collection_name)
+    cache_key = _query_cache_key(
+        embedding, generation, top_k, min_score, min_confidence, prefer_confirmed, collection_name
+    )
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     collection = get_collection(client, collection_name)
     
     # 컬렉션이 비어있는지 확인
@@ -186,62 +1196,105 @@ def search_similar_cases(
     if count == 0:
         return []
     
-    # 유사도 검색 수행 (더 많이 검색하여 필터링)
-    search_k = min(top_k * 3, count)  # 필터링을 위해 더 많이 검색
+    # 신뢰도 필터는 Chroma where 절로 전달하고, 확인 케이스 재정렬용으로만 약간 더 검색
+    search_k = min(top_k + 5 if prefer_confirmed else top_k, count)
     
-    results = collection.query(
-        query_embeddings=[embedding],
-        n_results=search_k,
-        include=["metadatas", "documents", "distances"]
-    )
+    index = _get_matrix_index(collection, collection_name, count, generation)
+    if index is not None:
+        # 소규모 컬렉션: 메모리 행렬로 전수 검색 (Chroma 왕복 없음)
+        ids, distances, metadatas = _matrix_query(index, embedding, search_k, float(min_confidence))
+    else:
+        results = collection.query(
+            query_embeddings=[embedding],
+            n_results=search_k,
+            where={"confidence": {"$gte": float(min_confidence)}},
+            include=["metadatas", "distances"]
+        )
+        has_ids = bool(results["ids"]) and len(results["ids"]) > 0
+        ids = results["ids"][0] if has_ids else []
+        distances = results["distances"][0] if has_ids and results["distances"] else []
+        metadatas = results["metadatas"][0] if has_ids and results["metadatas"] else []
     
-    # 결과 포맷팅 및 필터링
-    formatted_results = []
+    top_results = _finish_results(
+        collection, ids, distances, metadatas, min_score, top_k, prefer_confirmed
+    )
+    _cache_put(cache_key, top_results)
+    return top_results
+
+
+def search_similar_cases_batch(
+    client: chromadb.ClientAPI,
+    embeddings: List[List[float]],
+    top_k: int = 5,
+    min_score: float = 0.5,
+    min_confidence: float = 80.0,
+    prefer_confirmed: bool = True,
+    collection_name: str = COLLECTION_NAME
+) -> List[List[Dict]]:
+    """
+    여러 임베딩을 한 번의 query 호출로 검색합니다 (search_similar_cases의 배치 버전).
     
-    if results["ids"] and len(results["ids"]) > 0:
-        ids = results["ids"][0]
-        distances = results["distances"][0] if results["distances"] else []
-        metadatas = results["metadatas"][0] if results["metadatas"] else []
-        documents = results["documents"][0] if results["documents"] else []
+    Args:
+        embeddings (List[List[float]]): 검색할 임베딩 벡터 목록
+        나머지 인자는 search_similar_cases와 동일
         
-        for i, chunk_id in enumerate(ids):
-            # ChromaDB는 거리(distance)를 반환하므로 유사도 점수로 변환
-            distance = distances[i] if i < len(distances) else 1.0
-            similarity_score = 1.0 - distance  # 유사도 점수로 변환
-            
-            # 최소 점수 필터링
-            if similarity_score < min_score:
-                continue
-            
-            metadata = metadatas[i] if i < len(metadatas) else {}
-            confidence = float(metadata.get("confidence", 0.0))
-            
-            # 최소 신뢰도 필터링
-            if confidence < min_confidence:
-                continue
-            
-            result_item = {
-                "id": chunk_id,
-                "score": similarity_score,
-                "metadata": metadata,
-                "document": documents[i] if i < len(documents) else "",
-                "confirmed": bool(metadata.get("confirmed", False)),
-                "confidence": confidence
-            }
-            formatted_results.append(result_item)
-    
-    # 관리자 확인된 케이스 우선 정렬
-    if prefer_confirmed:
-        formatted_results.sort(
-            key=lambda x: (x["confirmed"], x["score"]),
-            reverse=True
+    Returns:
+        List[List[Dict]]: embeddings와 같은 순서의 검색 결과 목록
+    """
+    results_per_query: List[Optional[List[Dict]]] = [None] * len(embeddings)
+    cache_keys = []
+    pending = []
+    generation = _read_generation(collection_name)
+    for i, embedding in enumerate(embeddings):
+        cache_key = _query_cache_key(
+            embedding, generation, top_k, min_score, min_confidence, prefer_confirmed, collection_name
         )
+        cache_keys.append(cache_key)
+        results_per_query[i] = _cache_get(cache_key)
+        if results_per_query[i] is None:
+            pending.append(i)
+    if not pending:
+        return results_per_query
+    
+    collection = get_collection(client, collection_name)
+    count = collection.count()
+    if count == 0:
+        for i in pending:
+            results_per_query[i] = []
+        return results_per_query
+    
+    search_k = min(top_k + 5 if prefer_confirmed else top_k, count)
+    
+    index = _get_matrix_index(collection, collection_name, count, generation)
+    if index is not None:
+        raw = [_matrix_query(index, embeddings[i], search_k, float(min_confidence)) for i in pending]
     else:
-        # 유사도 점수 내림차순으로 정렬
-        formatted_results.sort(key=lambda x: x["score"], reverse=True)
+        results = collection.query(
+            query_embeddings=[embeddings[i] for i in pending],
+            n_results=search_k,
+            where={"confidence": {"$gte": float(min_confidence)}},
+            include=["metadatas", "distances"]
+        )
+        all_ids = results["ids"] or []
+        all_distances = results["distances"] or []
+        all_metadatas = results["metadatas"] or []
+        raw = [
+            (
+                all_ids[n] if n < len(all_ids) else [],
+                all_distances[n] if n < len(all_distances) else [],
+                all_metadatas[n] if n < len(all_metadatas) else [],
+            )
+            for n in range(len(pending))
+        ]
     
-    # 상위 top_k개만 반환
-    return formatted_results[:top_k]
+    for i, (ids, distances, metadatas) in zip(pending, raw):
+        top_results = _finish_results(
+            collection, ids, distances, metadatas, min_score, top_k, prefer_confirmed
+        )
+        _cache_put(cache_keys[i], top_results)
+        results_per_query[i] = top_results
+    
+    return results_per_query
 
 
 def get_collection_stats(
@@ -269,42 +1322,24 @@ def get_collection_stats(
         stats = {
             "collection_name": collection_name,
             "total_documents": count,
-            "status": "active" if count > 0 else "empty"
+            "status": "active" if count > 0 else "empty",
+            "cache_hit_rate": get_query_cache_hit_rate()
         }
         
-        # 추가 통계 계산
+        # 추가 통계 계산 (사이드카 누적값 사용, 없거나 불일치하면 전체 스캔으로 재구성)
         if count > 0:
-            all_data = collection.get(include=['metadatas'])
-            metadatas = all_data.get('metadatas', [])
+            row = _read_stats(collection_name)
+            if row is None or row[0] != count:
+                row = _rebuild_stats(collection, collection_name)
             
-            if metadatas:
-                # 관리자 확인된 케이스 수
-                confirmed_count = sum(
-                    1 for meta in metadatas 
-                    if bool(meta.get('confirmed', False))
-                )
-                
-                # 평균 점수 계산
-                immoral_scores = [
-                    float(meta.get('immoral_score', 0)) 
-                    for meta in metadatas
-                ]
-                spam_scores = [
-                    float(meta.get('spam_score', 0)) 
-                    for meta in metadatas
-                ]
-                confidences = [
-                    float(meta.get('confidence', 0)) 
-                    for meta in metadatas
-                ]
-                
-                stats.update({
-                    "confirmed_count": confirmed_count,
-                    "unconfirmed_count": count - confirmed_count,
-                    "avg_immoral_score": sum(immoral_scores) / len(immoral_scores) if immoral_scores else 0.0,
-                    "avg_spam_score": sum(spam_scores) / len(spam_scores) if spam_scores else 0.0,
-                    "avg_confidence": sum(confidences) / len(confidences) if confidences else 0.0
-                })
+            _, confirmed_count, sum_immoral, sum_spam, sum_conf = row
+            stats.update({
+                "confirmed_count": confirmed_count,
+                "unconfirmed_count": count - confirmed_count,
+                "avg_immoral_score": sum_immoral / count,
+                "avg_spam_score": sum_spam / count,
+                "avg_confidence": sum_conf / count
+            })
         
         return stats
         
@@ -338,9 +1373,19 @@ def delete_case(
     """
     try:
         collection = get_collection(client, collection_name)
+        existing = collection.get(ids=[chunk_id], include=["metadatas"])
+        old_meta = existing["metadatas"][0] if existing and existing.get("metadatas") else None
+        
         collection.delete(ids=[chunk_id])
+        _apply_stats_delta(collection_name, old_meta, None)
+        _index_case(collection_name, chunk_id, None)
+        generation = _bump_generation(collection_name)
+        _update_matrix_index(collection_name, chunk_id, None, None, generation)
+        clear_query_cache()
         return True
     except Exception:
+        # 컬렉션이 외부에서 재생성되었을 수 있으므로 캐시된 핸들 폐기
+        _collection_cache.pop(collection_name, None)
         return False
 
 
@@ -365,38 +1410,8 @@ def get_all_cases(
     try:
         collection = get_collection(client, collection_name)
         
-        # 모든 데이터 가져오기
-        raw = collection.get(
-            include=["metadatas", "documents"]
-        )
-        
-        if not raw or not raw.get('ids'):
-            return []
-        
-        # 결과 조합
-        cases = []
-        ids = raw['ids']
-        metadatas = raw.get('metadatas', [])
-        documents = raw.get('documents', [])
-        
-        for i, chunk_id in enumerate(ids):
-            metadata = metadatas[i] if i < len(metadatas) else {}
-            document = documents[i] if i < len(documents) else ''
-            
-            cases.append({
-                'id': chunk_id,
-                'document': document,
-                'metadata': metadata
-            })
-        
-        # created_at 기준 정렬 (최신순)
-        cases.sort(
-            key=lambda x: x.get('metadata', {}).get('created_at', ''),
-            reverse=True
-        )
-        
-        # offset과 limit 적용
-        return cases[offset:offset + limit]
+        # created_at 기준 최신순 페이지만 조회
+        return _get_cases_page(collection, collection_name, limit, offset)
         
     except Exception as e:
         print(f"[ERROR] 전체 사례 조회 실패: {e}")
@@ -428,51 +1443,122 @@ def get_recent_confirmed_cases(
     try:
         collection = get_collection(client, collection_name)
         
-        # 모든 데이터 가져오기 (ChromaDB는 offset을 직접 지원하지 않음)
-        raw = collection.get(
-            include=["metadatas", "documents"]
+        # confirmed=True + action/source_type 필터, created_at 기준 최신순 페이지만 조회
+        return _get_cases_page(
+            collection,
+            collection_name,
+            limit,
+            offset,
+            confirmed_only=True,
+            action=action,
+            source_type=source_type
         )
         
-        if not raw or not raw.get('ids'):
-            return []
-        
-        # 결과 조합
-        cases = []
-        ids = raw['ids']
-        metadatas = raw.get('metadatas', [])
-        documents = raw.get('documents', [])
-        
-        for i, chunk_id in enumerate(ids):
-            metadata = metadatas[i] if i < len(metadatas) else {}
-            document = documents[i] if i < len(documents) else ''
-            
-            # confirmed=True인 것만 필터링
-            if not metadata.get('confirmed'):
-                continue
-            
-            # action 필터링
-            if action and metadata.get('admin_action') != action:
-                continue
-            
-            # source_type 필터링
-            if source_type and metadata.get('source_type') != source_type:
-                continue
-            
-            cases.append({
-                'id': chunk_id,
-                'document': document,
-                'metadata': metadata
-            })
-        
-        # created_at 기준 정렬 (최신순)
-        cases.sort(
-            key=lambda x: x.get('metadata', {}).get('created_at', ''),
-            reverse=True
-        )
-        
-        # offset과 limit 적용
-        return cases[offset:offset + limit]
-        
     except Exception as e:
         print(f"[ERROR] confirmed 사례 조회 실패: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+async def get_async_client():
+    """
+    서버 모드 ChromaDB 비동기 HTTP 클라이언트 싱글톤을 반환합니다.
+    (chromadb 0.5+ 의 AsyncHttpClient, CHROMA_HOST/CHROMA_PORT 환경변수 사용)
+    
+    Returns:
+        chromadb.AsyncClientAPI: 비동기 클라이언트 인스턴스
+    """
+    global _async_client_instance
+    if _async_client_instance is None:
+        if not hasattr(chromadb, "AsyncHttpClient"):
+            raise RuntimeError("설치된 chromadb 버전이 AsyncHttpClient를 지원하지 않습니다 (0.5 이상 필요)")
+        _async_client_instance = await chromadb.AsyncHttpClient(
+            host=CHROMA_HOST,
+            port=CHROMA_PORT,
+            settings=Settings(anonymized_telemetry=False)
+        )
+    return _async_client_instance
+
+
+async def _get_async_collection(client, name: str = COLLECTION_NAME):
+    """비동기 클라이언트의 컬렉션 핸들 (생성 또는 캐시 반환)"""
+    collection = _async_collection_cache.get(name)
+    if collection is None:
+        collection = await client.get_or_create_collection(
+            name=name,
+            metadata=COLLECTION_METADATA
+        )
+        _async_collection_cache[name] = collection
+    return collection
+
+
+async def upsert_confirmed_case_async(
+    client,
+    embedding: List[float],
+    metadata: Dict,
+    collection_name: str = COLLECTION_NAME
+) -> None:
+    """
+    upsert_confirmed_case의 비동기 버전 (서버 모드 Chroma 전용).
+    요청 핸들러가 SQLite 쓰기를 기다리며 블로킹되지 않습니다.
+    통계/인덱스 사이드카와 행렬 인덱스는 로컬 저장소 전용이므로 갱신하지 않습니다.
+    
+    Args:
+        client: get_async_client()로 얻은 비동기 클라이언트
+        embedding (List[float]): 문장의 임베딩 벡터
+        metadata (Dict): 메타데이터 (upsert_confirmed_case와 동일)
+        collection_name (str): 컬렉션 이름
+    """
+    collection = await _get_async_collection(client, collection_name)
+    chunk_id, sentence, validated_meta = _prepare_case(metadata)
+    
+    await collection.upsert(
+        ids=[chunk_id],
+        embeddings=[embedding],
+        metadatas=[validated_meta],
+        documents=[sentence]
+    )
+    clear_query_cache()
+
+
+async def search_similar_cases_async(
+    client,
+    embedding: List[float],
+    top_k: int = 5,
+    min_score: float = 0.5,
+    min_confidence: float = 80.0,
+    prefer_confirmed: bool = True,
+    collection_name: str = COLLECTION_NAME
+) -> List[Dict]:
+    """
+    search_similar_cases의 비동기 버전 (서버 모드 Chroma 전용).
+    
+    Args:
+        client: get_async_client()로 얻은 비동기 클라이언트
+        나머지 인자와 반환값은 search_similar_cases와 동일
+    """
+    collection = await _get_async_collection(client, collection_name)
+    
+    count = await collection.count()
+    if count == 0:
+        return []
+    
+    search_k = min(top_k + 5 if prefer_confirmed else top_k, count)
+    results = await collection.query(
+        query_embeddings=[embedding],
+        n_results=search_k,
+        where={"confidence": {"$gte": float(min_confidence)}},
+        include=["metadatas", "distances"]
+    )
+    has_ids = bool(results["ids"]) and len(results["ids"]) > 0
+    formatted_results = _format_results(
+        results["ids"][0] if has_ids else [],
+        results["distances"][0] if has_ids and results["distances"] else [],
+        results["metadatas"][0] if has_ids and results["metadatas"] else [],
+        min_score
+    )
+    
+    missing_ids = [item["id"] for item in formatted_results if not item["document"]]
+    if missing_ids:
+        _fill_documents(formatted_results, await collection.get(ids=missing_ids, include=["documents"]))
+    
+    return _rank_results(formatted_results, top_k, prefer_confirmed)
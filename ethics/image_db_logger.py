@@ -2,8 +2,158 @@
 이미지 분석 결과 데이터베이스 로거
 """
 import json
+import queue
+import threading
+import time
 from typing import Dict, Optional, List
-from app.database import execute_query
+import pymysql
+from app.database import execute_query, get_db_connection
+
+
+# image_analysis_logs INSERT 컬럼 (순서 = _build_log_row 반환 순서)
+# SQL은 모듈 로드 시 한 번만 만들어 단건/일괄 저장에서 같은 문자열을 재사용
+_IMAGE_LOG_COLUMNS = (
+    "filename", "original_name", "file_size", "board_id",
+    "nsfw_checked", "is_nsfw", "nsfw_confidence",
+    "vision_checked", "immoral_score", "spam_score", "vision_confidence",
+    "detected_types", "has_text", "extracted_text",
+    "is_blocked", "block_reason",
+    "ip_address", "user_agent", "response_time",
+)
+_INSERT_IMAGE_LOG_SQL = (
+    f"INSERT INTO image_analysis_logs ({', '.join(_IMAGE_LOG_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(_IMAGE_LOG_COLUMNS))})"
+)
+
+# 큐 기반 일괄 저장 (log_id가 필요 없는 호출자용)
+_LOG_BATCH_SIZE = 500
+_LOG_FLUSH_INTERVAL = 0.1  # 초
+_LOG_QUEUE_SIZE = _LOG_BATCH_SIZE * 4
+_LOG_RETRY_ATTEMPTS = 3  # 연결 오류 시 같은 배치 재시도 횟수
+_LOG_RETRY_DELAY = 0.5  # 초 (시도마다 배수로 증가)
+_log_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+# 저장하지 못하고 버린 로그 수 (큐 초과 + 저장 실패)
+_dropped_logs = 0
+_dropped_lock = threading.Lock()
+
+
+def _build_log_row(
+    filename: str,
+    original_name: str,
+    file_size: int,
+    board_id: Optional[int] = None,
+    nsfw_result: Optional[Dict] = None,
+    vision_result: Optional[Dict] = None,
+    is_blocked: bool = False,
+    block_reason: str = "",
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    response_time: float = 0.0
+) -> tuple:
+    """분석 결과를 image_analysis_logs INSERT 파라미터 튜플로 변환"""
+    # NSFW 결과 파싱
+    nsfw_checked = bool(nsfw_result) if nsfw_result else False
+    is_nsfw = nsfw_result.get('is_nsfw', False) if nsfw_result else False
+    nsfw_confidence = nsfw_result.get('confidence', 0) if nsfw_result else None
+    
+    # Vision 결과 파싱
+    vision_checked = bool(vision_result) if vision_result else False
+    immoral_score = vision_result.get('immoral_score', 0) if vision_result else None
+    spam_score = vision_result.get('spam_score', 0) if vision_result else None
+    vision_confidence = vision_result.get('confidence', 0) if vision_result else None
+    detected_types = json.dumps(vision_result.get('types', [])) if vision_result else None
+    has_text = vision_result.get('has_text', False) if vision_result else False
+    extracted_text = vision_result.get('extracted_text', '') if vision_result else None
+    
+    return (
+        filename, original_name, file_size, board_id,
+        nsfw_checked, is_nsfw, nsfw_confidence,
+        vision_checked, immoral_score, spam_score, vision_confidence,
+        detected_types, has_text, extracted_text,
+        is_blocked, block_reason,
+        ip_address, user_agent, response_time
+    )
+
+
+def _insert_rows(rows: List[tuple]) -> None:
+    """여러 로그를 한 번의 다중 행 INSERT로 저장 (PyMySQL executemany)"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany(_INSERT_IMAGE_LOG_SQL, rows)
+
+
+def _count_dropped(count: int, reason: str) -> None:
+    """버린 로그 수 누적 (큐 초과는 부하 중에 연달아 나므로 100건마다 한 번만 출력)"""
+    global _dropped_logs
+    with _dropped_lock:
+        before = _dropped_logs
+        _dropped_logs += count
+        total = _dropped_logs
+    if reason != "큐 초과" or before // 100 != total // 100 or before == 0:
+        print(f"[WARN] 이미지 분석 로그 {count}건 버림 ({reason}, 누적 {total}건)")
+
+
+def _write_batch(rows: List[tuple]) -> None:
+    """
+    로그 배치 저장
+    - 연결 오류(OperationalError/InterfaceError): 잠시 후 같은 배치를 재시도, 끝내 실패하면 배치를 버림
+    - 그 밖의 오류(데이터 오류 등): 배치를 반으로 나눠 저장 — 문제 행만 버리고 나머지는 저장
+    """
+    for attempt in range(1, _LOG_RETRY_ATTEMPTS + 1):
+        try:
+            _insert_rows(rows)
+            return
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError) as e:
+            if attempt == _LOG_RETRY_ATTEMPTS:
+                print(f"[ERROR] 이미지 분석 로그 일괄 저장 실패 ({len(rows)}건): {e}")
+                _count_dropped(len(rows), "DB 연결 실패")
+                return
+            time.sleep(_LOG_RETRY_DELAY * attempt)
+        except Exception as e:
+            if len(rows) == 1:
+                print(f"[ERROR] 이미지 분석 로그 저장 실패: {e}")
+                _count_dropped(1, "저장 실패")
+                return
+            break
+    
+    mid = len(rows) // 2
+    _write_batch(rows[:mid])
+    _write_batch(rows[mid:])
+
+
+def _writer_loop() -> None:
+    """큐에 쌓인 로그를 최대 _LOG_BATCH_SIZE개씩 모아 저장하는 백그라운드 루프"""
+    while True:
+        batch = [_log_queue.get()]
+        while len(batch) < _LOG_BATCH_SIZE:
+            try:
+                batch.append(_log_queue.get(timeout=_LOG_FLUSH_INTERVAL))
+            except queue.Empty:
+                break
+        
+        try:
+            _write_batch(batch)
+        finally:
+            for _ in batch:
+                _log_queue.task_done()
+
+
+def _ensure_writer() -> None:
+    """백그라운드 저장 스레드를 (최초 1회) 시작"""
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop,
+                name="image-log-writer",
+                daemon=True
+            )
+            _writer_thread.start()
 
 
 class ImageAnalysisLogger:
@@ -43,45 +193,14 @@ class ImageAnalysisLogger:
             생성된 로그 ID
         """
         try:
-            # NSFW 결과 파싱
-            nsfw_checked = bool(nsfw_result) if nsfw_result else False
-            is_nsfw = nsfw_result.get('is_nsfw', False) if nsfw_result else False
-            nsfw_confidence = nsfw_result.get('confidence', 0) if nsfw_result else None
-            
-            # Vision 결과 파싱
-            vision_checked = bool(vision_result) if vision_result else False
-            immoral_score = vision_result.get('immoral_score', 0) if vision_result else None
-            spam_score = vision_result.get('spam_score', 0) if vision_result else None
-            vision_confidence = vision_result.get('confidence', 0) if vision_result else None
-            detected_types = json.dumps(vision_result.get('types', [])) if vision_result else None
-            has_text = vision_result.get('has_text', False) if vision_result else False
-            extracted_text = vision_result.get('extracted_text', '') if vision_result else None
-            
-            # 데이터베이스에 저장 (reasoning 필드 제거됨)
-            log_id = execute_query("""
-                INSERT INTO image_analysis_logs (
-                    filename, original_name, file_size, board_id,
-                    nsfw_checked, is_nsfw, nsfw_confidence,
-                    vision_checked, immoral_score, spam_score, vision_confidence,
-                    detected_types, has_text, extracted_text,
-                    is_blocked, block_reason,
-                    ip_address, user_agent, response_time
-                ) VALUES (
-                    %s, %s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s,
-                    %s, %s, %s
-                )
-            """, (
+            row = _build_log_row(
                 filename, original_name, file_size, board_id,
-                nsfw_checked, is_nsfw, nsfw_confidence,
-                vision_checked, immoral_score, spam_score, vision_confidence,
-                detected_types, has_text, extracted_text,
-                is_blocked, block_reason,
+                nsfw_result, vision_result, is_blocked, block_reason,
                 ip_address, user_agent, response_time
-            ))
+            )
+            
+            # 데이터베이스에 저장 (reasoning 필드 제거됨)
+            log_id = execute_query(_INSERT_IMAGE_LOG_SQL, row)
             
             return log_id
             
@@ -89,6 +208,43 @@ class ImageAnalysisLogger:
             print(f"[ERROR] 이미지 분석 로그 저장 실패: {e}")
             return 0
     
+    @staticmethod
+    def enqueue_analysis(**kwargs) -> bool:
+        """
+        이미지 분석 결과를 큐에 넣고 백그라운드에서 일괄 저장 (log_id 미반환)
+        log_id가 필요한 호출자는 log_analysis()를 사용하세요.
+        
+        Args:
+            log_analysis()와 동일한 키워드 인자
+            
+        Returns:
+            큐 적재 여부 (큐가 가득 차면 이벤트 루프를 막지 않도록 저장하지 않고 버린 뒤 False)
+        """
+        try:
+            row = _build_log_row(**kwargs)
+        except Exception as e:
+            print(f"[ERROR] 이미지 분석 로그 변환 실패: {e}")
+            return False
+        
+        _ensure_writer()
+        try:
+            _log_queue.put_nowait(row)
+            return True
+        except queue.Full:
+            _count_dropped(1, "큐 초과")
+            return False
+    
+    @staticmethod
+    def flush_logs() -> None:
+        """큐에 남은 로그가 모두 저장될 때까지 대기 (서버 종료 시 호출)"""
+        if _writer_thread is not None and _writer_thread.is_alive():
+            _log_queue.join()
+    
+    @staticmethod
+    def dropped_count() -> int:
+        """큐 초과/저장 실패로 버린 로그 수 (프로세스 시작 이후 누적)"""
+        return _dropped_logs
+    
     @staticmethod
     def get_blocked_images(limit: int = 100) -> List[Dict]:
         """
@@ -3,7 +3,16 @@ Ethics 모델 자동 다운로드 유틸리티
 Google Drive에서 binary_classifier.pth 모델 파일을 자동으로 다운로드합니다.
 """
 import os
+import hashlib
+import mmap
 from pathlib import Path
+from typing import Optional
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
 
 try:
     import gdown
@@ -14,70 +23,237 @@ except ImportError:
     print("[INFO] 설치 방법: pip install gdown")
 
 
-def download_file_from_google_drive(file_id: str, destination: str) -> bool:
+# 바이러스 검사 확인 페이지를 건너뛰는 Google Drive 직접 다운로드 엔드포인트
+GDRIVE_DOWNLOAD_URL = "https://drive.usercontent.google.com/download"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+MIN_MODEL_SIZE = 100 * 1024 * 1024  # 최소 100MB 이상이어야 정상 (원본 415MB)
+
+# 모델 파일의 SHA-256 (배포 환경에서 ETHICS_MODEL_SHA256로 고정, 비어 있으면 해시 검증 생략)
+MODEL_SHA256 = os.getenv('ETHICS_MODEL_SHA256', '').strip().lower()
+
+# 부분 해시: 파일 크기 + 앞/뒤 4MB만 해시하여 `<모델 경로>.sha256`에 기록하고 시작 시 비교
+PARTIAL_HASH_BYTES = 4 * 1024 * 1024
+PARTIAL_DIGEST_SUFFIX = '.sha256'
+
+
+def _sha256_of_file(path: str) -> str:
+    """파일의 SHA-256 hex digest"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _partial_sha256(path: str) -> str:
+    """파일 크기와 앞/뒤 PARTIAL_HASH_BYTES를 mmap으로 해시합니다 (파일 전체를 읽지 않음)."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        h.update(str(len(mm)).encode())
+        with memoryview(mm) as view:
+            h.update(view[:PARTIAL_HASH_BYTES])
+            h.update(view[max(0, len(mm) - PARTIAL_HASH_BYTES):])
+    return h.hexdigest()
+
+
+def _record_partial_digest(path: str) -> None:
+    """검증을 마친 모델 파일의 부분 해시를 기록합니다 (실패는 무시)."""
+    try:
+        digest = _partial_sha256(path)
+        with open(path + PARTIAL_DIGEST_SUFFIX, 'w', encoding='utf-8') as f:
+            f.write(digest + '\n')
+    except (OSError, ValueError) as e:
+        print(f"[WARN] 모델 부분 해시 기록 실패: {e}")
+
+
+def _read_partial_digest(path: str) -> Optional[str]:
+    """기록된 부분 해시 (없으면 None)"""
+    try:
+        with open(path + PARTIAL_DIGEST_SUFFIX, 'r', encoding='utf-8') as f:
+            return f.read().strip().lower() or None
+    except OSError:
+        return None
+
+
+def _stream_download(file_id: str, partial_path: str, max_retries: int) -> bool:
+    """
+    HTTP Range 요청으로 partial_path에 이어받기 다운로드합니다.
+    중간에 끊기면 이미 받은 바이트 이후부터 다시 요청합니다.
+    
+    Returns:
+        bool: 전체 파일 수신 완료 여부
+    """
+    params = {"id": file_id, "export": "download", "confirm": "t"}
+    
+    for attempt in range(1, max_retries + 1):
+        offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        
+        try:
+            with requests.get(
+                GDRIVE_DOWNLOAD_URL,
+                params=params,
+                headers=headers,
+                stream=True,
+                timeout=(10, 60)
+            ) as response:
+                # 이미 전체를 받은 상태
+                if response.status_code == 416:
+                    return True
+                response.raise_for_status()
+                
+                if 'text/html' in response.headers.get('Content-Type', ''):
+                    print(f"[WARN] Google Drive가 파일 대신 HTML 페이지를 반환했습니다.")
+                    return False
+                
+                # 서버가 Range를 무시하면 처음부터 다시 받음
+                if offset and response.status_code != 206:
+                    offset = 0
+                
+                expected_total = None
+                content_range = response.headers.get('Content-Range', '')
+                if '/' in content_range and not content_range.endswith('/*'):
+                    expected_total = int(content_range.rsplit('/', 1)[1])
+                elif response.headers.get('Content-Length'):
+                    expected_total = offset + int(response.headers['Content-Length'])
+                
+                if offset:
+                    print(f"[INFO] 이어받기: {offset:,} bytes 이후부터 다운로드 (시도 {attempt}/{max_retries})")
+                
+                with open(partial_path, 'ab' if offset else 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+            
+            received = os.path.getsize(partial_path)
+            if expected_total is None or received >= expected_total:
+                return True
+            print(f"[WARN] 다운로드가 중간에 끊겼습니다: {received:,}/{expected_total:,} bytes")
+            
+        except requests.RequestException as e:
+            print(f"[WARN] 다운로드 오류 (시도 {attempt}/{max_retries}): {e}")
+    
+    return False
+
+
+def is_valid_model_file(path: str) -> bool:
+    """
+    모델 파일이 온전한지 mmap으로 머리/꼬리 바이트만 확인합니다 (파일 전체를 읽지 않음).
+    torch.save의 zip 형식은 로컬 파일 헤더(PK\\x03\\x04)로 시작하고
+    끝부분에 중앙 디렉터리 종료 레코드(PK\\x05\\x06)가 있어야 하므로, 잘린 다운로드나
+    HTML 보안 페이지를 걸러낼 수 있습니다. (구형 pickle 형식은 헤더만 확인)
+    다운로드 시 기록한 부분 해시(`<path>.sha256`)가 있으면 그것과도 비교합니다.
+    
+    Args:
+        path: 모델 파일 경로
+        
+    Returns:
+        bool: 유효한 모델 파일 여부
+    """
+    try:
+        if os.path.getsize(path) <= MIN_MODEL_SIZE:
+            return False
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:4] == b'PK\x03\x04':
+                valid = mm.rfind(b'PK\x05\x06', max(0, len(mm) - 65536 - 22)) != -1
+            else:
+                valid = mm[:1] == b'\x80'
+        if not valid:
+            return False
+        recorded = _read_partial_digest(path)
+        return recorded is None or recorded == _partial_sha256(path)
+    except (OSError, ValueError):
+        return False
+
+
+def download_file_from_google_drive(
+    file_id: str,
+    destination: str,
+    expected_sha256: Optional[str] = None,
+    max_retries: int = 5
+) -> bool:
     """
     Google Drive에서 파일을 다운로드합니다.
-    gdown 라이브러리를 사용하여 대용량 파일도 안정적으로 다운로드합니다.
+    requests 스트리밍으로 `<destination>.part`에 받으며, 실패 시 받은 부분부터 이어받습니다.
+    (requests 경로가 불가능하면 gdown으로 대체)
     
     Args:
         file_id: Google Drive 파일 ID
         destination: 저장할 파일 경로
+        expected_sha256: 기대하는 SHA-256 (지정 시 검증)
+        max_retries: 이어받기 최대 시도 횟수
         
     Returns:
         bool: 다운로드 성공 여부
     """
-    if not GDOWN_AVAILABLE:
-        print(f"[ERROR] gdown 라이브러리가 필요합니다.")
-        print(f"[INFO] 설치 명령어: pip install gdown")
+    if not REQUESTS_AVAILABLE and not GDOWN_AVAILABLE:
+        print(f"[ERROR] requests 또는 gdown 라이브러리가 필요합니다.")
+        print(f"[INFO] 설치 명령어: pip install requests gdown")
         return False
     
+    partial_path = f"{destination}.part"
+    
     try:
         print(f"[INFO] Google Drive에서 모델 다운로드 중...")
         print(f"[INFO] 파일 ID: {file_id}")
         print(f"[INFO] 저장 경로: {destination}")
         print(f"[INFO] 대용량 파일(~415MB) 다운로드 중... 시간이 소요될 수 있습니다.")
         
-        # gdown을 사용한 다운로드
-        url = f"https://drive.google.com/uc?id={file_id}"
-        output = gdown.download(url, destination, quiet=False, fuzzy=True)
+        completed = False
+        if REQUESTS_AVAILABLE:
+            completed = _stream_download(file_id, partial_path, max_retries)
+        
+        if not completed and GDOWN_AVAILABLE:
+            # gdown도 임시 파일에서 이어받기 지원
+            print(f"[INFO] gdown으로 다운로드를 시도합니다...")
+            url = f"https://drive.google.com/uc?id={file_id}"
+            completed = bool(gdown.download(url, partial_path, quiet=False, fuzzy=True, resume=True))
         
         # 다운로드 검증
-        if output and os.path.exists(destination):
-            file_size = os.path.getsize(destination)
+        if completed and os.path.exists(partial_path):
+            file_size = os.path.getsize(partial_path)
             file_size_mb = file_size / (1024 * 1024)
             
-            # 최소 100MB 이상이어야 정상 (원본 415MB)
-            if file_size > 100 * 1024 * 1024:
-                print(f"[SUCCESS] 모델 다운로드 완료!")
-                print(f"[INFO] 파일 크기: {file_size:,} bytes ({file_size_mb:.2f} MB)")
-                return True
-            else:
+            if file_size <= MIN_MODEL_SIZE:
                 print(f"[ERROR] 다운로드된 파일이 너무 작습니다: {file_size:,} bytes ({file_size_mb:.2f} MB)")
                 print(f"[ERROR] 예상 크기: ~415 MB")
                 print(f"[INFO] Google Drive 보안 페이지가 다운로드되었을 수 있습니다.")
-                os.remove(destination)
+                os.remove(partial_path)
                 return False
+            
+            if expected_sha256 and _sha256_of_file(partial_path) != expected_sha256.lower():
+                print(f"[ERROR] 다운로드된 파일의 SHA-256이 일치하지 않습니다.")
+                os.remove(partial_path)
+                return False
+            
+            os.replace(partial_path, destination)
+            _record_partial_digest(destination)
+            print(f"[SUCCESS] 모델 다운로드 완료!")
+            print(f"[INFO] 파일 크기: {file_size:,} bytes ({file_size_mb:.2f} MB)")
+            return True
         else:
+            # 받은 부분(.part)은 남겨두어 다음 호출에서 이어받기
             print(f"[ERROR] 파일 다운로드 실패")
             return False
             
     except Exception as e:
         print(f"[ERROR] 모델 다운로드 중 오류 발생: {e}")
-        if os.path.exists(destination):
-            os.remove(destination)
         return False
 
 
 def ensure_model_exists(
     model_path: str = 'ethics/models/binary_classifier.pth',
-    file_id: str = '1paWpYv5umu0zmmjsC4gyM7HL248tShEh'
+    file_id: str = '1paWpYv5umu0zmmjsC4gyM7HL248tShEh',
+    expected_sha256: Optional[str] = None
 ) -> bool:
     """
-    모델 파일이 존재하는지 확인하고, 없으면 다운로드합니다.
+    모델 파일이 존재하는지 확인하고, 없거나 손상되었으면 다운로드합니다.
+    기존 파일은 지우지 않으며, 새 파일을 `.part`로 받아 검증을 통과한 경우에만 교체합니다.
     
     Args:
         model_path: 모델 파일 경로
         file_id: Google Drive 파일 ID
+        expected_sha256: 다운로드 파일의 기대 SHA-256 (None이면 MODEL_SHA256 사용)
         
     Returns:
         bool: 모델 파일 준비 완료 여부
@@ -85,10 +261,13 @@ def ensure_model_exists(
     # 모델 파일이 이미 존재하는지 확인
     if os.path.exists(model_path):
         file_size = os.path.getsize(model_path)
-        print(f"[INFO] 모델 파일이 이미 존재합니다: {model_path} ({file_size:,} bytes)")
-        return True
-    
-    print(f"[WARN] 모델 파일이 존재하지 않습니다: {model_path}")
+        if is_valid_model_file(model_path):
+            print(f"[INFO] 모델 파일이 이미 존재합니다: {model_path} ({file_size:,} bytes)")
+            return True
+        print(f"[WARN] 모델 파일이 손상되었거나 불완전합니다: {model_path} ({file_size:,} bytes)")
+        print(f"[INFO] 기존 파일은 새 파일 다운로드가 끝날 때까지 유지합니다.")
+    else:
+        print(f"[WARN] 모델 파일이 존재하지 않습니다: {model_path}")
     
     # 디렉토리 생성
     model_dir = os.path.dirname(model_path)
@@ -98,7 +277,11 @@ def ensure_model_exists(
     
     # Google Drive에서 다운로드
     print(f"[INFO] Google Drive에서 모델 다운로드를 시작합니다...")
-    success = download_file_from_google_drive(file_id, model_path)
+    success = download_file_from_google_drive(
+        file_id,
+        model_path,
+        expected_sha256=expected_sha256 if expected_sha256 is not None else MODEL_SHA256
+    )
     
     if success:
         print(f"[SUCCESS] 모델 다운로드가 완료되었습니다!")
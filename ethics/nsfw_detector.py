@@ -2,8 +2,10 @@
 NSFW 이미지 감지 모듈
 Hugging Face의 사전 학습된 모델을 사용한 부적절한 이미지 감지
 """
-from typing import Dict
+import os
+from typing import Dict, List
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from transformers import pipeline
@@ -13,10 +15,21 @@ except ImportError:
     NSFW_AVAILABLE = False
     print("[WARN] NSFW 모듈 로드 실패: transformers 또는 Pillow 미설치")
 
+NSFW_MODEL_NAME = "Falconsai/nsfw_image_detection"
+
+# 모델 입력 해상도 (ViT 224x224) - JPEG는 이 크기 이상으로만 축소 디코딩
+NSFW_INPUT_SIZE = (224, 224)
+
+# CPU 환경에서 ONNX Runtime 사용 여부 (optimum[onnxruntime] 설치 필요, 최초 로드 시 export 비용 발생)
+NSFW_USE_ONNX = os.getenv("NSFW_USE_ONNX", "false").lower() == "true"
+
 
 class NSFWDetector:
     """NSFW(Not Safe For Work) 이미지 감지기"""
     
+    # 파이프라인 출력이 점수 내림차순인지 (최초 결과에서 한 번만 확인)
+    _scores_sorted = None
+    
     def __init__(self):
         """NSFW 감지 모델 초기화"""
         if not NSFW_AVAILABLE:
@@ -24,16 +37,60 @@ class NSFWDetector:
         
         try:
             # Falconsai의 NSFW 감지 모델 사용
-            self.classifier = pipeline(
-                "image-classification",
-                model="Falconsai/nsfw_image_detection",
-                device=-1  # CPU 사용 (GPU 있으면 0으로 변경)
-            )
-            print("[INFO] NSFW 감지 모델 로드 완료")
+            self.classifier = self._create_classifier()
+            print(f"[INFO] NSFW 감지 모델 로드 완료 ({self.backend})")
         except Exception as e:
             print(f"[ERROR] NSFW 모델 로드 실패: {e}")
             raise
     
+    def _create_classifier(self):
+        """
+        실행 환경에 맞는 분류 파이프라인 생성
+        - CUDA 사용 가능: GPU + FP16
+        - CPU + NSFW_USE_ONNX: ONNX Runtime (optimum 미설치/실패 시 기본 파이프라인)
+        - 그 외: 기본 CPU 파이프라인
+        """
+        try:
+            import torch
+            cuda_available = torch.cuda.is_available()
+        except ImportError:
+            cuda_available = False
+        
+        if cuda_available:
+            self.backend = "cuda-fp16"
+            return pipeline(
+                "image-classification",
+                model=NSFW_MODEL_NAME,
+                device=0,
+                torch_dtype=torch.float16
+            )
+        
+        if NSFW_USE_ONNX:
+            try:
+                from optimum.onnxruntime import ORTModelForImageClassification
+                from transformers import AutoImageProcessor
+                
+                ort_model = ORTModelForImageClassification.from_pretrained(
+                    NSFW_MODEL_NAME,
+                    export=True,
+                    provider="CPUExecutionProvider"
+                )
+                self.backend = "onnxruntime-cpu"
+                return pipeline(
+                    "image-classification",
+                    model=ort_model,
+                    image_processor=AutoImageProcessor.from_pretrained(NSFW_MODEL_NAME)
+                )
+            except Exception as e:
+                print(f"[WARN] ONNX Runtime 로드 실패, 기본 CPU 파이프라인 사용: {e}")
+        
+        self.backend = "cpu"
+        return pipeline(
+            "image-classification",
+            model=NSFW_MODEL_NAME,
+            device=-1
+        )
+    
     def analyze(self, image_path: str) -> Dict:
         """
         이미지 NSFW 여부 분석
@@ -49,35 +106,105 @@ class NSFWDetector:
                 'raw_scores': [{'label': str, 'score': float}, ...]
             }
         """
+        return self.analyze_batch([image_path], batch_size=1)[0]
+    
+    def analyze_batch(self, image_paths: List[str], batch_size: int = 16) -> List[Dict]:
+        """
+        여러 이미지를 한 번에 분석 (모델 forward를 배치로 묶어 처리량 향상)
+        
+        Args:
+            image_paths: 이미지 파일 경로 리스트
+            batch_size: 모델 배치 크기
+            
+        Returns:
+            image_paths와 같은 순서의 analyze() 결과 리스트
+            (로드/분석에 실패한 이미지는 label='error')
+        """
+        if not image_paths:
+            return []
+        
+        # 이미지 로드/디코딩은 I/O 위주이므로 스레드로 병렬 처리
+        if len(image_paths) == 1:
+            images = [self._load_image(image_paths[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(image_paths))) as executor:
+                images = list(executor.map(self._load_image, image_paths))
+        
+        results: List[Dict] = [self._error_result() for _ in image_paths]
+        valid = [(i, image) for i, image in enumerate(images) if image is not None]
+        if not valid:
+            return results
+        
+        try:
+            # 분석 실행 (파이프라인이 batch_size 단위로 묶어 처리)
+            outputs = self.classifier([image for _, image in valid], batch_size=batch_size)
+        except Exception as e:
+            print(f"[ERROR] NSFW 분석 실패: {e}")
+            return results
+        
+        # 결과 형식이 예상과 다르면 해당 이미지만 'error' 결과 유지 (analyze()는 항상 결과를 반환)
+        for (i, _), scores in zip(valid, outputs):
+            if not scores:
+                print("[ERROR] NSFW 분석 실패: 빈 점수 목록")
+                continue
+            try:
+                results[i] = self._format_result(scores)
+            except (KeyError, TypeError, AttributeError) as e:
+                print(f"[ERROR] NSFW 분석 결과 변환 실패: {e}")
+        return results
+    
+    @staticmethod
+    def _load_image(image_path: str):
+        """이미지를 로드하고 RGB로 변환 (실패 시 None)"""
         try:
-            # 이미지 로드
             image = Image.open(image_path)
             
+            # JPEG는 디코더 단계에서 모델 입력 크기에 가깝게 축소 (고해상도 업로드 디코딩 비용 절감)
+            image.draft('RGB', NSFW_INPUT_SIZE)
+            
             # RGB로 변환 (RGBA나 다른 모드 대응)
             if image.mode != 'RGB':
                 image = image.convert('RGB')
-            
-            # 분석 실행
-            results = self.classifier(image)
-            
-            # 가장 높은 점수의 결과 사용
-            top_result = max(results, key=lambda x: x['score'])
-            
-            return {
-                'is_nsfw': top_result['label'].lower() == 'nsfw',
-                'confidence': top_result['score'] * 100,
-                'label': top_result['label'],
-                'raw_scores': results
-            }
-            
+            else:
+                # 디코딩을 로더 스레드에서 끝내도록 강제
+                image.load()
+            return image
         except Exception as e:
-            print(f"[ERROR] NSFW 분석 실패: {e}")
-            return {
-                'is_nsfw': False,
-                'confidence': 0,
-                'label': 'error',
-                'raw_scores': []
-            }
+            print(f"[ERROR] NSFW 이미지 로드 실패 ({image_path}): {e}")
+            return None
+    
+    @classmethod
+    def _format_result(cls, results: List[Dict]) -> Dict:
+        """파이프라인 출력 → analyze() 결과 형식"""
+        # HF image-classification 파이프라인은 점수 내림차순으로 반환하므로 첫 항목이 최고점
+        # (최초 1회 정렬 여부를 확인하고, 아니면 이후에도 max로 대체)
+        if cls._scores_sorted is None:
+            cls._scores_sorted = all(
+                results[i]['score'] >= results[i + 1]['score']
+                for i in range(len(results) - 1)
+            )
+            if not cls._scores_sorted:
+                print("[WARN] NSFW 파이프라인 출력이 점수순이 아닙니다. max()로 최고점을 찾습니다.")
+        
+        # 가장 높은 점수의 결과 사용
+        top_result = results[0] if cls._scores_sorted else max(results, key=lambda x: x['score'])
+        
+        return {
+            'is_nsfw': top_result['label'].lower() == 'nsfw',
+            'confidence': top_result['score'] * 100,
+            'label': top_result['label'],
+            'raw_scores': results
+        }
+    
+    @staticmethod
+    def _error_result() -> Dict:
+        """분석 실패 시 기본 결과"""
+        return {
+            'is_nsfw': False,
+            'confidence': 0,
+            'label': 'error',
+            'raw_scores': []
+        }
     
     def should_block(self, analysis_result: Dict, threshold: float = 80.0) -> bool:
         """
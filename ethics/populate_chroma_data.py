@@ -5,12 +5,28 @@ ChromaDB에 다양한 비윤리/스팸 케이스 데이터를 추가하는 스
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import random
+
+import numpy as np
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
 
 # PYTHONPATH 설정
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from ethics.ethics_vector_db import (
+    get_client,
+    bulk_upsert_confirmed_cases,
+    bulk_ingest_mode,
+    get_collection_stats,
+    search_similar_cases_batch,
+)
+
 def generate_sample_cases():
     """다양한 비윤리/스팸 케이스 샘플 데이터 생성"""
     
@@ -198,20 +214,78 @@ def generate_sample_cases():
         }
     ]
     
-    return immoral_cases + spam_cases + borderline_cases + normal_cases
+    sample_cases = immoral_cases + spam_cases + borderline_cases + normal_cases
+    
+    # note 필드는 케이스별로 고정이므로 미리 계산
+    for case in sample_cases:
+        case["note"] = f"Sample case for {', '.join(case['types'])}"
+    
+    return sample_cases
+
+
+_rng = np.random.default_rng()
 
 
 def create_dummy_embedding(dimension=1536):
     """더미 임베딩 벡터 생성 (실제로는 OpenAI API 사용)"""
-    return [random.uniform(-1, 1) for _ in range(dimension)]
+    return _rng.uniform(-1.0, 1.0, size=dimension).tolist()
+
+
+def create_dummy_embeddings(count, dimension=1536):
+    """더미 임베딩 count개를 (count, dimension) 행렬로 한 번에 생성"""
+    return _rng.uniform(-1.0, 1.0, size=(count, dimension))
+
+
+# 임베딩 생성(네트워크 I/O)과 upsert를 겹쳐서 실행하기 위한 설정
+EMBED_WORKERS = 4
+UPSERT_BATCH_SIZE = 100
+
+
+def embed_cases(metadatas):
+    """케이스 묶음의 임베딩 생성 (실제로는 OpenAI Embeddings API 호출)"""
+    return create_dummy_embeddings(len(metadatas))
 
 
-def populate_chroma_data():
-    """ChromaDB에 샘플 데이터 추가"""
+def ingest_cases(client, metadatas):
+    """
+    임베딩 생성은 스레드 풀에서, upsert는 현재 스레드에서 배치 단위로 수행합니다.
+    executor.map은 입력 순서대로 결과를 돌려주므로, 앞 배치를 upsert하는 동안
+    뒤 배치의 임베딩이 계속 생성됩니다.
+    
+    Returns:
+        int: 저장된 케이스 수
+    """
+    batches = [
+        metadatas[start:start + UPSERT_BATCH_SIZE]
+        for start in range(0, len(metadatas), UPSERT_BATCH_SIZE)
+    ]
+    added_count = 0
+    # tqdm이 있으면 시간 기반으로 갱신되는 진행 표시줄 사용 (없으면 배치마다 출력)
+    progress = tqdm(total=len(metadatas), desc="Upsert", unit="case") if TQDM_AVAILABLE else None
+    try:
+        with ThreadPoolExecutor(max_workers=EMBED_WORKERS) as executor:
+            for batch, embeddings in zip(batches, executor.map(embed_cases, batches)):
+                saved = bulk_upsert_confirmed_cases(client, embeddings, batch)
+                added_count += saved
+                if progress is not None:
+                    progress.update(saved)
+                else:
+                    print(f"[PROGRESS] {added_count}/{len(metadatas)} 케이스 추가 완료")
+    finally:
+        if progress is not None:
+            progress.close()
+    return added_count
+
+
+def populate_chroma_data(fast_bulk=False):
+    """
+    ChromaDB에 샘플 데이터 추가
+    
+    Args:
+        fast_bulk: True면 적재 동안 SQLite 저널/동기화를 끔 (빠르지만 중단 시 DB 손상 위험)
+    """
     
     try:
-        from ethics.ethics_vector_db import get_client, upsert_confirmed_case, get_collection_stats
-        
         print("=" * 60)
         print("ChromaDB 데이터 추가 시작")
         print("=" * 60)
@@ -228,41 +302,41 @@ def populate_chroma_data():
         sample_cases = generate_sample_cases()
         print(f"[INFO] 생성된 샘플 케이스 수: {len(sample_cases)}")
         
-        # 데이터 추가
-        added_count = 0
+        # 시각/난수는 루프 밖에서 한 번에 생성
+        n_cases = len(sample_cases)
+        now = datetime.now()
+        user_nums = _rng.integers(1, 101, n_cases)
+        day_offsets = _rng.integers(0, 31, n_cases)
+        jitter_immoral = _rng.uniform(-5, 5, n_cases)
+        jitter_spam = _rng.uniform(-5, 5, n_cases)
+        
+        # 메타데이터 목록 구성
+        metadatas = []
         for i, case in enumerate(sample_cases):
-            try:
-                # 더미 임베딩 생성 (실제로는 OpenAI API 사용)
-                embedding = create_dummy_embedding()
-                
-                # 메타데이터 구성
-                metadata = {
-                    "sentence": case["sentence"],
-                    "immoral_score": case["immoral_score"],
-                    "spam_score": case["spam_score"],
-                    "confidence": case["confidence"],
-                    "confirmed": case["feedback_type"] == "admin_confirmed",
-                    "post_id": f"sample_post_{i+1:03d}",
-                    "user_id": f"sample_user_{random.randint(1, 100)}",
-                    "created_at": (datetime.now() - timedelta(days=random.randint(0, 30))).isoformat(),
-                    "feedback_type": case["feedback_type"],
-                    "admin_id": "admin_sample" if case["feedback_type"] == "admin_confirmed" else "",
-                    "admin_action": "approve" if case["feedback_type"] == "admin_confirmed" else "",
-                    "original_immoral_score": case["immoral_score"] - random.uniform(-5, 5),
-                    "original_spam_score": case["spam_score"] - random.uniform(-5, 5),
-                    "note": f"Sample case for {', '.join(case['types'])}"
-                }
-                
-                # ChromaDB에 추가
-                upsert_confirmed_case(client, embedding, metadata)
-                added_count += 1
-                
-                if (i + 1) % 5 == 0:
-                    print(f"[PROGRESS] {i + 1}/{len(sample_cases)} 케이스 추가 완료")
-                
-            except Exception as e:
-                print(f"[ERROR] 케이스 {i+1} 추가 실패: {e}")
-                continue
+            metadatas.append({
+                "sentence": case["sentence"],
+                "immoral_score": case["immoral_score"],
+                "spam_score": case["spam_score"],
+                "confidence": case["confidence"],
+                "confirmed": case["feedback_type"] == "admin_confirmed",
+                "post_id": f"sample_post_{i+1:03d}",
+                "user_id": f"sample_user_{user_nums[i]}",
+                "created_at": (now - timedelta(days=int(day_offsets[i]))).isoformat(),
+                "feedback_type": case["feedback_type"],
+                "admin_id": "admin_sample" if case["feedback_type"] == "admin_confirmed" else "",
+                "admin_action": "approve" if case["feedback_type"] == "admin_confirmed" else "",
+                "original_immoral_score": case["immoral_score"] - float(jitter_immoral[i]),
+                "original_spam_score": case["spam_score"] - float(jitter_spam[i]),
+                "note": case["note"]
+            })
+        
+        # 임베딩 생성 + ChromaDB 배치 추가 (건별 upsert 대비 트랜잭션 수 감소)
+        if fast_bulk:
+            print("[INFO] --fast-bulk: 적재 동안 SQLite 내구성 설정을 완화합니다")
+            with bulk_ingest_mode(client):
+                added_count = ingest_cases(client, metadatas)
+        else:
+            added_count = ingest_cases(client, metadatas)
         
         # 최종 상태 확인
         final_stats = get_collection_stats(client)
@@ -291,8 +365,6 @@ def test_search_functionality():
     print("=" * 60)
     
     try:
-        from ethics.ethics_vector_db import get_client, search_similar_cases
-        
         client = get_client()
         
         # 테스트 쿼리들
@@ -314,17 +386,18 @@ def test_search_functionality():
             }
         ]
         
-        for i, query in enumerate(test_queries):
+        # 모든 테스트 쿼리를 한 번의 query 호출로 검색
+        batch_results = search_similar_cases_batch(
+            client=client,
+            embeddings=[query["embedding"] for query in test_queries],
+            top_k=3,
+            min_score=0.0,
+            min_confidence=0.0
+        )
+        
+        for i, (query, similar_cases) in enumerate(zip(test_queries, batch_results)):
             print(f"\n[TEST {i+1}] {query['description']} 관련 케이스 검색:")
             
-            similar_cases = search_similar_cases(
-                client=client,
-                embedding=query["embedding"],
-                top_k=3,
-                min_score=0.0,
-                min_confidence=0.0
-            )
-            
             if similar_cases:
                 for j, case in enumerate(similar_cases):
                     print(f"  {j+1}. 유사도: {case['score']:.3f}")
@@ -347,7 +420,7 @@ def main():
     print("ChromaDB 데이터 추가 및 테스트 스크립트")
     
     # 1. 데이터 추가
-    success = populate_chroma_data()
+    success = populate_chroma_data(fast_bulk="--fast-bulk" in sys.argv[1:])
     
     if success:
         # 2. 검색 기능 테스트
@@ -5,7 +5,79 @@ ChromaDB 재초기화 스크립트
 
 import os
 import shutil
-from typing import Dict, Any
+import threading
+import time
+from typing import Dict, Any, Optional
+
+# 삭제 중인 경로 → 백그라운드 삭제 스레드
+# (daemon 스레드는 프로세스가 끝나면 중단되므로, 스크립트는 종료 전에 wait_for_background_removal 호출)
+_removal_threads: Dict[str, threading.Thread] = {}
+
+
+def _remove_in_background(path: str) -> None:
+    """디렉토리를 백그라운드 스레드에서 삭제합니다 (실패는 무시)."""
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(path,),
+        kwargs={"ignore_errors": True},
+        daemon=True
+    )
+    thread.start()
+    _removal_threads[path] = thread
+
+
+def wait_for_background_removal(timeout: Optional[float] = None) -> bool:
+    """
+    백그라운드 삭제 스레드가 끝날 때까지 기다립니다.
+    
+    Returns:
+        bool: 모든 삭제가 끝났는지 여부 (timeout 초과 시 False)
+    """
+    for path, thread in list(_removal_threads.items()):
+        thread.join(timeout)
+        if not thread.is_alive():
+            _removal_threads.pop(path, None)
+    return not _removal_threads
+
+
+def _purge_leftover_trash(chroma_dir: str) -> None:
+    """
+    이전 재초기화에서 삭제가 끝나지 못한 *.trash.* 디렉토리를 백그라운드에서 삭제합니다.
+    (저장소를 옮긴 `<chroma_dir>.trash.*`와 제자리 비우기로 생긴 `<chroma_dir>/*.trash.*`)
+    """
+    chroma_dir = os.path.abspath(chroma_dir)
+    prefix = os.path.basename(chroma_dir) + ".trash."
+    scans = [(os.path.dirname(chroma_dir), lambda name: name.startswith(prefix))]
+    if os.path.isdir(chroma_dir):
+        scans.append((chroma_dir, lambda name: ".trash." in name))
+    
+    for parent, is_trash in scans:
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False) or not is_trash(entry.name):
+                    continue
+                thread = _removal_threads.get(entry.path)
+                if thread is not None and thread.is_alive():
+                    continue
+                print(f"[INFO] 남아 있던 삭제 대기 디렉토리 정리: {entry.path}")
+                _remove_in_background(entry.path)
+
+
+def _wipe_store(chroma_dir: str) -> None:
+    """
+    저장소를 제자리에서 비웁니다 (디렉토리 rename이 불가능할 때 사용).
+    최상위 파일(chroma.sqlite3, WAL, 통계 사이드카)은 즉시 삭제하여 바로 빈 저장소가 되게 하고,
+    파일 수가 많은 HNSW 세그먼트 디렉토리는 백그라운드에서 삭제합니다.
+    """
+    with os.scandir(chroma_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                trash_dir = f"{entry.path}.trash.{time.time()}"
+                os.rename(entry.path, trash_dir)
+                _remove_in_background(trash_dir)
+            else:
+                os.unlink(entry.path)
+
 
 def reset_chroma_db() -> Dict[str, Any]:
     """
@@ -26,11 +98,32 @@ def reset_chroma_db() -> Dict[str, Any]:
         
         print(f"[INFO] ChromaDB 재초기화 시작...")
         
+        # 캐시된 클라이언트/컬렉션 핸들 폐기 (삭제된 저장소를 계속 참조하지 않도록)
+        from ethics.ethics_vector_db import reset_client_cache
+        reset_client_cache()
+        
+        # 이전 실행에서 지우지 못한 trash 디렉토리 정리
+        try:
+            _purge_leftover_trash(chroma_dir)
+        except OSError as e:
+            print(f"[WARN] 이전 삭제 대기 디렉토리 정리 실패: {e}")
+        
         # 1. 기존 디렉토리 삭제
         if os.path.exists(chroma_dir):
             print(f"[INFO] 기존 ChromaDB 디렉토리 삭제 중: {chroma_dir}")
             try:
-                shutil.rmtree(chroma_dir)
+                # 같은 파일시스템 내 rename은 즉시 끝나므로, 실제 삭제는 백그라운드에서 진행
+                trash_dir = f"{chroma_dir}.trash.{time.time()}"
+                try:
+                    os.rename(chroma_dir, trash_dir)
+                except OSError:
+                    try:
+                        _wipe_store(chroma_dir)
+                    except OSError:
+                        shutil.rmtree(chroma_dir)
+                else:
+                    _remove_in_background(trash_dir)
+                    result["details"]["trash_directory"] = trash_dir
                 print(f"[INFO] 기존 ChromaDB 디렉토리 삭제 완료")
                 result["details"]["old_directory_removed"] = True
             except Exception as e:
@@ -163,6 +256,11 @@ if __name__ == "__main__":
         final_test = test_chroma_connection()
         print(f"최종 테스트 결과: {final_test['message']}")
     
+    # 백그라운드 삭제가 끝나기 전에 프로세스가 종료되면 *.trash.* 디렉토리가 남음
+    if _removal_threads:
+        print("\n[INFO] 이전 ChromaDB 데이터 삭제 완료 대기 중...")
+        wait_for_background_removal()
+    
     print("\n" + "=" * 60)
     print("스크립트 실행 완료")
     print("=" * 60)
@@ -1,22 +1,70 @@
 """
 OpenAI Vision API를 활용한 이미지 윤리/스팸 분석 모듈
 """
+import asyncio
 import base64
 import os
 import json
-from typing import Dict, Tuple
-from pathlib import Path
+import re
+from typing import Dict, List, Tuple
 from dotenv import load_dotenv
 
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     print("[WARN] OpenAI 모듈 로드 실패")
 
+# orjson이 있으면 응답 JSON 파싱에 사용 (없으면 표준 json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 load_dotenv()
 
+# 확장자 → MIME 타입 (미등록 확장자는 JPEG로 간주)
+_MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+# JSON 파싱 실패 시 점수 수동 추출용 패턴 (세 점수를 한 번의 스캔으로 추출)
+_RE_SCORES = re.compile(r'"(immoral_score|spam_score|confidence)"\s*:\s*(\d+\.?\d*)')
+# 점수 필드는 응답 앞부분에 있으므로 이 길이까지만 검색
+_FALLBACK_PROBE_CHARS = 2048
+
+# Vision API 시스템 프롬프트 (요청마다 재생성하지 않도록 모듈 상수로 유지)
+_SYSTEM_PROMPT = """You are an image content moderation expert. Analyze images efficiently.
+
+Analyze the image for:
+1. Immoral content: pornography, violence, hate speech, profanity/slander text, etc.
+2. Spam content: advertisements, promotions, commercial spam, etc.
+3. Extract and analyze text within the image
+
+Scoring criteria:
+- immoral_score: 0 (safe) ~ 100 (very dangerous)
+- spam_score: 0 (safe) ~ 100 (definitely spam)
+- confidence: 0 (uncertain) ~ 100 (certain)
+
+Respond ONLY with valid JSON format. Do not include any other text.
+Response format:
+{
+  "immoral_score": 0,
+  "spam_score": 0,
+  "confidence": 80,
+  "types": ["욕설", "음란물", "광고"],
+  "has_text": false,
+  "extracted_text": "이미지 내 텍스트가 있다면 한글로 추출"
+}"""
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+_USER_TEXT_PART = {"type": "text", "text": "Analyze this image and respond with JSON only."}
+
 
 class VisionEthicsAnalyzer:
     """이미지 윤리/스팸 분석기 (OpenAI Vision API)"""
@@ -31,6 +79,7 @@ class VisionEthicsAnalyzer:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
         
         self.client = OpenAI(api_key=api_key)
+        self.aclient = AsyncOpenAI(api_key=api_key)
         print("[INFO] Vision API 초기화 완료")
     
     def analyze_image(self, image_path: str) -> Dict:
@@ -52,141 +101,176 @@ class VisionEthicsAnalyzer:
             }
         """
         try:
-            # 이미지를 base64로 인코딩
-            with open(image_path, 'rb') as f:
-                image_data = base64.b64encode(f.read()).decode('utf-8')
-            
-            # 파일 확장자 확인
-            ext = Path(image_path).suffix.lower()
-            mime_type = {
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.gif': 'image/gif',
-                '.webp': 'image/webp'
-            }.get(ext, 'image/jpeg')
+            image_url = self._encode_image(image_path)
+        except Exception as e:
+            print(f"[ERROR] Vision API 분석 실패: {e}")
+            return self._error_result()
+        
+        return self.analyze_image_url(image_url)
+    
+    def analyze_image_url(self, image_url: str) -> Dict:
+        """
+        이미 호스팅된 이미지 URL(또는 data URI)을 그대로 전달하여 분석
+        (파일 읽기/base64 인코딩 없이 OpenAI가 직접 가져감 — 외부에서 접근 가능한 URL이어야 함)
+        
+        Args:
+            image_url: 공개/서명된 이미지 URL
             
+        Returns:
+            analyze_image()와 동일한 형식의 결과
+        """
+        try:
             # Vision API 호출 (비용 절감: reasoning 필드 제거)
-            response = self.client.chat.completions.create(
-                model="gpt-4o",  # GPT-4 Omni (Vision 지원)
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are an image content moderation expert. Analyze images efficiently.
-
-Analyze the image for:
-1. Immoral content: pornography, violence, hate speech, profanity/slander text, etc.
-2. Spam content: advertisements, promotions, commercial spam, etc.
-3. Extract and analyze text within the image
-
-Scoring criteria:
-- immoral_score: 0 (safe) ~ 100 (very dangerous)
-- spam_score: 0 (safe) ~ 100 (definitely spam)
-- confidence: 0 (uncertain) ~ 100 (certain)
-
-Respond ONLY with valid JSON format. Do not include any other text.
-Response format:
-{
-  "immoral_score": 0,
-  "spam_score": 0,
-  "confidence": 80,
-  "types": ["욕설", "음란물", "광고"],
-  "has_text": false,
-  "extracted_text": "이미지 내 텍스트가 있다면 한글로 추출"
-}"""
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Analyze this image and respond with JSON only."
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:{mime_type};base64,{image_data}",
-                                    "detail": "low"  # 비용 절감을 위해 low detail 사용
-                                }
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=400,  # reasoning 제거로 토큰 절약 (800 -> 400)
-                temperature=0.1,  # 더 일관된 응답을 위해 낮춤
-                response_format={"type": "json_object"}  # JSON 모드 강제
-            )
+            response = self.client.chat.completions.create(**self._request_kwargs(image_url))
             
-            # 결과 파싱
-            content = response.choices[0].message.content
+            return self._parse_response(response.choices[0].message.content)
             
-            # JSON 파싱 시도
-            try:
-                # 마크다운 코드 블록 제거
+        except Exception as e:
+            print(f"[ERROR] Vision API 분석 실패: {e}")
+            return self._error_result()
+    
+    async def analyze_images_batch(self, image_paths: List[str], max_concurrency: int = 8) -> List[Dict]:
+        """
+        여러 이미지를 동시에 분석 (AsyncOpenAI로 요청을 병렬 전송)
+        
+        Args:
+            image_paths: 이미지 파일 경로 리스트
+            max_concurrency: 동시에 진행할 최대 API 요청 수
+            
+        Returns:
+            image_paths와 같은 순서의 analyze_image() 결과 리스트
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await asyncio.gather(
+            *(self._analyze_one(image_path, semaphore) for image_path in image_paths)
+        )
+    
+    async def _analyze_one(self, image_path: str, semaphore: asyncio.Semaphore) -> Dict:
+        """analyze_image의 비동기 버전 (파일 읽기/인코딩은 스레드에서 수행)"""
+        try:
+            image_url = await asyncio.to_thread(self._encode_image, image_path)
+            
+            async with semaphore:
+                response = await self.aclient.chat.completions.create(**self._request_kwargs(image_url))
+            
+            return self._parse_response(response.choices[0].message.content)
+            
+        except Exception as e:
+            print(f"[ERROR] Vision API 분석 실패: {e}")
+            return self._error_result()
+    
+    @staticmethod
+    def _encode_image(image_path: str) -> str:
+        """이미지 파일 → data URI (base64)"""
+        # 이미지를 base64로 인코딩 (base64 문자는 ASCII 범위라 ascii 디코딩으로 충분)
+        with open(image_path, 'rb') as f:
+            raw = f.read()
+        image_data = base64.b64encode(raw).decode('ascii')
+        del raw  # 원본 바이트는 즉시 해제 (동시 분석 시 최대 메모리 감소)
+        
+        # 파일 확장자 확인
+        ext = os.path.splitext(image_path)[1].lower()
+        mime_type = _MIME_TYPES.get(ext, 'image/jpeg')
+        
+        return f"data:{mime_type};base64,{image_data}"
+    
+    @staticmethod
+    def _request_kwargs(image_url: str) -> Dict:
+        """chat.completions.create 요청 인자"""
+        return dict(
+            model="gpt-4o",  # GPT-4 Omni (Vision 지원)
+            messages=[
+                _SYSTEM_MSG,
+                {
+                    "role": "user",
+                    "content": [
+                        _USER_TEXT_PART,
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": image_url,
+                                "detail": "low"  # 비용 절감을 위해 low detail 사용
+                            }
+                        }
+                    ]
+                }
+            ],
+            max_tokens=400,  # reasoning 제거로 토큰 절약 (800 -> 400)
+            temperature=0.1,  # 더 일관된 응답을 위해 낮춤
+            response_format={"type": "json_object"}  # JSON 모드 강제
+        )
+    
+    def _parse_response(self, content: str) -> Dict:
+        """Vision API 응답 텍스트 → 분석 결과 (차단 여부 포함)"""
+        # JSON 파싱 시도
+        try:
+            # JSON 모드 응답은 바로 파싱, 아니면 마크다운 코드 블록 제거
+            content = content.strip()
+            if not content.startswith('{'):
                 if '```json' in content:
                     content = content.split('```json')[1].split('```')[0].strip()
                 elif '```' in content:
                     content = content.split('```')[1].split('```')[0].strip()
-                
-                # JSON 파싱
-                result = json.loads(content)
-                
-                # 필수 필드 확인 및 기본값 설정
-                result['immoral_score'] = float(result.get('immoral_score', 0))
-                result['spam_score'] = float(result.get('spam_score', 0))
-                result['confidence'] = float(result.get('confidence', 50))
-                result['types'] = result.get('types', [])
-                result['has_text'] = bool(result.get('has_text', False))
-                result['extracted_text'] = result.get('extracted_text', '')
-                
-            except (json.JSONDecodeError, ValueError, KeyError) as e:
-                # JSON 파싱 실패 시 상세 로그 출력
-                print(f"[ERROR] Vision API 응답 파싱 실패: {e}")
-                print(f"[ERROR] 원본 응답: {content[:500]}")  # 처음 500자만
-                
-                # 텍스트에서 수동으로 점수 추출 시도
-                try:
-                    import re
-                    immoral = re.search(r'"immoral_score"\s*:\s*(\d+\.?\d*)', content)
-                    spam = re.search(r'"spam_score"\s*:\s*(\d+\.?\d*)', content)
-                    conf = re.search(r'"confidence"\s*:\s*(\d+\.?\d*)', content)
-                    
-                    result = {
-                        'immoral_score': float(immoral.group(1)) if immoral else 0,
-                        'spam_score': float(spam.group(1)) if spam else 0,
-                        'confidence': float(conf.group(1)) if conf else 50,
-                        'types': [],
-                        'has_text': False,
-                        'extracted_text': ''
-                    }
-                    print(f"[INFO] 수동 추출 성공: 비윤리={result['immoral_score']}, 스팸={result['spam_score']}")
-                except Exception as extract_error:
-                    print(f"[ERROR] 수동 추출도 실패: {extract_error}")
-                    result = {
-                        'immoral_score': 0,
-                        'spam_score': 0,
-                        'confidence': 50,
-                        'types': [],
-                        'has_text': False,
-                        'extracted_text': ''
-                    }
             
-            # 차단 여부 추가
-            result['is_blocked'] = self._should_block(result)
+            # JSON 파싱
+            result = _json_loads(content)
             
-            return result
+            # 필수 필드 확인 및 기본값 설정
+            result['immoral_score'] = float(result.get('immoral_score', 0))
+            result['spam_score'] = float(result.get('spam_score', 0))
+            result['confidence'] = float(result.get('confidence', 50))
+            result['types'] = result.get('types', [])
+            result['has_text'] = bool(result.get('has_text', False))
+            result['extracted_text'] = result.get('extracted_text', '')
             
-        except Exception as e:
-            print(f"[ERROR] Vision API 분석 실패: {e}")
-            return {
-                'immoral_score': 0,
-                'spam_score': 0,
-                'confidence': 0,
-                'types': [],
-                'has_text': False,
-                'extracted_text': '',
-                'is_blocked': False
-            }
+        except (json.JSONDecodeError, ValueError, KeyError) as e:
+            # JSON 파싱 실패 시 상세 로그 출력
+            print(f"[ERROR] Vision API 응답 파싱 실패: {e}")
+            print(f"[ERROR] 원본 응답: {content[:500]}")  # 처음 500자만
+            
+            # 텍스트에서 수동으로 점수 추출 시도
+            try:
+                scores = {}
+                for match in _RE_SCORES.finditer(content[:_FALLBACK_PROBE_CHARS]):
+                    scores.setdefault(match.group(1), float(match.group(2)))
+                
+                result = {
+                    'immoral_score': scores.get('immoral_score', 0),
+                    'spam_score': scores.get('spam_score', 0),
+                    'confidence': scores.get('confidence', 50),
+                    'types': [],
+                    'has_text': False,
+                    'extracted_text': ''
+                }
+                print(f"[INFO] 수동 추출 성공: 비윤리={result['immoral_score']}, 스팸={result['spam_score']}")
+            except Exception as extract_error:
+                print(f"[ERROR] 수동 추출도 실패: {extract_error}")
+                result = {
+                    'immoral_score': 0,
+                    'spam_score': 0,
+                    'confidence': 50,
+                    'types': [],
+                    'has_text': False,
+                    'extracted_text': ''
+                }
+        
+        # 차단 여부 추가
+        result['is_blocked'] = self._should_block(result)
+        
+        return result
+    
+    @staticmethod
+    def _error_result() -> Dict:
+        """분석 실패 시 기본 결과"""
+        return {
+            'immoral_score': 0,
+            'spam_score': 0,
+            'confidence': 0,
+            'types': [],
+            'has_text': False,
+            'extracted_text': '',
+            'is_blocked': False
+        }
     
     def _should_block(self, result: Dict) -> bool:
         """
@@ -203,16 +287,12 @@ Response format:
         confidence = result.get('confidence', 0)
         
         # 차단 기준 (텍스트 필터와 동일)
-        if immoral_score >= 80 and confidence >= 80:
-            return True
-        
-        if immoral_score >= 90 and confidence >= 70:
-            return True
-        
-        if spam_score >= 70 and confidence >= 70:
-            return True
-        
-        return False
+        # 비윤리 80+/신뢰도 80+, 비윤리 90+/신뢰도 70+, 스팸 70+/신뢰도 70+ 중 하나
+        return confidence >= 70 and (
+            spam_score >= 70
+            or immoral_score >= 90
+            or (immoral_score >= 80 and confidence >= 80)
+        )
     
     def should_block_image(self, analysis_result: Dict) -> Tuple[bool, str]:
         """
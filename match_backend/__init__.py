@@ -2,11 +2,13 @@
 WMAA (신고글과 신고유형 일치 여부 확인 시스템) 백엔드 모듈
 """
 
-from .core import analyze_with_ai, save_report_to_db, load_reports_db, save_reports_db
+from .core import analyze_with_ai, analyze_batch, save_report_to_db, bulk_save_reports, load_reports_db, save_reports_db
 
 __all__ = [
     'analyze_with_ai',
+    'analyze_batch',
     'save_report_to_db',
+    'bulk_save_reports',
     'load_reports_db',
     'save_reports_db',
 ]
@@ -0,0 +1,30 @@
+"""
+WMAA 설정
+- 환경 변수 파일은 이 모듈에서 한 번만 로드
+- core.py / database.py는 여기서 설정 값을 가져다 사용
+"""
+
+import os
+from dotenv import load_dotenv
+
+# 환경 변수 로드: 프로젝트 .env → WMAA 전용 match_config.env 순서
+# (먼저 설정된 값은 덮어쓰지 않음)
+load_dotenv()
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', 'match_config.env'))
+
+# MySQL 연결 설정
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': int(os.getenv('DB_PORT', '3306')),
+    'user': os.getenv('DB_USER', 'root'),
+    'password': os.getenv('DB_PASSWORD', ''),
+    'database': os.getenv('DB_NAME', 'wmai_db'),
+    'charset': 'utf8mb4',
+    'autocommit': True
+}
+
+# 대시보드 통계 캐시용 Redis
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# AI 분석 결과 캐시 정책 (core.AI_CACHE_POLICY 참고)
+AI_CACHE_POLICY = os.getenv('MATCH_AI_CACHE_POLICY', 'enabled').lower()
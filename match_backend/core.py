@@ -4,20 +4,294 @@ WMAA 핵심 비즈니스 로직
 - 데이터베이스 처리
 """
 
+import asyncio
+import hashlib
 import os
 import json
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional
-from dotenv import load_dotenv
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from . import config
 from .database import db_manager
 
-# 환경 변수 로드 (프로젝트 루트의 match_config.env 파일)
-env_path = os.path.join(os.path.dirname(__file__), '..', 'match_config.env')
-load_dotenv(env_path)
+# OpenAI 호출 실패(네트워크/인증/한도 등)만 잡기 위한 예외 타입
+try:
+    from openai import OpenAIError
+except ImportError:
+    OpenAIError = Exception
+
+# Redis가 있으면 대시보드 통계 캐시에 사용 (없으면 매번 MySQL 조회)
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# orjson이 있으면 AI 응답/요청 JSON 처리에 사용 (없으면 표준 json)
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> str:
+        # orjson과 같은 compact 출력 (구분자 공백 제거)
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+# 환경 변수(match_config.env 등)는 config 모듈 import 시 한 번만 로드됨
+
+
+_API_KEY_PLACEHOLDER = 'your-api-key-here'
+
+
+def _read_api_key() -> Optional[str]:
+    """환경 변수의 OpenAI API 키 (없거나 예시 값이면 None)"""
+    api_key = os.getenv('OPENAI_API_KEY', '')
+    if not api_key or api_key == _API_KEY_PLACEHOLDER:
+        return None
+    return api_key
+
+
+# OpenAI API 키 (import 시 검증, 없으면 최초 분석 때 다시 확인 — 게시판 라우터가 실행 중에 설정하는 경우)
+_api_key: Optional[str] = _read_api_key()
+
+# OpenAI 클라이언트 (최초 분석 시 생성)
+_client = None
+_async_client = None
+
+# 기본 신고자(fastapi_user) ID 캐시
+_reporter_id: Optional[int] = None
+
+# load_reports_db 결과 캐시
+# (monotonic 시각, 신고 목록, {id: 신고}, {status: [신고]}, {priority: [신고]})
+# 게시판 신고 처리 등 다른 경로에서도 report 테이블을 갱신하므로 짧은 TTL로 만료
+REPORTS_CACHE_TTL = 5.0
+_ReportsCache = Tuple[float, List[Dict], Dict[int, Dict], Dict[str, List[Dict]], Dict[str, List[Dict]]]
+_reports_cache: Optional[_ReportsCache] = None
+# 만료 시 동시에 들어온 요청(asyncio.to_thread 스레드)들이 전체 조회를 한 번만 하도록 직렬화
+_reports_cache_lock = threading.Lock()
+# invalidate_reports_cache() 호출 횟수 — 조회 도중 폐기되면 그 결과는 캐시하지 않음
+_reports_cache_generation = 0
+
+# 대시보드 통계 Redis 캐시 (관리자 화면이 자주 폴링하지만 값은 천천히 바뀜)
+DASHBOARD_STATS_CACHE_KEY = 'match:dashboard_stats'
+DASHBOARD_STATS_TTL = 30  # 초
+_redis_client = None
+_redis_checked = False
+
+# AI 분석 결과 디스크 캐시 (같은 게시글/신고 사유 재분석 시 API 호출 생략)
+AI_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '.cache', 'match_ai')
+AI_CACHE_TTL = 30 * 24 * 3600  # 30일
+# 모델/프롬프트를 바꾸면 버전을 올려 이전 캐시를 무효화
+AI_CACHE_VERSION = "gpt-4o-mini:v3"
+# 디스크 캐시 앞단의 메모리 LRU 캐시 크기 (최근 결과는 파일을 열지 않고 반환)
+AI_MEMORY_CACHE_SIZE = 512
+# 캐시 정책 (MATCH_AI_CACHE_POLICY)
+# - enabled: 읽기/쓰기 (기본값)
+# - readonly: 읽기만, 새 결과는 저장하지 않음
+# - replay: 캐시에 있는 결과만 사용, 없으면 API를 호출하지 않고 오류
+# - disabled: 캐시를 사용하지 않음
+AI_CACHE_POLICY = config.AI_CACHE_POLICY
+_ai_memory_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+_ai_memory_lock = threading.Lock()
+
+# 캐시 키 정규화용 (연속 공백/줄바꿈)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# AI 응답 파싱 패턴 ('점수: 85', '분석: ...' — 분석은 이후 전체 텍스트)
+_SCORE_RE = re.compile(r'(?:점수|score)\s*[:：]\s*(\d+)', re.IGNORECASE)
+_ANALYSIS_RE = re.compile(r'(?:분석|analysis)\s*[:：]\s*(.+)', re.IGNORECASE | re.DOTALL)
+# 스트리밍 중 JSON 응답의 점수 조기 추출 (숫자 뒤 구분자까지 도착해야 확정)
+_STREAM_SCORE_RE = re.compile(r'"score"\s*:\s*(\d+)\s*[,}]')
+# 이 길이까지 점수가 나오지 않으면 조기 추출을 포기 (최종 파싱 결과만 사용)
+_STREAM_SCORE_PROBE_CHARS = 200
+
+# AI 점수 부여 기준 (단건/배치 프롬프트 공용)
+SCORE_CRITERIA = """## 점수 부여 기준 (중요!)
+- 81-100점: 신고 사유가 게시글과 명확하게 일치함. 즉시 삭제해야 할 명백한 위반
+- 61-80점: 신고 사유가 게시글과 높은 확률로 일치함. 검토 후 삭제 필요  
+- 31-60점: 신고 사유와 일부 관련성이 있으나 판단이 애매함. 관리자 검토 필요
+- 11-30점: 신고 사유와 관련성이 낮음. 대부분 문제 없음
+- 0-10점: 신고 사유가 게시글과 전혀 관련 없음. 오신고로 판단
+"""
+
+# 프롬프트는 고정된 system 메시지(지시문 + 점수 기준)를 앞에 두고 게시글/신고 내용만 user 메시지로 보냄
+# (요청마다 같은 접두부가 반복되므로 OpenAI 프롬프트 캐시가 적용될 수 있음)
+_SYSTEM_PROMPT = f"""다음 게시글과 신고 내용을 분석하여 일치 여부를 정확하게 판단해주세요.
+
+{SCORE_CRITERIA}
+다음 JSON 형식으로만 응답해주세요:
+{{"score": 위 기준에 따른 0-100 사이의 정수, "analysis": "판단 내용과 상세한 분석 근거"}}
+"""
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# 배치 분석용 system 메시지 (user 메시지에는 신고 목록 JSON만 들어감)
+_BATCH_SYSTEM_PROMPT = f"""다음 신고 목록의 각 항목에 대해 게시글(post)과 신고 내용(reason)의 일치 여부를 정확하게 판단해주세요.
+
+{SCORE_CRITERIA}
+모든 id에 대해 하나씩, 다음 JSON 형식으로만 응답해주세요:
+{{"results": [{{"id": 0, "score": 0-100 사이의 정수, "analysis": "상세한 분석 내용과 근거"}}]}}
+"""
+_BATCH_SYSTEM_MSG = {"role": "system", "content": _BATCH_SYSTEM_PROMPT}
+
+# 판정 결과 → CSS 클래스
+_CSS_CLASS = {
+    "일치": "result-match",
+    "불일치": "result-mismatch",
+    "부분일치": "result-partial",
+}
+
+# 판정 결과 → (status, post_status, post_action, priority, processing_note)
+_ACTION_TABLE = {
+    '일치': ('completed', 'deleted', 'delete', 'high', 'AI 자동 처리: 신고 내용과 일치하여 게시글 삭제'),
+    '불일치': ('rejected', 'approved', 'keep', 'low', 'AI 자동 처리: 신고 내용과 불일치하여 게시글 유지'),
+    '부분일치': ('pending', 'pending_review', 'none', 'normal', None),
+}
+
+# 판정 결과 → report_analysis.result (MySQL enum)
+_MYSQL_RESULT = {
+    '일치': 'match',
+    '부분일치': 'partial_match',
+    '불일치': 'mismatch',
+}
+# report_analysis.result → 판정 결과
+_RESULT_LABEL = {mysql_result: result_type for result_type, mysql_result in _MYSQL_RESULT.items()}
+
+# post_action → 상세/필터 조회에 표시하는 안내 문구 (그 외 값은 None)
+_POST_ACTION_MESSAGE = {
+    'delete': '게시글이 자동 삭제되었습니다.',
+    'keep': '게시글이 자동 유지되었습니다.',
+}
+# 같은 변환을 SQL에서 수행하는 CASE 식 (상세/필터 조회 SELECT에 사용, 상수만 포함)
+_POST_ACTION_MESSAGE_SQL = "CASE r.post_action {} END".format(
+    " ".join(f"WHEN '{action}' THEN '{message}'" for action, message in _POST_ACTION_MESSAGE.items())
+)
+
+# 관리자 처리 상태 → (post_status, post_action)
+# completed: 승인 (신고 유효 -> 게시글 삭제), rejected: 반려 (신고 무효 -> 게시글 유지)
+_POST_STATE_BY_STATUS = {
+    'completed': ('deleted', 'delete'),
+    'rejected': ('approved', 'keep'),
+}
+
+
+def invalidate_reports_cache() -> None:
+    """load_reports_db 캐시와 대시보드 통계 캐시 폐기 (신고 저장/상태 변경 후 호출)"""
+    global _reports_cache, _reports_cache_generation
+    _reports_cache_generation += 1
+    _reports_cache = None
+    
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.delete(DASHBOARD_STATS_CACHE_KEY)
+        except Exception as e:
+            print(f"[WARN] 대시보드 통계 캐시 삭제 실패: {e}")
+
+
+def _get_redis():
+    """
+    Redis 클라이언트 (최초 호출 시 한 번만 연결 확인, 연결 실패 시 None — 캐시 없이 동작)
+    """
+    global _redis_client, _redis_checked
+    if _redis_checked:
+        return _redis_client
+    _redis_checked = True
+    
+    if not REDIS_AVAILABLE:
+        return None
+    redis_url = config.REDIS_URL
+    try:
+        client = redis.from_url(redis_url, socket_connect_timeout=1, socket_timeout=1)
+        client.ping()
+        _redis_client = client
+    except Exception as e:
+        print(f"[WARN] Redis 연결 실패 ({redis_url}) - 대시보드 통계 캐시 없이 실행: {e}")
+    return _redis_client
 
 
 def load_reports_db() -> List[Dict]:
-    """MySQL에서 신고 데이터 로드"""
+    """
+    MySQL에서 신고 데이터 전체 로드
+    REPORTS_CACHE_TTL초 동안은 직전 결과를 재사용합니다 (반환 리스트는 수정하지 말 것).
+    
+    신고 수에 비례해 조회/메모리 비용이 커지므로, 전체 목록이 꼭 필요한 경우가 아니면
+    get_reports_with_filters(limit, offset)로 페이지 단위 조회를 사용할 것
+    """
+    cached = _load_reports_cache()
+    return cached[1] if cached is not None else []
+
+
+def list_reports_by_status(status: str) -> List[Dict]:
+    """
+    특정 처리 상태(pending, completed, rejected)의 신고 목록
+    load_reports_db 캐시의 상태별 인덱스를 사용하므로 전체 목록을 훑지 않습니다 (반환 리스트는 수정하지 말 것).
+    """
+    cached = _load_reports_cache()
+    return cached[3].get(status, []) if cached is not None else []
+
+
+def list_reports_by_priority(priority: str) -> List[Dict]:
+    """특정 우선순위(high, normal, low)의 신고 목록 (list_reports_by_status와 같은 방식)"""
+    cached = _load_reports_cache()
+    return cached[4].get(priority, []) if cached is not None else []
+
+
+def _load_reports_cache() -> Optional[_ReportsCache]:
+    """유효한 캐시를 반환하고, 만료됐으면 다시 조회하여 인덱스와 함께 캐시 (조회 실패 시 None)"""
+    global _reports_cache
+    cached = _fresh_reports_cache()
+    if cached is not None:
+        return cached
+    
+    with _reports_cache_lock:
+        # 락을 기다리는 동안 다른 스레드가 다시 채웠으면 그 결과 사용
+        cached = _fresh_reports_cache()
+        if cached is not None:
+            return cached
+        
+        generation = _reports_cache_generation
+        reports = _query_all_reports()
+        if reports is None:
+            return None
+        
+        cached = _index_reports(reports)
+        if generation == _reports_cache_generation:
+            _reports_cache = cached
+        return cached
+
+
+def _index_reports(reports: List[Dict]) -> _ReportsCache:
+    """신고 목록 → 캐시 항목 (id / status / priority 인덱스 포함)"""
+    by_id = {}
+    by_status = {}
+    by_priority = {}
+    for report in reports:
+        by_id[report['id']] = report
+        by_status.setdefault(report['status'], []).append(report)
+        by_priority.setdefault(report['priority'], []).append(report)
+    
+    return (time.monotonic(), reports, by_id, by_status, by_priority)
+
+
+def _fresh_reports_cache() -> Optional[_ReportsCache]:
+    """만료되지 않은 load_reports_db 캐시 (없으면 None)"""
+    cached = _reports_cache
+    if cached is not None and time.monotonic() - cached[0] < REPORTS_CACHE_TTL:
+        return cached
+    return None
+
+
+def _query_all_reports() -> Optional[List[Dict]]:
+    """전체 신고 조회 (오류 시 None)"""
     try:
         query = """
         SELECT 
@@ -49,47 +323,44 @@ def load_reports_db() -> List[Dict]:
         
         results = db_manager.execute_query(query)
         
-        # MySQL 결과를 기존 JSON 형식으로 변환
-        reports = []
-        for row in results:
-            report = {
-                'id': row['id'],
-                'reportDate': row['reportDate'].isoformat() if row['reportDate'] else None,
-                'reportType': row['reportType'],
-                'reportedContent': row['reportedContent'],
-                'reportReason': row['reportReason'],
-                'reporterId': row['reporterId'] or 'unknown',
-                'status': row['status'],
-                'priority': row['priority'],
-                'assignedTo': row['assignedTo'],
-                'processedDate': row['processedDate'].isoformat() if row['processedDate'] else None,
-                'processingNote': row['processingNote'],
-                'postStatus': row['postStatus'],
-                'postAction': row['postAction']
-            }
-            
-            # AI 분석 결과가 있으면 추가
-            if row['result']:
-                # MySQL enum을 한글로 변환
-                result_mapping = {
-                    'match': '일치',
-                    'partial_match': '부분일치',
-                    'mismatch': '불일치'
-                }
-                
-                report['aiAnalysis'] = {
-                    'result': result_mapping.get(row['result'], row['result']),
-                    'confidence': row['confidence'],
-                    'analysis': row['analysis']
-                }
-            
-            reports.append(report)
-        
-        return reports
+        # MySQL 결과를 기존 JSON 형식으로 변환 (목록은 postAction 원본 값 유지)
+        return list(map(_row_to_report, results))
         
     except Exception as e:
         print(f"데이터 로드 오류: {e}")
-        return []
+        return None
+
+
+def _row_to_report(row: Dict) -> Dict:
+    """신고 조회 결과 행 → 신고 딕셔너리 (기존 JSON 형식, postAction은 SELECT 결과 그대로)"""
+    report_date = row['reportDate']
+    processed_date = row['processedDate']
+    report = {
+        'id': row['id'],
+        'reportDate': report_date.isoformat() if report_date else None,
+        'reportType': row['reportType'],
+        'reportedContent': row['reportedContent'],
+        'reportReason': row['reportReason'],
+        'reporterId': row['reporterId'] or 'unknown',
+        'status': row['status'],
+        'priority': row['priority'],
+        'assignedTo': row['assignedTo'],
+        'processedDate': processed_date.isoformat() if processed_date else None,
+        'processingNote': row['processingNote'],
+        'postStatus': row['postStatus'],
+        'postAction': row['postAction']
+    }
+    
+    # AI 분석 결과가 있으면 추가 (MySQL enum을 한글로 변환)
+    result = row['result']
+    if result:
+        report['aiAnalysis'] = {
+            'result': _RESULT_LABEL.get(result, result),
+            'confidence': row['confidence'],
+            'analysis': row['analysis']
+        }
+    
+    return report
 
 
 def save_reports_db(reports: List[Dict]) -> None:
@@ -110,226 +381,691 @@ def analyze_with_ai(post: str, reason: str) -> Dict:
         분석 결과 딕셔너리 (score, type, css_class, analysis)
     """
     
-    prompt = f"""
-다음 게시글과 신고 내용을 분석하여 일치 여부를 정확하게 판단해주세요.
-
-게시글:
-{post}
-
-신고 내용:
-{reason}
-
-## 점수 부여 기준 (중요!)
-- 81-100점: 신고 사유가 게시글과 명확하게 일치함. 즉시 삭제해야 할 명백한 위반
-- 61-80점: 신고 사유가 게시글과 높은 확률로 일치함. 검토 후 삭제 필요  
-- 31-60점: 신고 사유와 일부 관련성이 있으나 판단이 애매함. 관리자 검토 필요
-- 11-30점: 신고 사유와 관련성이 낮음. 대부분 문제 없음
-- 0-10점: 신고 사유가 게시글과 전혀 관련 없음. 오신고로 판단
-
-다음 형식으로 정확히 응답해주세요:
-점수: [위 기준에 따라 0-100 사이의 숫자만 입력]
-판단: [판단 내용 - 점수만 참고하고 여기는 자유롭게 작성]
-분석: [상세한 분석 내용과 근거]
-"""
+    cached = _ai_cache_get(post, reason)
+    if cached is not None:
+        return cached
+    
+    _ai_cache_require_live()
+    messages = _build_messages(post, reason)
+    client = _get_client()
     
     try:
-        # API 키 확인
-        api_key = os.getenv('OPENAI_API_KEY', '')
-        if not api_key or api_key == 'your-api-key-here':
-            raise Exception("OpenAI API 키가 설정되지 않았습니다. match_config.env 파일에 실제 API 키를 입력하세요.")
-        
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
-
         response = client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0
+            messages=messages,
+            temperature=0,
+            response_format={"type": "json_object"}
         )
+    except OpenAIError as e:
+        raise Exception(f"분석 중 오류가 발생했습니다: {str(e)}")
+    
+    # AI 응답 파싱 (JSON이 아니어도 예외 없이 기본값으로 처리)
+    result, parsed_ok = _parse_ai_response(response.choices[0].message.content or "")
+    
+    # 빈 응답/파싱 실패로 만든 대체 결과는 캐시하지 않음 (다음 호출에서 다시 분석)
+    if parsed_ok:
+        _ai_cache_put(post, reason, result)
+    return result
 
-        # AI 응답 파싱
-        ai_response = response.choices[0].message.content
-        
-        # 응답에서 점수, 판단, 분석 추출
-        lines = ai_response.strip().split('\n')
-        score = 0
-        result_type = "부분일치"
-        analysis = ai_response
+
+async def analyze_with_ai_async(post: str, reason: str, semaphore: Optional[asyncio.Semaphore] = None) -> Dict:
+    """
+    analyze_with_ai의 비동기 버전 (AsyncOpenAI 사용, 이벤트 루프를 막지 않음)
+    
+    Args:
+        post: 신고된 게시글 내용
+        reason: 신고 사유
+        semaphore: 동시 요청 수 제한용 세마포어 (없으면 제한 없음)
         
-        for line in lines:
-            if '점수:' in line or 'score:' in line.lower():
-                try:
-                    score = int(''.join(filter(str.isdigit, line)))
-                except:
-                    score = 50
-            elif '판단:' in line or 'result:' in line.lower():
-                # 판단 텍스트는 분석 내용으로만 사용 (실제 판정은 아래에서 점수 기반 결정)
-                pass
-            elif '분석:' in line or 'analysis:' in line.lower():
-                analysis = line.split(':', 1)[1].strip() if ':' in line else ai_response
-        
-        # 점수 기반 자동 판정 (30-80점 부분일치)
-        if score >= 81:
-            result_type = "일치"
-        elif score <= 29:
-            result_type = "불일치"
-        else:  # 30-80점
-            result_type = "부분일치"
-        
-        # CSS 클래스 결정
-        if result_type == "일치":
-            css_class = "result-match"
-        elif result_type == "불일치":
-            css_class = "result-mismatch"
+    Returns:
+        분석 결과 딕셔너리 (score, type, css_class, analysis)
+    """
+    cached = _ai_cache_get(post, reason)
+    if cached is not None:
+        return cached
+    
+    _ai_cache_require_live()
+    messages = _build_messages(post, reason)
+    client = _get_async_client()
+    
+    try:
+        request = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0,
+            response_format={"type": "json_object"}
+        )
+        if semaphore is None:
+            response = await request
         else:
-            css_class = "result-partial"
-        
-        return {
-            "score": score,
-            "type": result_type,
-            "css_class": css_class,
-            "analysis": analysis
-        }
-        
-    except Exception as e:
+            async with semaphore:
+                response = await request
+    except OpenAIError as e:
         raise Exception(f"분석 중 오류가 발생했습니다: {str(e)}")
+    
+    result, parsed_ok = _parse_ai_response(response.choices[0].message.content or "")
+    
+    if parsed_ok:
+        _ai_cache_put(post, reason, result)
+    return result
 
 
-def save_report_to_db(post_content: str, reason: str, ai_result: Dict) -> Dict:
+async def analyze_many_async(items: List[Tuple[str, str]], concurrency: int = 8) -> List[Dict]:
     """
-    신고를 MySQL 데이터베이스에 저장
+    여러 (게시글, 신고 사유) 쌍을 동시에 분석합니다 (RPM/TPM 한도를 고려해 동시 요청 수 제한).
     
     Args:
-        post_content: 게시글 내용
+        items: (post, reason) 튜플 리스트
+        concurrency: 동시에 진행할 최대 API 요청 수
+        
+    Returns:
+        items와 같은 순서의 분석 결과 리스트
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(analyze_with_ai_async(post, reason, semaphore) for post, reason in items)
+    )
+
+
+class _AnalyzeBatcher:
+    """
+    짧은 시간 안에 들어온 개별 분석 요청을 모아 한 번의 OpenAI 호출로 분석하는 마이크로 배처
+    - 첫 요청 후 window초가 지나거나 max_items개가 모이면 전송
+    - 모인 요청이 1개면 일반 단일 분석, 일괄 분석이 실패하면 항목별 단일 분석으로 재시도
+    """
+    
+    def __init__(self, window: float, max_items: int):
+        self.window = window
+        self.max_items = max_items
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # 이벤트 루프는 태스크를 약한 참조로만 들고 있으므로 끝날 때까지 여기서 참조 유지
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, post: str, reason: str) -> Dict:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((post, reason, future))
+        
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+    
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        items = [(post, reason) for post, reason, _ in batch]
+        try:
+            if len(items) == 1:
+                results = [await analyze_with_ai_async(*items[0])]
+            else:
+                try:
+                    results = await _analyze_batch_chunk_async(items)
+                except Exception as e:
+                    print(f"[WARN] 일괄 분석 실패, 개별 분석으로 재시도: {e}")
+                    results = await asyncio.gather(
+                        *(analyze_with_ai_async(post, reason) for post, reason in items),
+                        return_exceptions=True
+                    )
+                else:
+                    for (post, reason), result in zip(items, results):
+                        _ai_cache_put(post, reason, result)
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+# /analyze 요청 마이크로 배칭 설정
+AI_MICROBATCH_WINDOW = 0.05  # 초
+AI_MICROBATCH_MAX_ITEMS = 8
+_analyze_batcher = _AnalyzeBatcher(AI_MICROBATCH_WINDOW, AI_MICROBATCH_MAX_ITEMS)
+
+
+async def analyze_with_ai_batched(post: str, reason: str) -> Dict:
+    """
+    analyze_with_ai_async와 같지만, 동시에 들어온 다른 요청과 묶어 한 번의 API 호출로 분석
+    (부하가 몰릴 때 요청 수/프롬프트 오버헤드 감소, 대신 최대 AI_MICROBATCH_WINDOW초 대기)
+    
+    Args:
+        post: 신고된 게시글 내용
         reason: 신고 사유
-        ai_result: AI 분석 결과
         
     Returns:
-        저장된 신고 데이터
+        분석 결과 딕셔너리 (score, type, css_class, analysis)
     """
+    cached = _ai_cache_get(post, reason)
+    if cached is not None:
+        return cached
+    
+    _ai_cache_require_live()
+    return await _analyze_batcher.submit(post, reason)
+
+
+async def analyze_with_ai_stream(post: str, reason: str) -> AsyncIterator[Dict]:
+    """
+    analyze_with_ai_async의 스트리밍 버전 (응답 토큰을 받는 대로 점수를 먼저 알려줌)
+    
+    Args:
+        post: 신고된 게시글 내용
+        reason: 신고 사유
+        
+    Yields:
+        {"event": "score", "score", "type"}: 점수가 확정되는 즉시 (최대 한 번)
+        {"event": "result", "result": 분석 결과 딕셔너리}: 응답 완료 후 마지막에 한 번
+    """
+    cached = _ai_cache_get(post, reason)
+    if cached is not None:
+        yield {"event": "result", "result": cached}
+        return
+    
+    _ai_cache_require_live()
+    messages = _build_messages(post, reason)
+    client = _get_async_client()
+    
     try:
-        if not ai_result:
-            raise Exception("AI 분석 결과가 없어 처리할 수 없습니다.")
-            
-        result_type = ai_result.get('type', '부분일치')
-        confidence = ai_result.get('score', 50)
+        stream = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0,
+            response_format={"type": "json_object"},
+            stream=True
+        )
         
-        # 결과에 따른 상태 설정
-        if result_type == '일치':
-            status = 'completed'
-            post_status = 'deleted'
-            post_action = 'delete'
-            priority = 'high'
-            processing_note = 'AI 자동 처리: 신고 내용과 일치하여 게시글 삭제'
+        parts = []
+        probing = True
+        buffered = ""
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
             
-        elif result_type == '불일치':
-            status = 'rejected'
-            post_status = 'approved'
-            post_action = 'keep'
-            priority = 'low'
-            processing_note = 'AI 자동 처리: 신고 내용과 불일치하여 게시글 유지'
-            
-        else:  # 부분일치
-            status = 'pending'
-            post_status = 'pending_review'
-            post_action = 'none'
-            priority = 'normal'
-            processing_note = None
-        
-        # 기본 사용자 ID 가져오기 (fastapi_user가 없으면 생성)
-        user_query = "SELECT id FROM users WHERE username = 'fastapi_user'"
-        user_result = db_manager.execute_query(user_query)
-        
-        if not user_result:
-            # fastapi_user 생성
-            insert_user_query = """
-            INSERT INTO users (username, password, role) 
-            VALUES ('fastapi_user', 'temp_password', 'user')
-            """
-            reporter_id = db_manager.execute_insert(insert_user_query)
-        else:
-            reporter_id = user_result[0]['id']
+            if probing:
+                buffered += delta
+                score_match = _STREAM_SCORE_RE.search(buffered)
+                if score_match:
+                    probing = False
+                    early = _build_ai_result(min(int(score_match.group(1)), 100), "")
+                    yield {"event": "score", "score": early["score"], "type": early["type"]}
+                elif len(buffered) > _STREAM_SCORE_PROBE_CHARS:
+                    probing = False
+        
+    except OpenAIError as e:
+        raise Exception(f"분석 중 오류가 발생했습니다: {str(e)}")
+    
+    result, parsed_ok = _parse_ai_response("".join(parts))
+    if parsed_ok:
+        _ai_cache_put(post, reason, result)
+    yield {"event": "result", "result": result}
+
+
+def _ai_cache_key(post: str, reason: str) -> str:
+    """
+    (게시글, 신고 사유)의 캐시 키
+    공백/줄바꿈 차이만 있는 같은 글은 같은 키가 되도록 연속 공백을 하나로 합치고 앞뒤 공백 제거
+    """
+    post = _WHITESPACE_RE.sub(' ', post).strip()
+    reason = _WHITESPACE_RE.sub(' ', reason).strip()
+    return hashlib.blake2b(
+        f"{AI_CACHE_VERSION}\0{post}\0{reason}".encode('utf-8'), digest_size=16
+    ).hexdigest()
+
+
+def _ai_cache_path(post: str, reason: str) -> str:
+    """(게시글, 신고 사유)의 캐시 파일 경로"""
+    return os.path.join(AI_CACHE_DIR, f"{_ai_cache_key(post, reason)}.json")
+
+
+def _ai_cache_get(post: str, reason: str) -> Optional[Dict]:
+    """캐시된 분석 결과 (메모리 → 디스크 순으로 확인, 없거나 TTL이 지났으면 None)"""
+    if AI_CACHE_POLICY == 'disabled':
+        return None
+    
+    key = _ai_cache_key(post, reason)
+    with _ai_memory_lock:
+        entry = _ai_memory_cache.get(key)
+        if entry is not None:
+            _ai_memory_cache.move_to_end(key)
+    if entry is not None and time.time() - entry[0] <= AI_CACHE_TTL:
+        return dict(entry[1])
+    
+    path = os.path.join(AI_CACHE_DIR, f"{key}.json")
+    try:
+        mtime = os.path.getmtime(path)
+        if time.time() - mtime > AI_CACHE_TTL:
+            return None
+        with open(path, 'rb') as f:
+            result = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    
+    _ai_memory_put(key, mtime, result)
+    return result
+
+
+def _ai_memory_put(key: str, created: float, result: Dict) -> None:
+    """메모리 LRU 캐시에 저장 (가장 오래 사용하지 않은 항목부터 제거)"""
+    with _ai_memory_lock:
+        _ai_memory_cache[key] = (created, dict(result))
+        _ai_memory_cache.move_to_end(key)
+        while len(_ai_memory_cache) > AI_MEMORY_CACHE_SIZE:
+            _ai_memory_cache.popitem(last=False)
+
+
+def _ai_cache_require_live() -> None:
+    """replay 정책에서는 캐시에 없는 분석을 API로 보내지 않음"""
+    if AI_CACHE_POLICY == 'replay':
+        raise Exception("AI 캐시 replay 모드입니다: 캐시에 없는 분석은 수행하지 않습니다.")
+
+
+def _ai_cache_put(post: str, reason: str, result: Dict) -> None:
+    """분석 결과를 캐시에 저장 (임시 파일에 쓴 뒤 교체하여 반쯤 쓰인 파일이 읽히지 않도록 함)"""
+    if AI_CACHE_POLICY != 'enabled':
+        return
+    
+    _ai_memory_put(_ai_cache_key(post, reason), time.time(), result)
+    try:
+        os.makedirs(AI_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=AI_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(result))
+            os.replace(tmp_path, _ai_cache_path(post, reason))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"AI 분석 캐시 저장 실패: {e}")
+
+
+def _get_api_key() -> str:
+    """OpenAI API 키 반환 (검증된 키는 캐시, 설정되지 않았으면 예외)"""
+    global _api_key
+    if _api_key is None:
+        _api_key = _read_api_key()
+        if _api_key is None:
+            raise Exception("OpenAI API 키가 설정되지 않았습니다. match_config.env 파일에 실제 API 키를 입력하세요.")
+    return _api_key
+
+
+def _get_client():
+    """OpenAI 클라이언트 싱글톤 (httpx 연결 풀/TLS 세션을 호출 간 재사용)"""
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI(api_key=_get_api_key())
+    return _client
+
+
+def _get_async_client():
+    """AsyncOpenAI 클라이언트 싱글톤 (연결 풀을 요청 간 재사용)"""
+    global _async_client
+    if _async_client is None:
+        from openai import AsyncOpenAI
+        _async_client = AsyncOpenAI(api_key=_get_api_key())
+    return _async_client
+
+
+def _build_messages(post: str, reason: str) -> List[Dict]:
+    """단건 분석 메시지 (고정 system 메시지 + 게시글/신고 내용 user 메시지)"""
+    return [
+        _SYSTEM_MSG,
+        {"role": "user", "content": "".join(("게시글:\n", post, "\n\n신고 내용:\n", reason))}
+    ]
+
+
+# NOTE: 파싱은 문자열 처리뿐이라 Numba(@njit)로 컴파일하지 말 것 — str 연산은 object 모드로
+#       떨어져 오히려 느려짐. JSON 파서(orjson)와 미리 컴파일한 정규식(C 구현)이 이미 네이티브 경로임
+def _parse_ai_response(ai_response: str) -> Tuple[Dict, bool]:
+    """
+    JSON({"score", "analysis"}) 형식의 AI 응답 → (분석 결과 딕셔너리, JSON 파싱 성공 여부)
+    
+    파싱 성공 여부가 False인 결과(빈 응답/텍스트 추출/중간값 대체)는 캐시하지 않음
+    """
+    try:
+        data = _json_loads(ai_response)
+        score = max(0, min(100, int(data["score"])))
+        return _build_ai_result(score, str(data.get("analysis", ""))), True
+    except (ValueError, KeyError, TypeError):
+        pass
+    
+    # JSON이 아니면 '점수:/분석:' 텍스트에서 추출 (판단 텍스트는 사용하지 않음 — 판정은 점수 기반)
+    score_match = _SCORE_RE.search(ai_response)
+    analysis_match = _ANALYSIS_RE.search(ai_response)
+    
+    # 점수를 찾지 못하면 중간값(부분일치 → 관리자 검토)으로 처리
+    score = min(int(score_match.group(1)), 100) if score_match else 50
+    analysis = analysis_match.group(1).strip() if analysis_match else ai_response
+    
+    return _build_ai_result(score, analysis), False
+
+
+def _build_ai_result(score: int, analysis: str) -> Dict:
+    """점수 기반 자동 판정 결과 딕셔너리 (score, type, css_class, analysis)"""
+    # 점수 기반 자동 판정 (30-80점 부분일치)
+    if score >= 81:
+        result_type = "일치"
+    elif score <= 29:
+        result_type = "불일치"
+    else:  # 30-80점
+        result_type = "부분일치"
+    
+    return {
+        "score": score,
+        "type": result_type,
+        "css_class": _CSS_CLASS[result_type],
+        "analysis": analysis
+    }
+
+
+def analyze_batch(items: List[Tuple[str, str]], batch_size: int = 10) -> List[Dict]:
+    """
+    여러 (게시글, 신고 사유) 쌍을 batch_size개씩 묶어 한 번의 OpenAI 호출로 분석합니다.
+    
+    Args:
+        items: (post, reason) 튜플 리스트
+        batch_size: 한 번의 API 호출에 담을 최대 신고 수
         
-        # report 테이블에 신고 저장
-        insert_report_query = """
-        INSERT INTO report (
-            report_date, report_type, reported_content, report_reason, 
-            reporter_id, status, priority, assigned_to, processed_date, 
-            processing_note, post_status, post_action
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+    Returns:
+        items와 같은 순서의 분석 결과 리스트 (analyze_with_ai와 같은 형식)
+    """
+    results: List[Optional[Dict]] = [_ai_cache_get(post, reason) for post, reason in items]
+    pending = [i for i, result in enumerate(results) if result is None]
+    
+    # 캐시에 없는 항목만 batch_size개씩 API로 분석
+    for start in range(0, len(pending), batch_size):
+        chunk = pending[start:start + batch_size]
+        chunk_results = _analyze_batch_chunk([items[i] for i in chunk])
+        for i, result in zip(chunk, chunk_results):
+            _ai_cache_put(items[i][0], items[i][1], result)
+            results[i] = result
+    return results
+
+
+def _analyze_batch_chunk(items: List[Tuple[str, str]]) -> List[Dict]:
+    """analyze_batch의 단일 API 호출 단위"""
+    if not items:
+        return []
+    _ai_cache_require_live()
+    
+    try:
+        client = _get_client()
+        
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=_build_batch_messages(items),
+            temperature=0,
+            response_format={"type": "json_object"}
         )
-        """
         
-        processed_date = datetime.now() if result_type != '부분일치' else None
-        assigned_to = None  # AI_System은 실제 사용자가 아니므로 NULL
+        return _parse_batch_response(response.choices[0].message.content, len(items))
         
-        report_params = (
-            datetime.now(),
-            reason,
-            post_content,
-            reason,
-            reporter_id,
-            status,
-            priority,
-            assigned_to,
-            processed_date,
-            processing_note,
-            post_status,
-            post_action
-        )
+    except Exception as e:
+        raise Exception(f"분석 중 오류가 발생했습니다: {str(e)}")
+
+
+async def _analyze_batch_chunk_async(items: List[Tuple[str, str]]) -> List[Dict]:
+    """_analyze_batch_chunk의 비동기 버전 (AsyncOpenAI 사용)"""
+    _ai_cache_require_live()
+    
+    try:
+        client = _get_async_client()
         
-        report_id = db_manager.execute_insert(insert_report_query, report_params)
+        response = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=_build_batch_messages(items),
+            temperature=0,
+            response_format={"type": "json_object"}
+        )
         
-        # report_analysis 테이블에 AI 분석 결과 저장
-        # result 값을 MySQL enum에 맞게 변환
-        mysql_result = {
-            '일치': 'match',
-            '부분일치': 'partial_match', 
-            '불일치': 'mismatch'
-        }.get(result_type, 'partial_match')
+        return _parse_batch_response(response.choices[0].message.content, len(items))
         
-        insert_analysis_query = """
+    except Exception as e:
+        raise Exception(f"분석 중 오류가 발생했습니다: {str(e)}")
+
+
+def _build_batch_messages(items: List[Tuple[str, str]]) -> List[Dict]:
+    """일괄 분석 요청 메시지 (고정 시스템 메시지 + 신고 목록 JSON)"""
+    payload = _json_dumps(
+        [{"id": i, "post": post, "reason": reason} for i, (post, reason) in enumerate(items)]
+    )
+    return [_BATCH_SYSTEM_MSG, {"role": "user", "content": "신고 목록:\n" + payload}]
+
+
+def _parse_batch_response(content: str, count: int) -> List[Dict]:
+    """일괄 분석 응답({"results": [{"id", "score", "analysis"}]}) → 요청 순서의 분석 결과 리스트"""
+    data = _json_loads(content)
+    by_id = {int(entry["id"]): entry for entry in data.get("results", [])}
+    
+    results = []
+    for i in range(count):
+        entry = by_id.get(i)
+        if entry is None:
+            raise Exception(f"응답에 {i}번 항목 결과가 없습니다.")
+        score = max(0, min(100, int(entry.get("score", 50))))
+        results.append(_build_ai_result(score, str(entry.get("analysis", ""))))
+    return results
+
+
+# report 테이블 INSERT 컬럼 / 행 하나의 VALUES 자리표시자
+_REPORT_INSERT_PREFIX = """
+        INSERT INTO report (
+            report_date, report_type, reported_content, report_reason, 
+            reporter_id, status, priority, assigned_to, processed_date, 
+            processing_note, post_status, post_action
+        ) VALUES """
+_REPORT_VALUES_ROW = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+_ANALYSIS_INSERT_QUERY = """
         INSERT INTO report_analysis (report_id, result, confidence, analysis)
         VALUES (%s, %s, %s, %s)
         """
+
+# 다중 VALUES INSERT 한 문장에 담을 최대 행 수/파라미터 바이트 수
+# (max_allowed_packet 기본값 4MB~64MB보다 충분히 작게 유지)
+BULK_INSERT_MAX_ROWS = 500
+BULK_INSERT_MAX_BYTES = 1024 * 1024
+
+
+def _param_bytes(row: tuple) -> int:
+    """INSERT 파라미터 한 행의 대략적인 전송 크기 (문자열은 UTF-8 길이, 그 외는 고정값)"""
+    return sum(len(v.encode('utf-8')) if isinstance(v, str) else 24 for v in row)
+
+
+def _chunk_report_rows(rows: List[tuple]) -> Iterator[Tuple[int, int]]:
+    """rows를 행 수/바이트 제한 안에서 (시작, 끝) 구간으로 나눔 (한 행이 제한보다 커도 한 구간)"""
+    start, size = 0, 0
+    for i, row in enumerate(rows):
+        row_size = _param_bytes(row)
+        if i > start and (i - start >= BULK_INSERT_MAX_ROWS or size + row_size > BULK_INSERT_MAX_BYTES):
+            yield start, i
+            start, size = i, 0
+        size += row_size
+    if start < len(rows):
+        yield start, len(rows)
+
+
+def _prepare_report(post_content: str, reason: str, ai_result: Dict,
+                    reporter_id: int, now: datetime, now_iso: str) -> Tuple[tuple, tuple, Dict]:
+    """
+    신고 하나의 report INSERT 파라미터, report_analysis 파라미터(report_id 제외), 응답 데이터를 생성
+    """
+    if not ai_result:
+        raise Exception("AI 분석 결과가 없어 처리할 수 없습니다.")
         
-        analysis_params = (
-            report_id,
-            mysql_result,
-            confidence,
-            ai_result.get('analysis', '')
-        )
+    result_type = ai_result.get('type', '부분일치')
+    confidence = ai_result.get('score', 50)
+    analysis = ai_result.get('analysis', '')
+    
+    # 결과에 따른 상태 설정 (알 수 없는 값은 부분일치로 처리)
+    status, post_status, post_action, priority, processing_note = _ACTION_TABLE.get(
+        result_type, _ACTION_TABLE['부분일치']
+    )
+    
+    processed = result_type != '부분일치'
+    assigned_to = None  # AI_System은 실제 사용자가 아니므로 NULL
+    
+    report_params = (
+        now,
+        reason,
+        post_content,
+        reason,
+        reporter_id,
+        status,
+        priority,
+        assigned_to,
+        now if processed else None,
+        processing_note,
+        post_status,
+        post_action
+    )
+    
+    # result 값을 MySQL enum에 맞게 변환
+    analysis_params = (_MYSQL_RESULT.get(result_type, 'partial_match'), confidence, analysis)
+    
+    # 저장된 데이터 반환용 (기존 JSON 형식 유지, id는 INSERT 후 채움)
+    response = {
+        'id': None,
+        'reportDate': now_iso,
+        'reportType': reason,
+        'reportedContent': post_content,
+        'reportReason': reason,
+        'reporterId': 'fastapi_user',
+        'aiAnalysis': {
+            'result': result_type,
+            'confidence': confidence,
+            'analysis': analysis
+        },
+        'status': status,
+        'priority': priority,
+        'assignedTo': 'AI_System' if processed else None,
+        'processedDate': now_iso if processed else None,
+        'processingNote': processing_note,
+        'postStatus': post_status,
+        'postAction': _POST_ACTION_MESSAGE.get(post_action)
+    }
+    return report_params, analysis_params, response
+
+
+def save_report_to_db(post_content: str, reason: str, ai_result: Dict) -> Dict:
+    """
+    신고를 MySQL 데이터베이스에 저장
+    
+    Args:
+        post_content: 게시글 내용
+        reason: 신고 사유
+        ai_result: AI 분석 결과
         
-        db_manager.execute_insert(insert_analysis_query, analysis_params)
+    Returns:
+        저장된 신고 데이터
+    """
+    return bulk_save_reports([(post_content, reason, ai_result)])[0]
+
+
+def bulk_save_reports(items: List[Tuple[str, str, Dict]]) -> List[Dict]:
+    """
+    여러 신고를 한 번에 MySQL 데이터베이스에 저장 (큐 재처리 등 일괄 저장용)
+    
+    report는 BULK_INSERT_MAX_ROWS행/BULK_INSERT_MAX_BYTES 단위의 다중 VALUES INSERT,
+    report_analysis는 executemany로 저장하며 전체를 하나의 트랜잭션으로 처리 (일부만 저장되지 않음)
+    
+    Args:
+        items: (게시글 내용, 신고 사유, AI 분석 결과) 튜플 리스트
         
-        # 저장된 데이터 반환 (기존 JSON 형식 유지)
-        return {
-            'id': report_id,
-            'reportDate': datetime.now().isoformat(),
-            'reportType': reason,
-            'reportedContent': post_content,
-            'reportReason': reason,
-            'reporterId': 'fastapi_user',
-            'aiAnalysis': {
-                'result': result_type,
-                'confidence': confidence,
-                'analysis': ai_result.get('analysis', '')
-            },
-            'status': status,
-            'priority': priority,
-            'assignedTo': 'AI_System' if result_type != '부분일치' else None,
-            'processedDate': datetime.now().isoformat() if result_type != '부분일치' else None,
-            'processingNote': processing_note,
-            'postStatus': post_status,
-            'postAction': '게시글이 자동 삭제되었습니다.' if post_action == 'delete' else 
-                         '게시글이 자동 유지되었습니다.' if post_action == 'keep' else None
-        }
+    Returns:
+        items와 같은 순서의 저장된 신고 데이터 리스트
+    """
+    if not items:
+        return []
+    
+    try:
+        reporter_id = _get_reporter_id()
+        # 현재 시각은 요청당 한 번만 계산 (DB 저장값과 응답값이 같은 시각을 가리키도록)
+        now = datetime.now()
+        now_iso = now.isoformat()
+        
+        prepared = [
+            _prepare_report(post_content, reason, ai_result, reporter_id, now, now_iso)
+            for post_content, reason, ai_result in items
+        ]
+        
+        report_rows = [row for row, _, _ in prepared]
+        report_ids: List[int] = []
+        
+        # 신고와 분석 결과는 하나의 연결/트랜잭션으로 저장 (둘 중 하나만 남지 않도록)
+        with db_manager.transaction() as conn:
+            with conn.cursor() as cursor:
+                step = None
+                for start, end in _chunk_report_rows(report_rows):
+                    cursor.execute(
+                        _REPORT_INSERT_PREFIX + ", ".join([_REPORT_VALUES_ROW] * (end - start)),
+                        [value for row in report_rows[start:end] for value in row]
+                    )
+                    # 다중 VALUES INSERT 한 문장(simple insert)의 AUTO_INCREMENT 값은
+                    # auto_increment_increment 간격으로 연속 할당되며, lastrowid는 첫 번째 행의 id
+                    first_id = cursor.lastrowid
+                    if step is None and end - start > 1:
+                        cursor.execute("SELECT @@auto_increment_increment")
+                        step = int(cursor.fetchone()[0])
+                    report_ids.extend(first_id + i * (step or 1) for i in range(end - start))
+                
+                cursor.executemany(_ANALYSIS_INSERT_QUERY, [
+                    (report_id,) + analysis_params
+                    for report_id, (_, analysis_params, _) in zip(report_ids, prepared)
+                ])
+        invalidate_reports_cache()
+        
+        saved = []
+        for report_id, (_, _, response) in zip(report_ids, prepared):
+            response['id'] = report_id
+            saved.append(response)
+        return saved
         
     except Exception as e:
         raise Exception(f"데이터베이스 저장 오류: {str(e)}")
 
 
+def _get_reporter_id() -> int:
+    """기본 신고자(fastapi_user) ID — 최초 1회만 조회/생성하고 이후에는 캐시 사용"""
+    global _reporter_id
+    if _reporter_id is not None:
+        return _reporter_id
+    
+    # 기본 사용자 ID 가져오기 (fastapi_user가 없으면 생성)
+    user_query = "SELECT id FROM users WHERE username = 'fastapi_user'"
+    user_result = db_manager.execute_query(user_query)
+    
+    if not user_result:
+        # fastapi_user 생성
+        insert_user_query = """
+        INSERT INTO users (username, password, role) 
+        VALUES ('fastapi_user', 'temp_password', 'user')
+        """
+        _reporter_id = db_manager.execute_insert(insert_user_query)
+    else:
+        _reporter_id = user_result[0]['id']
+    return _reporter_id
+
+
 def save_analysis_only_to_db(ai_result: Dict) -> Dict:
     """
     AI 분석 결과만 report_analysis 테이블에 저장 (테스트용)
@@ -348,18 +1084,9 @@ def save_analysis_only_to_db(ai_result: Dict) -> Dict:
         confidence = ai_result.get('score', 50)
         
         # result 값을 MySQL enum에 맞게 변환
-        mysql_result = {
-            '일치': 'match',
-            '부분일치': 'partial_match', 
-            '불일치': 'mismatch'
-        }.get(result_type, 'partial_match')
+        mysql_result = _MYSQL_RESULT.get(result_type, 'partial_match')
         
         # report_analysis 테이블에만 저장 (report_id는 NULL)
-        insert_analysis_query = """
-        INSERT INTO report_analysis (report_id, result, confidence, analysis)
-        VALUES (%s, %s, %s, %s)
-        """
-        
         analysis_params = (
             None,  # report_id는 NULL (테스트 분석)
             mysql_result,
@@ -367,7 +1094,7 @@ def save_analysis_only_to_db(ai_result: Dict) -> Dict:
             ai_result.get('analysis', '')
         )
         
-        analysis_id = db_manager.execute_insert(insert_analysis_query, analysis_params)
+        analysis_id = db_manager.execute_insert(_ANALYSIS_INSERT_QUERY, analysis_params)
         
         # 테스트용 응답 데이터 반환
         return {
@@ -398,16 +1125,8 @@ def update_report_status(report_id: int, status: str, processing_note: Optional[
         업데이트된 신고 데이터
     """
     try:
-        # 게시글 처리 로직
-        if status == 'completed':  # 승인 (신고 유효 -> 게시글 삭제)
-            post_status = 'deleted'
-            post_action = 'delete'
-        elif status == 'rejected':  # 반려 (신고 무효 -> 게시글 유지)
-            post_status = 'approved'
-            post_action = 'keep'
-        else:  # pending
-            post_status = 'pending_review'
-            post_action = 'none'
+        # 게시글 처리 로직 (pending 등 그 외 상태는 검토 대기)
+        post_status, post_action = _POST_STATE_BY_STATUS.get(status, ('pending_review', 'none'))
         
         # MySQL에서 신고 상태 업데이트
         update_query = """
@@ -430,6 +1149,7 @@ def update_report_status(report_id: int, status: str, processing_note: Optional[
         
         if affected_rows == 0:
             raise ValueError("신고를 찾을 수 없습니다.")
+        invalidate_reports_cache()
         
         # 업데이트된 신고 데이터 조회
         updated_report = get_report_by_id(report_id)
@@ -452,8 +1172,16 @@ def get_report_by_id(report_id: int) -> Optional[Dict]:
     Returns:
         신고 데이터 또는 None
     """
+    # 목록 캐시가 유효하면 id 인덱스에서 바로 조회
+    # (목록은 postAction 원본 값을 가지므로 상세 조회 형식의 안내 문구로 바꿔서 반환)
+    cached = _fresh_reports_cache()
+    if cached is not None and report_id in cached[2]:
+        report = dict(cached[2][report_id])
+        report['postAction'] = _POST_ACTION_MESSAGE.get(report['postAction'])
+        return report
+    
     try:
-        query = """
+        query = f"""
         SELECT 
             r.id,
             r.report_date as reportDate,
@@ -470,7 +1198,7 @@ def get_report_by_id(report_id: int) -> Optional[Dict]:
             r.processed_date as processedDate,
             r.processing_note as processingNote,
             r.post_status as postStatus,
-            r.post_action as postAction,
+            {_POST_ACTION_MESSAGE_SQL} as postAction,
             ra.result,
             ra.confidence,
             ra.analysis
@@ -486,46 +1214,61 @@ def get_report_by_id(report_id: int) -> Optional[Dict]:
         if not results:
             return None
         
-        row = results[0]
-        report = {
-            'id': row['id'],
-            'reportDate': row['reportDate'].isoformat() if row['reportDate'] else None,
-            'reportType': row['reportType'],
-            'reportedContent': row['reportedContent'],
-            'reportReason': row['reportReason'],
-            'reporterId': row['reporterId'] or 'unknown',
-            'status': row['status'],
-            'priority': row['priority'],
-            'assignedTo': row['assignedTo'],
-            'processedDate': row['processedDate'].isoformat() if row['processedDate'] else None,
-            'processingNote': row['processingNote'],
-            'postStatus': row['postStatus'],
-            'postAction': '게시글이 자동 삭제되었습니다.' if row['postAction'] == 'delete' else 
-                         '게시글이 자동 유지되었습니다.' if row['postAction'] == 'keep' else None
-        }
-        
-        # AI 분석 결과가 있으면 추가
-        if row['result']:
-            # MySQL enum을 한글로 변환
-            result_mapping = {
-                'match': '일치',
-                'partial_match': '부분일치',
-                'mismatch': '불일치'
-            }
-            
-            report['aiAnalysis'] = {
-                'result': result_mapping.get(row['result'], row['result']),
-                'confidence': row['confidence'],
-                'analysis': row['analysis']
-            }
-        
-        return report
+        return _row_to_report(results[0])
         
     except Exception as e:
         print(f"신고 조회 오류: {e}")
         return None
 
 
+def _build_report_filter(
+    status_filter: Optional[str],
+    type_filter: Optional[str],
+    ai_result_filter: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    priority_filter: Optional[str] = None
+) -> Tuple[str, List]:
+    """신고 목록 필터 조건 → (WHERE 절, 파라미터 리스트)"""
+    where_conditions = []
+    params = []
+    
+    # 상태 필터
+    if status_filter:
+        where_conditions.append("r.status = %s")
+        params.append(status_filter)
+    
+    # 우선순위 필터
+    if priority_filter:
+        where_conditions.append("r.priority = %s")
+        params.append(priority_filter)
+    
+    # 신고 유형 필터
+    if type_filter:
+        where_conditions.append("r.report_type = %s")
+        params.append(type_filter)
+    
+    # AI 결과 필터 (판정 결과 '일치' 등으로 와도 MySQL enum 값으로 변환)
+    if ai_result_filter:
+        where_conditions.append("ra.result = %s")
+        params.append(_MYSQL_RESULT.get(ai_result_filter, ai_result_filter))
+    
+    # 날짜 필터 (컬럼에 DATE()를 씌우지 않아야 report_date 인덱스로 범위 검색 가능)
+    if start_date:
+        where_conditions.append("r.report_date >= %s")
+        params.append(start_date)
+    
+    if end_date:
+        where_conditions.append("r.report_date < DATE_ADD(%s, INTERVAL 1 DAY)")
+        params.append(end_date)
+    
+    # WHERE 절 구성
+    where_clause = ""
+    if where_conditions:
+        where_clause = "WHERE " + " AND ".join(where_conditions)
+    return where_clause, params
+
+
 def get_reports_with_filters(
     status_filter: Optional[str] = None,
     type_filter: Optional[str] = None,
@@ -533,7 +1276,9 @@ def get_reports_with_filters(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    priority_filter: Optional[str] = None,
+    post_action_message: bool = True
 ) -> Dict:
     """
     필터링된 신고 목록 조회 (관리자 페이지용)
@@ -541,63 +1286,29 @@ def get_reports_with_filters(
     Args:
         status_filter: 상태 필터 (pending, completed, rejected)
         type_filter: 신고 유형 필터
-        ai_result_filter: AI 결과 필터 (match, partial_match, mismatch)
+        ai_result_filter: AI 결과 필터 (match, partial_match, mismatch 또는 일치, 부분일치, 불일치)
         start_date: 시작 날짜 (YYYY-MM-DD)
         end_date: 종료 날짜 (YYYY-MM-DD)
         limit: 페이지 크기
         offset: 오프셋
+        priority_filter: 우선순위 필터 (high, normal, low)
+        post_action_message: True면 postAction을 안내 문구로, False면 원본 값(delete/keep/none)으로 반환
+                             (load_reports_db 목록과 같은 형식이 필요할 때 False)
         
     Returns:
         필터링된 신고 목록과 총 개수
     """
     try:
-        # 기본 쿼리
-        where_conditions = []
-        params = []
-        
-        # 상태 필터
-        if status_filter:
-            where_conditions.append("r.status = %s")
-            params.append(status_filter)
-        
-        # 신고 유형 필터
-        if type_filter:
-            where_conditions.append("r.report_type = %s")
-            params.append(type_filter)
-        
-        # AI 결과 필터
-        if ai_result_filter:
-            where_conditions.append("ra.result = %s")
-            params.append(ai_result_filter)
-        
-        # 날짜 필터
-        if start_date:
-            where_conditions.append("DATE(r.report_date) >= %s")
-            params.append(start_date)
-        
-        if end_date:
-            where_conditions.append("DATE(r.report_date) <= %s")
-            params.append(end_date)
-        
-        # WHERE 절 구성
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions)
-        
-        # 총 개수 쿼리
-        count_query = f"""
-        SELECT COUNT(DISTINCT r.id) as total
-        FROM report r
-        LEFT JOIN report_analysis ra ON r.id = ra.report_id
-        {where_clause}
-        """
-        
-        count_result = db_manager.execute_query(count_query, tuple(params))
-        total_count = count_result[0]['total'] if count_result else 0
+        where_clause, params = _build_report_filter(
+            status_filter, type_filter, ai_result_filter, start_date, end_date, priority_filter
+        )
+        post_action_sql = _POST_ACTION_MESSAGE_SQL if post_action_message else "r.post_action"
         
-        # 데이터 쿼리
+        # 필터 + 페이징을 먼저 수행한 뒤 해당 페이지의 신고에만 사용자/분석 정보를 조인
+        # (총 개수는 같은 쿼리에서 윈도 함수로 함께 계산 — GROUP BY r.id 이후라 신고 단위 개수)
         data_query = f"""
         SELECT 
+            p.total_count,
             r.id,
             r.report_date as reportDate,
             r.report_type as reportType,
@@ -613,58 +1324,47 @@ def get_reports_with_filters(
             r.processed_date as processedDate,
             r.processing_note as processingNote,
             r.post_status as postStatus,
-            r.post_action as postAction,
+            {post_action_sql} as postAction,
             ra.result,
             ra.confidence,
             ra.analysis
-        FROM report r
+        FROM (
+            SELECT r.id, r.created_at, COUNT(*) OVER () as total_count
+            FROM report r
+            LEFT JOIN report_analysis ra ON r.id = ra.report_id
+            {where_clause}
+            GROUP BY r.id
+            ORDER BY r.created_at DESC
+            LIMIT %s OFFSET %s
+        ) p
+        JOIN report r ON r.id = p.id
         LEFT JOIN users u ON r.reporter_id = u.id
         LEFT JOIN users au ON r.assigned_to = au.id
         LEFT JOIN report_analysis ra ON r.id = ra.report_id
-        {where_clause}
-        ORDER BY r.created_at DESC
-        LIMIT %s OFFSET %s
+        ORDER BY p.created_at DESC
         """
         
         # 페이징 파라미터 추가
         data_params = list(params) + [limit, offset]
         results = db_manager.execute_query(data_query, tuple(data_params))
         
+        if results:
+            total_count = results[0]['total_count']
+        elif offset > 0:
+            # 마지막 페이지를 넘어선 경우에만 개수를 따로 조회
+            count_query = f"""
+            SELECT COUNT(DISTINCT r.id) as total
+            FROM report r
+            LEFT JOIN report_analysis ra ON r.id = ra.report_id
+            {where_clause}
+            """
+            count_result = db_manager.execute_query(count_query, tuple(params))
+            total_count = count_result[0]['total'] if count_result else 0
+        else:
+            total_count = 0
+        
         # 결과 변환
-        reports = []
-        for row in results:
-            report = {
-                'id': row['id'],
-                'reportDate': row['reportDate'].isoformat() if row['reportDate'] else None,
-                'reportType': row['reportType'],
-                'reportedContent': row['reportedContent'],
-                'reportReason': row['reportReason'],
-                'reporterId': row['reporterId'] or 'unknown',
-                'status': row['status'],
-                'priority': row['priority'],
-                'assignedTo': row['assignedTo'],
-                'processedDate': row['processedDate'].isoformat() if row['processedDate'] else None,
-                'processingNote': row['processingNote'],
-                'postStatus': row['postStatus'],
-                'postAction': '게시글이 자동 삭제되었습니다.' if row['postAction'] == 'delete' else 
-                             '게시글이 자동 유지되었습니다.' if row['postAction'] == 'keep' else None
-            }
-            
-            # AI 분석 결과가 있으면 추가
-            if row['result']:
-                result_mapping = {
-                    'match': '일치',
-                    'partial_match': '부분일치',
-                    'mismatch': '불일치'
-                }
-                
-                report['aiAnalysis'] = {
-                    'result': result_mapping.get(row['result'], row['result']),
-                    'confidence': row['confidence'],
-                    'analysis': row['analysis']
-                }
-            
-            reports.append(report)
+        reports = list(map(_row_to_report, results))
         
         return {
             'reports': reports,
@@ -677,108 +1377,182 @@ def get_reports_with_filters(
         raise Exception(f"필터링된 신고 조회 오류: {str(e)}")
 
 
+def iter_reports_with_filters(
+    status_filter: Optional[str] = None,
+    type_filter: Optional[str] = None,
+    ai_result_filter: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    필터링된 신고 전체를 최신순으로 하나씩 반환 (내보내기/스트리밍 응답용)
+    
+    get_reports_with_filters()와 같은 필터를 사용하지만 페이징 없이 서버 측 커서로 읽으므로
+    결과 전체를 메모리에 올리지 않음. 반환된 제너레이터를 끝까지 소비하거나 close()해야
+    DB 연결이 반납됨
+    
+    Yields:
+        get_reports_with_filters()의 reports 항목과 같은 형식의 신고 데이터
+    """
+    where_clause, params = _build_report_filter(
+        status_filter, type_filter, ai_result_filter, start_date, end_date
+    )
+    
+    query = f"""
+    SELECT 
+        r.id,
+        r.report_date as reportDate,
+        r.report_type as reportType,
+        r.reported_content as reportedContent,
+        r.report_reason as reportReason,
+        u.username as reporterId,
+        r.status,
+        r.priority,
+        CASE 
+            WHEN r.assigned_to IS NOT NULL THEN au.username 
+            ELSE 'AI_System'
+        END as assignedTo,
+        r.processed_date as processedDate,
+        r.processing_note as processingNote,
+        r.post_status as postStatus,
+        {_POST_ACTION_MESSAGE_SQL} as postAction,
+        ra.result,
+        ra.confidence,
+        ra.analysis
+    FROM report r
+    LEFT JOIN users u ON r.reporter_id = u.id
+    LEFT JOIN users au ON r.assigned_to = au.id
+    LEFT JOIN report_analysis ra ON r.id = ra.report_id
+    {where_clause}
+    ORDER BY r.created_at DESC
+    """
+    
+    for row in db_manager.stream_query(query, tuple(params)):
+        yield _row_to_report(row)
+
+
 def get_dashboard_stats() -> Dict:
     """
     관리자 대시보드용 통계 데이터
     
+    Redis가 있으면 DASHBOARD_STATS_TTL초 동안 캐시된 값을 반환
+    (신고 저장/상태 변경 시 invalidate_reports_cache()에서 폐기)
+    
     Returns:
         대시보드 통계 정보
     """
+    client = _get_redis()
+    if client is not None:
+        try:
+            cached = client.get(DASHBOARD_STATS_CACHE_KEY)
+            if cached:
+                return _json_loads(cached)
+        except Exception as e:
+            print(f"[WARN] 대시보드 통계 캐시 조회 실패: {e}")
+    
+    stats = _query_dashboard_stats()
+    
+    if client is not None:
+        try:
+            client.setex(DASHBOARD_STATS_CACHE_KEY, DASHBOARD_STATS_TTL, _json_dumps(stats))
+        except Exception as e:
+            print(f"[WARN] 대시보드 통계 캐시 저장 실패: {e}")
+    return stats
+
+
+def _query_dashboard_stats() -> Dict:
+    """get_dashboard_stats의 MySQL 조회 부분"""
     try:
-        # 기본 통계
+        # 기본 통계 / AI 분석 통계 / 신고 유형별 통계 / 일별 트렌드(최근 7일) / 평균 처리 시간을
+        # UNION ALL 한 번으로 조회 (section 컬럼으로 구분, 값은 c1~c7에 담음)
+        # 평균 처리 시간: processed_date가 NULL이면 TIMESTAMPDIFF도 NULL이라 AVG에서 제외됨
         stats_query = """
         SELECT 
-            COUNT(*) as total_reports,
-            COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_reports,
-            COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_reports,
-            COUNT(CASE WHEN status = 'rejected' THEN 1 END) as rejected_reports,
-            COUNT(CASE WHEN priority = 'high' THEN 1 END) as high_priority,
-            COUNT(CASE WHEN priority = 'urgent' THEN 1 END) as urgent_priority
+            'basic' as section,
+            NULL as k,
+            COUNT(*) as c1,
+            COUNT(CASE WHEN status = 'pending' THEN 1 END) as c2,
+            COUNT(CASE WHEN status = 'completed' THEN 1 END) as c3,
+            COUNT(CASE WHEN status = 'rejected' THEN 1 END) as c4,
+            COUNT(CASE WHEN priority = 'high' THEN 1 END) as c5,
+            COUNT(CASE WHEN priority = 'urgent' THEN 1 END) as c6,
+            AVG(TIMESTAMPDIFF(HOUR, report_date, processed_date)) as c7
         FROM report
-        """
-        
-        stats_result = db_manager.execute_query(stats_query)
-        basic_stats = stats_result[0] if stats_result else {}
-        
-        # AI 분석 통계
-        ai_stats_query = """
-        SELECT 
-            ra.result,
-            COUNT(*) as count,
-            AVG(ra.confidence) as avg_confidence
+        UNION ALL
+        SELECT 'ai', ra.result, COUNT(*), AVG(ra.confidence), NULL, NULL, NULL, NULL, NULL
         FROM report_analysis ra
         GROUP BY ra.result
-        """
-        
-        ai_results = db_manager.execute_query(ai_stats_query)
-        ai_stats = {}
-        
-        for row in ai_results:
-            result_mapping = {
-                'match': '일치',
-                'partial_match': '부분일치',
-                'mismatch': '불일치'
-            }
-            
-            ai_stats[result_mapping.get(row['result'], row['result'])] = {
-                'count': row['count'],
-                'avg_confidence': round(row['avg_confidence'], 1) if row['avg_confidence'] else 0
-            }
-        
-        # 신고 유형별 통계
-        type_stats_query = """
-        SELECT 
-            report_type,
-            COUNT(*) as count
+        UNION ALL
+        SELECT 'type', report_type, COUNT(*), NULL, NULL, NULL, NULL, NULL, NULL
         FROM report
         GROUP BY report_type
-        ORDER BY count DESC
-        """
-        
-        type_results = db_manager.execute_query(type_stats_query)
-        type_stats = {row['report_type']: row['count'] for row in type_results}
-        
-        # 일별 신고 트렌드 (최근 7일)
-        trend_query = """
+        UNION ALL
         SELECT 
-            DATE(report_date) as report_day,
-            COUNT(*) as daily_count,
-            COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_count,
-            COUNT(CASE WHEN status = 'rejected' THEN 1 END) as rejected_count
+            'trend',
+            CAST(DATE(report_date) AS CHAR),
+            COUNT(*),
+            COUNT(CASE WHEN status = 'completed' THEN 1 END),
+            COUNT(CASE WHEN status = 'rejected' THEN 1 END),
+            NULL, NULL, NULL, NULL
         FROM report
         WHERE report_date >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)
         GROUP BY DATE(report_date)
-        ORDER BY report_day DESC
         """
         
-        trend_results = db_manager.execute_query(trend_query)
-        daily_trends = []
+        results = db_manager.execute_query(stats_query)
         
-        for row in trend_results:
-            daily_trends.append({
-                'date': row['report_day'].strftime('%Y-%m-%d') if row['report_day'] else None,
-                'total': row['daily_count'],
-                'completed': row['completed_count'],
-                'rejected': row['rejected_count']
-            })
-        
-        # 평균 처리 시간 계산
-        processing_time_query = """
-        SELECT 
-            AVG(TIMESTAMPDIFF(HOUR, report_date, processed_date)) as avg_processing_hours
-        FROM report
-        WHERE processed_date IS NOT NULL
-        """
+        basic_stats = {}
+        avg_processing_hours = None
+        ai_stats = {}
+        type_rows = []
+        trend_rows = []
         
-        processing_result = db_manager.execute_query(processing_time_query)
-        avg_processing_hours = processing_result[0]['avg_processing_hours'] if processing_result else 0
+        # UNION 결과는 숫자 컬럼이 DECIMAL로 합쳐지므로 개수는 int로 되돌림
+        for row in results:
+            section = row['section']
+            if section == 'basic':
+                basic_stats = {
+                    'total_reports': int(row['c1']),
+                    'pending_reports': int(row['c2']),
+                    'completed_reports': int(row['c3']),
+                    'rejected_reports': int(row['c4']),
+                    'high_priority': int(row['c5']),
+                    'urgent_priority': int(row['c6'])
+                }
+                avg_processing_hours = row['c7']
+            elif section == 'ai':
+                ai_stats[_RESULT_LABEL.get(row['k'], row['k'])] = {
+                    'count': int(row['c1']),
+                    'avg_confidence': round(float(row['c2']), 1) if row['c2'] else 0
+                }
+            elif section == 'type':
+                type_rows.append((row['k'], int(row['c1'])))
+            else:  # trend
+                trend_rows.append(row)
+        
+        # 신고 유형별 통계 (건수 내림차순)
+        type_rows.sort(key=lambda item: item[1], reverse=True)
+        type_stats = dict(type_rows)
+        
+        # 일별 신고 트렌드 (최신 날짜 먼저)
+        trend_rows.sort(key=lambda row: row['k'] or '', reverse=True)
+        daily_trends = [
+            {
+                'date': row['k'],
+                'total': int(row['c1']),
+                'completed': int(row['c2']),
+                'rejected': int(row['c3'])
+            }
+            for row in trend_rows
+        ]
         
         return {
             'basic_stats': basic_stats,
             'ai_stats': ai_stats,
             'type_stats': type_stats,
             'daily_trends': daily_trends,
-            'avg_processing_hours': round(avg_processing_hours, 1) if avg_processing_hours else 0
+            # AVG 결과는 Decimal이므로 float로 변환 (캐시 직렬화 가능하도록)
+            'avg_processing_hours': round(float(avg_processing_hours), 1) if avg_processing_hours else 0
         }
         
     except Exception as e:
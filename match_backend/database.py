@@ -1,36 +1,100 @@
 """
 MySQL 데이터베이스 연결 관리
 """
-import pymysql
-import os
-from typing import Dict, List, Optional
-from dotenv import load_dotenv
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from .config import DB_CONFIG
 
-load_dotenv()
+# mysqlclient(C 확장)가 설치되어 있으면 사용 — 행 디코딩이 네이티브 코드에서 처리되어 대량 조회가 빠름
+# (없으면 순수 Python 드라이버인 PyMySQL 사용, 두 드라이버 모두 DB-API라 사용법은 동일)
+try:
+    import MySQLdb as mysql_driver
+    import MySQLdb.cursors
+except ImportError:
+    import pymysql as mysql_driver
+    import pymysql.cursors
+
+# SQLAlchemy가 있으면 연결 풀 사용 (없으면 호출마다 새 연결)
+try:
+    from sqlalchemy.pool import QueuePool
+    POOL_AVAILABLE = True
+except ImportError:
+    POOL_AVAILABLE = False
+
+# 연결 풀 설정
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 10
+POOL_RECYCLE = 1800  # 30분마다 연결 재생성 (MySQL wait_timeout 대비)
 
 class DatabaseManager:
     def __init__(self):
-        self.connection_config = {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'port': int(os.getenv('DB_PORT', '3306')),
-            'user': os.getenv('DB_USER', 'root'),
-            'password': os.getenv('DB_PASSWORD', ''),
-            'database': os.getenv('DB_NAME', 'wmai_db'),
-            'charset': 'utf8mb4',
-            'autocommit': True
-        }
+        self.connection_config = dict(DB_CONFIG)
+        # 연결은 처음 필요할 때 만들어지고, 사용 후 풀에 반납되어 재사용됨
+        self._pool = None
+        if POOL_AVAILABLE:
+            self._pool = QueuePool(
+                lambda: mysql_driver.connect(**self.connection_config),
+                pool_size=POOL_SIZE,
+                max_overflow=POOL_MAX_OVERFLOW,
+                recycle=POOL_RECYCLE,
+                # autocommit 연결이고 트랜잭션은 transaction()에서 직접 commit/rollback하므로
+                # 반납할 때마다 ROLLBACK을 보내지 않음
+                reset_on_return=None
+            )
     
+    @contextmanager
     def get_connection(self):
-        """DB 연결 반환"""
-        return pymysql.connect(**self.connection_config)
+        """DB 연결 반환 (풀에서 빌려서 블록이 끝나면 반납)"""
+        if self._pool is None:
+            with mysql_driver.connect(**self.connection_config) as conn:
+                yield conn
+            return
+        
+        conn = self._pool.connect()
+        try:
+            # 풀에 있는 동안 서버가 끊은 연결이면 버리고 새로 연결
+            try:
+                conn.ping()
+            except mysql_driver.Error:
+                conn.invalidate()
+                conn = self._pool.connect()
+            yield conn
+        finally:
+            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """하나의 연결에서 여러 쿼리를 트랜잭션으로 실행 (정상 종료 시 commit, 예외 시 rollback)"""
+        with self.get_connection() as conn:
+            conn.begin()
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
     
     def execute_query(self, query: str, params: tuple = None) -> List[Dict]:
         """SELECT 쿼리 실행"""
         with self.get_connection() as conn:
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            with conn.cursor(mysql_driver.cursors.DictCursor) as cursor:
                 cursor.execute(query, params)
                 return cursor.fetchall()
     
+    def stream_query(self, query: str, params: tuple = None, size: int = 1000) -> Iterator[Dict]:
+        """
+        SELECT 쿼리 결과를 서버 측 커서(SSDictCursor)로 size 행씩 읽어서 한 행씩 반환
+        (결과 전체를 fetchall()로 메모리에 올리지 않음 — 대량 조회/내보내기용)
+        """
+        with self.get_connection() as conn:
+            with conn.cursor(mysql_driver.cursors.SSDictCursor) as cursor:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(size)
+                    if not rows:
+                        break
+                    yield from rows
+    
     def execute_insert(self, query: str, params: tuple = None) -> int:
         """INSERT 쿼리 실행, ID 반환"""
         with self.get_connection() as conn:
@@ -7,12 +7,19 @@ import sys
 import os
 import subprocess
 import signal
+import threading
 import time
 from pathlib import Path
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(__file__))
 
+def _pump_output(proc, label):
+    """서버 출력을 한 줄씩 읽어 접두어를 붙여 출력 (프로세스 출력이 끝나면 종료)"""
+    for line in proc.stdout:
+        print(f"[{label}] {line.strip()}")
+
+
 def start_servers():
     """메인 서버(8000)와 트렌드 서버(8001)를 동시에 실행"""
     
@@ -76,25 +83,19 @@ def start_servers():
         print("\n[INFO] 트렌드 대시보드를 사용하려면:")
         print("   http://localhost:8000/trends 접속\n")
         
-        # 서버 로그 출력 (비동기)
-        while True:
-            # 메인 서버 로그
-            if main_server.poll() is None:
-                line = main_server.stdout.readline()
-                if line:
-                    print(f"[메인] {line.strip()}")
-            
-            # 트렌드 서버 로그
-            if trend_server.poll() is None:
-                line = trend_server.stdout.readline()
-                if line:
-                    print(f"[트렌드] {line.strip()}")
-            
-            # 두 서버가 모두 종료되었는지 확인
-            if main_server.poll() is not None and trend_server.poll() is not None:
-                break
-            
-            time.sleep(0.1)
+        # 서버 로그 출력: 서버마다 읽기 스레드를 두어 한쪽이 조용해도 다른 쪽 로그가 밀리지 않음
+        # (Windows에서는 selectors로 파이프를 기다릴 수 없으므로 스레드 사용)
+        readers = [
+            threading.Thread(target=_pump_output, args=(main_server, "메인"), daemon=True),
+            threading.Thread(target=_pump_output, args=(trend_server, "트렌드"), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+        
+        # 두 서버의 출력이 모두 끝날 때까지 대기 (timeout을 두어 Ctrl+C를 바로 받을 수 있게 함)
+        for reader in readers:
+            while reader.is_alive():
+                reader.join(timeout=0.5)
     
     except KeyboardInterrupt:
         print("\n\n👋 서버를 종료합니다...")
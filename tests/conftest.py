@@ -0,0 +1,13 @@
+"""
+공통 테스트 설정
+- 프로젝트 루트를 import 경로에 추가
+- 외부 서비스(OpenAI/MySQL/Redis)는 각 테스트에서 가짜 객체로 대체
+"""
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+os.environ.setdefault('OPENAI_API_KEY', 'sk-test')
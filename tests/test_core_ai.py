@@ -0,0 +1,143 @@
+"""
+match_backend.core AI 분석 테스트
+- OpenAI 대신 가짜 AsyncOpenAI 클라이언트 사용
+"""
+import asyncio
+import json
+import types
+
+import pytest
+
+import match_backend.core as core
+
+
+def test_parse_batch_response_orders_by_id():
+    content = json.dumps({"results": [
+        {"id": 2, "score": 10, "analysis": "c"},
+        {"id": 0, "score": 95, "analysis": "a"},
+        {"id": "1", "score": 50, "analysis": "b"},
+    ]})
+
+    results = core._parse_batch_response(content, 3)
+
+    assert [r["analysis"] for r in results] == ["a", "b", "c"]
+    assert [r["type"] for r in results] == ["일치", "부분일치", "불일치"]
+
+
+def test_parse_batch_response_missing_id_raises():
+    content = json.dumps({"results": [
+        {"id": 0, "score": 95, "analysis": "a"},
+        {"id": 2, "score": 10, "analysis": "c"},
+    ]})
+
+    with pytest.raises(Exception, match="1번 항목"):
+        core._parse_batch_response(content, 3)
+
+
+def test_parse_batch_response_clamps_score():
+    content = json.dumps({"results": [
+        {"id": 0, "score": 150},
+        {"id": 1, "score": -5},
+    ]})
+
+    results = core._parse_batch_response(content, 2)
+
+    assert [r["score"] for r in results] == [100, 0]
+    assert results[0]["analysis"] == ""
+
+
+class _FakeCompletions:
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        messages = kwargs["messages"]
+        if messages[0] is core._BATCH_SYSTEM_MSG:
+            items = json.loads(messages[-1]["content"].split("\n", 1)[1])
+            content = json.dumps({"results": [
+                {"id": item["id"], "score": 90, "analysis": item["post"]}
+                for item in reversed(items)
+            ]})
+        else:
+            content = json.dumps({"score": 20, "analysis": "single"})
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=content))]
+        )
+
+
+@pytest.fixture
+def fake_openai(tmp_path, monkeypatch):
+    completions = _FakeCompletions()
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+    monkeypatch.setattr(core, "_async_client", client)
+    monkeypatch.setattr(core, "AI_CACHE_POLICY", "disabled")
+    monkeypatch.setattr(core, "AI_CACHE_DIR", str(tmp_path))
+    return completions
+
+
+def test_batcher_groups_requests_and_keeps_task_references(fake_openai):
+    batcher = core._AnalyzeBatcher(window=0.01, max_items=4)
+
+    async def main():
+        pending = [asyncio.ensure_future(batcher.submit(f"post{i}", "reason")) for i in range(6)]
+        await asyncio.sleep(0)
+        # max_items에 도달한 첫 배치는 태스크로 실행 중이며 참조가 유지됨
+        assert len(batcher._tasks) == 1
+        results = await asyncio.gather(*pending)
+        await asyncio.sleep(0)
+        return results
+
+    results = asyncio.run(main())
+
+    assert [r["analysis"] for r in results] == [f"post{i}" for i in range(6)]
+    assert len(fake_openai.calls) == 2
+    assert not batcher._tasks
+
+
+def test_batcher_single_request_uses_single_analysis(fake_openai):
+    batcher = core._AnalyzeBatcher(window=0.01, max_items=4)
+
+    result = asyncio.run(batcher.submit("post", "reason"))
+
+    assert result["analysis"] == "single"
+    assert fake_openai.calls[0]["messages"][0] is not core._BATCH_SYSTEM_MSG
+
+
+class _QueuedCompletions:
+    """미리 넣어 둔 content를 순서대로 돌려주는 가짜 completions"""
+
+    def __init__(self, contents):
+        self.contents = list(contents)
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        content = self.contents.pop(0)
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=content))]
+        )
+
+
+def test_fallback_result_is_not_cached(tmp_path, monkeypatch):
+    from collections import OrderedDict
+
+    completions = _QueuedCompletions([None, json.dumps({"score": 95, "analysis": "욕설"})])
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+    monkeypatch.setattr(core, "_async_client", client)
+    monkeypatch.setattr(core, "AI_CACHE_POLICY", "enabled")
+    monkeypatch.setattr(core, "AI_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(core, "_ai_memory_cache", OrderedDict())
+
+    fallback = asyncio.run(core.analyze_with_ai_async("post", "reason"))
+    assert (fallback["score"], fallback["type"]) == (50, "부분일치")
+    assert not list(tmp_path.iterdir())
+    assert not core._ai_memory_cache
+
+    # 두 번째 호출은 캐시가 아니라 API의 정상 응답을 사용하고, 그 결과는 캐시됨
+    result = asyncio.run(core.analyze_with_ai_async("post", "reason"))
+    assert result["score"] == 95
+    assert completions.calls == 2
+    assert asyncio.run(core.analyze_with_ai_async("post", "reason")) == result
+    assert completions.calls == 2
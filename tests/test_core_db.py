@@ -0,0 +1,175 @@
+"""
+match_backend.core DB 저장 테스트
+- MySQL 대신 AUTO_INCREMENT를 흉내 내는 가짜 커서 사용
+"""
+from contextlib import contextmanager
+
+import pytest
+
+import match_backend.core as core
+
+
+class _FakeCursor:
+    """report INSERT 시 auto_increment_increment 간격으로 id를 할당하는 커서"""
+
+    def __init__(self, db):
+        self.db = db
+        self.lastrowid = None
+        self._row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if query.strip() == "SELECT @@auto_increment_increment":
+            self._row = (self.db.step,)
+            return 1
+        rows = query.count("(%s")
+        assert rows >= 1 and len(params) == rows * 12
+        self.db.report_inserts.append(rows)
+        self.lastrowid = self.db.next_id
+        self.db.next_id += rows * self.db.step
+        return rows
+
+    def executemany(self, query, params_list):
+        self.db.analysis_rows.extend(params_list)
+
+    def fetchone(self):
+        return self._row
+
+
+class _FakeDB:
+    def __init__(self, step=1, first_id=100):
+        self.step = step
+        self.next_id = first_id
+        self.report_inserts = []
+        self.analysis_rows = []
+
+    @contextmanager
+    def transaction(self):
+        yield self
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+
+def _items(n):
+    types = ["일치", "부분일치", "불일치"]
+    return [
+        (f"post{i}", f"reason{i}", {"type": types[i % 3], "score": i, "analysis": f"analysis{i}"})
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    def install(**kwargs):
+        db = _FakeDB(**kwargs)
+        monkeypatch.setattr(core, "db_manager", db)
+        monkeypatch.setattr(core, "_get_reporter_id", lambda: 1)
+        monkeypatch.setattr(core, "invalidate_reports_cache", lambda: None)
+        return db
+    return install
+
+
+@pytest.mark.parametrize("step", [1, 2])
+def test_bulk_save_reports_maps_ids_per_chunk(fake_db, monkeypatch, step):
+    db = fake_db(step=step)
+    monkeypatch.setattr(core, "BULK_INSERT_MAX_ROWS", 3)
+
+    saved = core.bulk_save_reports(_items(7))
+
+    assert db.report_inserts == [3, 3, 1]
+    expected_ids = [100 + i * step for i in range(7)]
+    assert [report["id"] for report in saved] == expected_ids
+    assert [report["reportedContent"] for report in saved] == [f"post{i}" for i in range(7)]
+    # report_analysis 행이 같은 신고의 id를 가리키는지
+    assert [(row[0], row[3]) for row in db.analysis_rows] == [
+        (report_id, f"analysis{i}") for i, report_id in enumerate(expected_ids)
+    ]
+
+
+def test_bulk_save_reports_splits_by_bytes(fake_db, monkeypatch):
+    db = fake_db()
+    monkeypatch.setattr(core, "BULK_INSERT_MAX_BYTES", 2000)
+    items = [("가" * 300, "reason", {"type": "일치", "score": 90, "analysis": ""}) for _ in range(5)]
+
+    saved = core.bulk_save_reports(items)
+
+    # 한 행이 약 1KB(UTF-8 3바이트 × 300자)이므로 한 문장에 한 행씩
+    assert db.report_inserts == [1, 1, 1, 1, 1]
+    assert [report["id"] for report in saved] == [100, 101, 102, 103, 104]
+
+
+def test_save_report_to_db_skips_increment_lookup(fake_db):
+    db = fake_db(step=5)
+
+    saved = core.save_report_to_db("post", "reason", {"type": "일치", "score": 90, "analysis": "a"})
+
+    assert saved["id"] == 100
+    assert db.report_inserts == [1]
+    assert db.analysis_rows[0][0] == 100
+
+
+def test_dashboard_stats_parses_union_sections(monkeypatch):
+    from decimal import Decimal
+
+    rows = [
+        {'section': 'trend', 'k': '2025-11-13', 'c1': Decimal(2), 'c2': Decimal(1), 'c3': Decimal(0),
+         'c4': None, 'c5': None, 'c6': None, 'c7': None},
+        {'section': 'basic', 'k': None, 'c1': Decimal(10), 'c2': Decimal(4), 'c3': Decimal(5),
+         'c4': Decimal(1), 'c5': Decimal(3), 'c6': Decimal(0), 'c7': Decimal('2.345')},
+        {'section': 'ai', 'k': 'match', 'c1': Decimal(6), 'c2': Decimal('88.25'),
+         'c3': None, 'c4': None, 'c5': None, 'c6': None, 'c7': None},
+        {'section': 'type', 'k': '욕설 및 비방', 'c1': Decimal(3),
+         'c2': None, 'c3': None, 'c4': None, 'c5': None, 'c6': None, 'c7': None},
+        {'section': 'type', 'k': '도배 및 광고', 'c1': Decimal(7),
+         'c2': None, 'c3': None, 'c4': None, 'c5': None, 'c6': None, 'c7': None},
+        {'section': 'trend', 'k': '2025-11-14', 'c1': Decimal(8), 'c2': Decimal(4), 'c3': Decimal(1),
+         'c4': None, 'c5': None, 'c6': None, 'c7': None},
+    ]
+    queries = []
+
+    class _StatsDB:
+        def execute_query(self, query, params=None):
+            queries.append(query)
+            return rows
+
+    monkeypatch.setattr(core, 'db_manager', _StatsDB())
+    monkeypatch.setattr(core, '_get_redis', lambda: None)
+
+    stats = core.get_dashboard_stats()
+
+    assert len(queries) == 1
+    assert stats['basic_stats'] == {
+        'total_reports': 10, 'pending_reports': 4, 'completed_reports': 5,
+        'rejected_reports': 1, 'high_priority': 3, 'urgent_priority': 0,
+    }
+    assert stats['avg_processing_hours'] == 2.3
+    assert stats['ai_stats'] == {core._RESULT_LABEL.get('match', 'match'): {'count': 6, 'avg_confidence': 88.2}}
+    assert list(stats['type_stats'].items()) == [('도배 및 광고', 7), ('욕설 및 비방', 3)]
+    assert [day['date'] for day in stats['daily_trends']] == ['2025-11-14', '2025-11-13']
+    assert stats['daily_trends'][0] == {'date': '2025-11-14', 'total': 8, 'completed': 4, 'rejected': 1}
+
+
+@pytest.mark.parametrize("post_action_message, expected_sql", [
+    (True, core._POST_ACTION_MESSAGE_SQL),
+    (False, "r.post_action"),
+])
+def test_reports_with_filters_post_action_format(monkeypatch, post_action_message, expected_sql):
+    queries = []
+
+    class _ListDB:
+        def execute_query(self, query, params=None):
+            queries.append(query)
+            return []
+
+    monkeypatch.setattr(core, 'db_manager', _ListDB())
+
+    result = core.get_reports_with_filters(limit=10, post_action_message=post_action_message)
+
+    assert result['reports'] == []
+    assert f"{expected_sql} as postAction" in queries[0]
@@ -0,0 +1,190 @@
+"""
+ethics_vector_db 테스트
+- 임시 디렉토리에 PersistentClient 저장소를 만들어 실제 Chroma와 비교
+"""
+import threading
+
+import numpy as np
+import pytest
+
+from ethics import ethics_vector_db as vdb
+
+
+DIM = 8
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    store = str(tmp_path / "store")
+    monkeypatch.setattr(vdb, "PERSIST_DIR", store)
+    monkeypatch.setattr(vdb, "STATS_DB_PATH", str(tmp_path / "store" / "ethics_stats.sqlite3"))
+    vdb.reset_client_cache()
+    yield vdb.get_client()
+    vdb.reset_client_cache()
+
+
+def _case(i: int, confidence: float = 90.0, confirmed: bool = False) -> dict:
+    return {
+        "sentence": f"문장 {i}",
+        "post_id": str(i),
+        "immoral_score": float(i),
+        "spam_score": 0.0,
+        "confidence": confidence,
+        "confirmed": confirmed,
+        "created_at": f"2024-01-{i + 1:02d}T00:00:00",
+    }
+
+
+def _vectors(n: int, seed: int = 0) -> list:
+    return np.random.default_rng(seed).normal(size=(n, DIM)).astype(np.float32).tolist()
+
+
+def test_sidecar_connection_reused_per_thread(client):
+    conn = vdb._sidecar_connect()
+    assert vdb._sidecar_connect() is conn
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(vdb._sidecar_connect()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    # 저장소 폐기 후에는 새 연결과 스키마로 다시 시작
+    vdb.reset_client_cache()
+    fresh = vdb._sidecar_connect()
+    assert fresh is not conn
+    assert fresh.execute("SELECT COUNT(*) FROM ethics_case_index").fetchone()[0] == 0
+
+
+def test_cases_page_sorted_by_created_at(client):
+    vdb.bulk_upsert_confirmed_cases(
+        client,
+        _vectors(5),
+        [_case(i, confirmed=i % 2 == 0) for i in range(5)]
+    )
+
+    page = vdb.get_all_cases(client, limit=2, offset=1)
+    assert [case["metadata"]["post_id"] for case in page] == ["3", "2"]
+
+    confirmed = vdb.get_recent_confirmed_cases(client, limit=10)
+    assert [case["metadata"]["post_id"] for case in confirmed] == ["4", "2", "0"]
+
+    stats = vdb.get_collection_stats(client)
+    assert stats["total_documents"] == 5
+    assert stats["confirmed_count"] == 3
+
+
+def _search(client, embedding, **kwargs):
+    kwargs.setdefault("top_k", 5)
+    kwargs.setdefault("min_score", -1e9)
+    return vdb.search_similar_cases(client, embedding, **kwargs)
+
+
+@pytest.mark.parametrize("min_confidence", [0.0, 85.0])
+def test_matrix_search_matches_chroma(client, monkeypatch, min_confidence):
+    vectors = _vectors(40)
+    vdb.bulk_upsert_confirmed_cases(
+        client,
+        vectors,
+        [_case(i, confidence=80.0 + i % 20, confirmed=i % 3 == 0) for i in range(40)]
+    )
+    queries = _vectors(6, seed=1)
+
+    matrix_results = [_search(client, q, min_confidence=min_confidence) for q in queries]
+    assert vdb._matrix_cache.get(vdb.COLLECTION_NAME) is not None
+
+    vdb.clear_query_cache()
+    monkeypatch.setattr(vdb, "MATRIX_SEARCH_MAX_ROWS", 0)
+    chroma_results = [_search(client, q, min_confidence=min_confidence) for q in queries]
+
+    for got, expected in zip(matrix_results, chroma_results):
+        assert [r["id"] for r in got] == [r["id"] for r in expected]
+        assert [r["score"] for r in got] == pytest.approx([r["score"] for r in expected], abs=1e-4)
+
+
+def test_matrix_index_appends_without_rebuild(client):
+    vectors = _vectors(10)
+    vdb.bulk_upsert_confirmed_cases(client, vectors[:9], [_case(i) for i in range(9)])
+    _search(client, vectors[0])
+    index = vdb._matrix_cache[vdb.COLLECTION_NAME]
+    matrix = index["matrix"]
+
+    # 새 케이스는 여유 행에 덧붙고, 같은 ID 재저장은 이전 행을 툼스톤 처리
+    vdb.upsert_confirmed_case(client, vectors[9], _case(9))
+    vdb.upsert_confirmed_case(client, vectors[9], _case(9, confidence=95.0))
+    assert vdb._matrix_cache[vdb.COLLECTION_NAME] is index
+    assert index["matrix"] is matrix
+    assert (index["size"], index["dead"]) == (11, 1)
+
+    top = _search(client, vectors[9], top_k=1)
+    assert top[0]["metadata"]["post_id"] == "9"
+    assert top[0]["confidence"] == 95.0
+
+    chunk_id = top[0]["id"]
+    assert vdb.delete_case(client, chunk_id)
+    assert chunk_id not in [r["id"] for r in _search(client, vectors[9], top_k=10)]
+    assert vdb._matrix_cache[vdb.COLLECTION_NAME] is index
+
+
+def test_matrix_index_rebuilt_after_write_from_other_process(client, monkeypatch):
+    vectors = _vectors(6)
+    vdb.bulk_upsert_confirmed_cases(client, vectors[:5], [_case(i) for i in range(5)])
+    _search(client, vectors[5])
+    stale = vdb._matrix_cache[vdb.COLLECTION_NAME]
+
+    # 다른 프로세스의 쓰기: Chroma와 사이드카만 바뀌고 이 프로세스의 인덱스는 그대로
+    with monkeypatch.context() as m:
+        m.setattr(vdb, "_update_matrix_index", lambda *args: None)
+        m.setattr(vdb, "clear_query_cache", lambda: None)
+        vdb.upsert_confirmed_case(client, vectors[5], _case(5))
+
+    top = _search(client, vectors[5], top_k=1)
+    assert top[0]["metadata"]["post_id"] == "5"
+    rebuilt = vdb._matrix_cache[vdb.COLLECTION_NAME]
+    assert rebuilt is not stale
+
+    # 건수가 같은 덮어쓰기도 세대 번호로 감지
+    with monkeypatch.context() as m:
+        m.setattr(vdb, "_update_matrix_index", lambda *args: None)
+        m.setattr(vdb, "clear_query_cache", lambda: None)
+        vdb.upsert_confirmed_case(client, vectors[5], _case(5, confidence=99.0))
+
+    top = _search(client, vectors[5], top_k=1)
+    assert top[0]["confidence"] == 99.0
+    assert vdb._matrix_cache[vdb.COLLECTION_NAME] is not rebuilt
+
+
+def test_query_cache_ignores_results_from_older_generation(client, monkeypatch):
+    vectors = _vectors(4)
+    vdb.bulk_upsert_confirmed_cases(client, vectors[:3], [_case(i) for i in range(3)])
+    monkeypatch.setattr(vdb, "MATRIX_SEARCH_MAX_ROWS", 0)
+
+    first = _search(client, vectors[3], top_k=1)
+    hits = vdb._query_cache_hits
+    assert _search(client, vectors[3], top_k=1) == first
+    assert vdb._query_cache_hits == hits + 1
+
+    # 다른 프로세스의 쓰기는 이 프로세스의 캐시를 비우지 않지만 세대 번호가 바뀜
+    with monkeypatch.context() as m:
+        m.setattr(vdb, "clear_query_cache", lambda: None)
+        vdb.upsert_confirmed_case(client, vectors[3], _case(3))
+    assert len(vdb._query_cache) == 1
+
+    top = _search(client, vectors[3], top_k=1)
+    assert top[0]["metadata"]["post_id"] == "3"
+
+
+def test_prepare_case_converts_numpy_and_decimal_scores():
+    from decimal import Decimal
+
+    _, _, meta = vdb._prepare_case({
+        **_case(1),
+        "immoral_score": np.float32(72.5),
+        "confidence": Decimal("91.5"),
+        "spam_score": "3",
+    })
+    assert (meta["immoral_score"], meta["confidence"], meta["spam_score"]) == (72.5, 91.5, 3.0)
+    assert all(type(meta[key]) is float for key in vdb._FLOAT_META_KEYS)
+
+    with pytest.raises(TypeError):
+        vdb._prepare_case({**_case(1), "confidence": None})
@@ -0,0 +1,88 @@
+"""
+image_db_logger 큐 저장 테스트
+- DB 대신 _insert_rows를 가짜 함수로 대체
+"""
+from ethics import image_db_logger as logger_module
+from ethics.image_db_logger import image_logger
+
+
+def test_enqueued_logs_are_written_in_batches(monkeypatch):
+    batches = []
+    monkeypatch.setattr(logger_module, "_insert_rows", lambda rows: batches.append(list(rows)))
+
+    for i in range(5):
+        assert image_logger.enqueue_analysis(
+            filename=f"{i}.png",
+            original_name=f"원본{i}.png",
+            file_size=100 + i,
+            board_id=7,
+            nsfw_result={"is_nsfw": False, "confidence": 0.1},
+            block_reason=""
+        )
+    image_logger.flush_logs()
+
+    rows = [row for batch in batches for row in batch]
+    assert [row[0] for row in rows] == [f"{i}.png" for i in range(5)]
+    assert len(batches) < 5
+    assert len(rows[0]) == len(logger_module._IMAGE_LOG_COLUMNS)
+    assert rows[0][4:7] == (True, False, 0.1)
+
+
+def test_full_queue_drops_without_inline_insert(monkeypatch):
+    import queue
+
+    inserted = []
+    monkeypatch.setattr(logger_module, "_insert_rows", lambda rows: inserted.append(rows))
+    monkeypatch.setattr(logger_module, "_ensure_writer", lambda: None)
+    monkeypatch.setattr(logger_module, "_log_queue", queue.Queue(maxsize=1))
+    dropped = image_logger.dropped_count()
+
+    assert image_logger.enqueue_analysis(filename="a.png", original_name="a.png", file_size=1)
+    assert not image_logger.enqueue_analysis(filename="b.png", original_name="b.png", file_size=1)
+
+    assert inserted == []
+    assert image_logger.dropped_count() == dropped + 1
+
+
+def _rows(names):
+    return [logger_module._build_log_row(name, name, 1) for name in names]
+
+
+def test_failed_batch_is_split_to_keep_valid_rows(monkeypatch):
+    import pymysql
+
+    written = []
+
+    def fake_insert_rows(rows):
+        if any(row[0] == "bad.png" for row in rows):
+            raise pymysql.err.DataError(1406, "Data too long")
+        written.extend(row[0] for row in rows)
+
+    monkeypatch.setattr(logger_module, "_insert_rows", fake_insert_rows)
+    dropped = image_logger.dropped_count()
+    names = [f"{i}.png" for i in range(6)]
+
+    logger_module._write_batch(_rows(names[:4] + ["bad.png"] + names[4:]))
+
+    assert written == names
+    assert image_logger.dropped_count() == dropped + 1
+
+
+def test_batch_retried_after_connection_error(monkeypatch):
+    import pymysql
+
+    attempts = []
+
+    def fake_insert_rows(rows):
+        attempts.append(len(rows))
+        if len(attempts) == 1:
+            raise pymysql.err.OperationalError(2013, "Lost connection")
+
+    monkeypatch.setattr(logger_module, "_insert_rows", fake_insert_rows)
+    monkeypatch.setattr(logger_module, "_LOG_RETRY_DELAY", 0)
+    dropped = image_logger.dropped_count()
+
+    logger_module._write_batch(_rows(["a.png", "b.png", "c.png"]))
+
+    assert attempts == [3, 3]
+    assert image_logger.dropped_count() == dropped
@@ -0,0 +1,91 @@
+"""
+model_downloader 테스트
+- 네트워크 대신 _stream_download를 가짜 함수로 대체
+"""
+import hashlib
+import os
+import zipfile
+
+import pytest
+
+from ethics import model_downloader as md
+
+
+def _write_zip(path: str) -> None:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("archive/data.pkl", b"\x80" + b"w" * 4096)
+
+
+@pytest.fixture
+def small_model(monkeypatch):
+    """MIN_MODEL_SIZE를 낮추고 작은 zip 파일을 '다운로드'하는 가짜 스트림"""
+    monkeypatch.setattr(md, "MIN_MODEL_SIZE", 1024)
+
+    def fake_stream(file_id, partial_path, max_retries):
+        _write_zip(partial_path)
+        return True
+
+    monkeypatch.setattr(md, "_stream_download", fake_stream)
+    monkeypatch.setattr(md, "REQUESTS_AVAILABLE", True)
+    monkeypatch.setattr(md, "GDOWN_AVAILABLE", False)
+
+
+def _expected_digest(tmp_path) -> str:
+    probe = str(tmp_path / "probe.pth")
+    md._stream_download("id", probe, 1)
+    with open(probe, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def test_ensure_model_exists_checks_module_digest(tmp_path, monkeypatch, small_model):
+    model_path = str(tmp_path / "models" / "binary_classifier.pth")
+
+    monkeypatch.setattr(md, "MODEL_SHA256", "0" * 64)
+    assert not md.ensure_model_exists(model_path)
+    assert not os.path.exists(model_path)
+
+    monkeypatch.setattr(md, "MODEL_SHA256", _expected_digest(tmp_path))
+    assert md.ensure_model_exists(model_path)
+    assert md.is_valid_model_file(model_path)
+    assert not os.path.exists(model_path + ".part")
+
+
+def test_ensure_model_exists_explicit_digest_overrides_constant(tmp_path, monkeypatch, small_model):
+    model_path = str(tmp_path / "binary_classifier.pth")
+    monkeypatch.setattr(md, "MODEL_SHA256", "")
+
+    assert not md.ensure_model_exists(model_path, expected_sha256="f" * 64)
+    assert md.ensure_model_exists(model_path, expected_sha256=_expected_digest(tmp_path))
+
+
+def test_partial_digest_detects_changed_tail(tmp_path, monkeypatch, small_model):
+    monkeypatch.setattr(md, "MODEL_SHA256", "")
+    monkeypatch.setattr(md, "PARTIAL_HASH_BYTES", 64)
+    model_path = str(tmp_path / "binary_classifier.pth")
+    assert md.ensure_model_exists(model_path)
+    assert os.path.exists(model_path + md.PARTIAL_DIGEST_SUFFIX)
+    assert md.is_valid_model_file(model_path)
+
+    # zip 구조는 그대로 두고 마지막 바이트(주석 영역)만 변경
+    with open(model_path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 0xFF]))
+    assert not md.is_valid_model_file(model_path)
+
+
+def test_invalid_model_kept_until_download_succeeds(tmp_path, monkeypatch, small_model):
+    monkeypatch.setattr(md, "MODEL_SHA256", "")
+    model_path = str(tmp_path / "binary_classifier.pth")
+    with open(model_path, "wb") as f:
+        f.write(b"old-weights")
+
+    with monkeypatch.context() as m:
+        m.setattr(md, "_stream_download", lambda *args: False)
+        assert not md.ensure_model_exists(model_path)
+    with open(model_path, "rb") as f:
+        assert f.read() == b"old-weights"
+
+    assert md.ensure_model_exists(model_path)
+    assert md.is_valid_model_file(model_path)
@@ -0,0 +1,35 @@
+"""
+nsfw_detector 결과 변환 테스트
+- 모델 대신 가짜 분류기 사용 (transformers 없이 실행)
+"""
+from ethics.nsfw_detector import NSFWDetector
+
+
+def _detector(monkeypatch, outputs):
+    detector = object.__new__(NSFWDetector)
+    detector.classifier = lambda images, batch_size: outputs
+    monkeypatch.setattr(NSFWDetector, "_load_image", staticmethod(lambda path: object()))
+    monkeypatch.setattr(NSFWDetector, "_scores_sorted", None)
+    return detector
+
+
+def test_analyze_batch_keeps_error_result_for_malformed_scores(monkeypatch):
+    detector = _detector(monkeypatch, [
+        [{"label": "nsfw", "score": 0.9}, {"label": "normal", "score": 0.1}],
+        [],
+        [{"score": 0.5}],
+    ])
+
+    results = detector.analyze_batch(["a.png", "b.png", "c.png"])
+
+    assert (results[0]["is_nsfw"], results[0]["label"]) == (True, "nsfw")
+    assert results[0]["confidence"] == 90.0
+    assert [result["label"] for result in results[1:]] == ["error", "error"]
+
+
+def test_analyze_returns_error_result_for_empty_scores(monkeypatch):
+    detector = _detector(monkeypatch, [[]])
+
+    assert detector.analyze("a.png") == NSFWDetector._error_result()
+    # 빈 결과로 정렬 여부를 확정하지 않음
+    assert NSFWDetector._scores_sorted is None
@@ -0,0 +1,37 @@
+"""
+reset_chroma 테스트
+- 저장소 경로가 상대 경로이므로 임시 디렉토리로 이동하여 실행
+"""
+import os
+
+import pytest
+
+from ethics import ethics_vector_db as vdb
+from ethics import reset_chroma
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(vdb, "PERSIST_DIR", "./ethics_chroma_store")
+    monkeypatch.setattr(vdb, "STATS_DB_PATH", os.path.join("./ethics_chroma_store", "ethics_stats.sqlite3"))
+    vdb.reset_client_cache()
+    yield tmp_path
+    reset_chroma.wait_for_background_removal()
+    vdb.reset_client_cache()
+
+
+def test_reset_removes_leftover_trash(workdir):
+    store = workdir / "ethics_chroma_store"
+    (workdir / "ethics_chroma_store.trash.1" / "segment").mkdir(parents=True)
+    (store / "index.trash.2" / "segment").mkdir(parents=True)
+    (store / "chroma.sqlite3").write_bytes(b"")
+    (workdir / "unrelated").mkdir()
+
+    result = reset_chroma.reset_chroma_db()
+    assert result["success"], result["message"]
+    assert reset_chroma.wait_for_background_removal(timeout=10)
+
+    assert sorted(os.listdir(workdir)) == ["ethics_chroma_store", "unrelated"]
+    assert not [name for name in os.listdir(store) if ".trash." in name]
+    assert result["details"]["document_count"] == 0
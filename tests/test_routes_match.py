@@ -0,0 +1,322 @@
+"""WMAA 신고 API 라우터 테스트 (core 함수는 가짜로 대체)"""
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import routes_match
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(routes_match.router, prefix="/api")
+    return TestClient(app)
+
+
+def _report(report_id, status='pending', priority='normal'):
+    return {
+        'id': report_id,
+        'reportDate': '2025-11-14T10:00:00',
+        'reportType': '욕설 및 비방',
+        'status': status,
+        'priority': priority,
+        'postAction': None,
+    }
+
+
+
+def test_router_uses_shared_orjson_response_without_deprecation(client, monkeypatch):
+    import warnings
+    
+    import numpy as np
+    from fastapi.exceptions import FastAPIDeprecationWarning
+    
+    from app.responses import AppJSONResponse
+    
+    assert routes_match.router.default_response_class is AppJSONResponse
+    assert AppJSONResponse({1: np.float32(1.5)}).body == b'{"1":1.5}'
+    
+    monkeypatch.setattr(routes_match, 'get_dashboard_stats', lambda: {'basic_stats': {}})
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FastAPIDeprecationWarning)
+        response = client.get('/api/dashboard/stats')
+    assert response.status_code == 200
+
+def test_filtered_reports_passes_filters_by_keyword(client, monkeypatch):
+    calls = []
+    
+    def fake_get_reports_with_filters(**kwargs):
+        calls.append(kwargs)
+        return {'reports': [_report(1)], 'total': 30, 'limit': kwargs['limit'], 'offset': kwargs['offset']}
+    
+    monkeypatch.setattr(routes_match, 'get_reports_with_filters', fake_get_reports_with_filters)
+    
+    response = client.get('/api/reports/filtered', params={
+        'status': 'pending', 'ai_result': '일치', 'start_date': '2025-11-01', 'limit': 10, 'offset': 10
+    })
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert body['data'] == [_report(1)]
+    assert body['pagination'] == {'total': 30, 'limit': 10, 'offset': 10, 'has_more': True}
+    assert calls == [{
+        'status_filter': 'pending',
+        'type_filter': None,
+        'ai_result_filter': '일치',
+        'start_date': '2025-11-01',
+        'end_date': None,
+        'limit': 10,
+        'offset': 10,
+    }]
+
+
+_STATS = {
+    'basic_stats': {'total_reports': 10, 'pending_reports': 4, 'completed_reports': 5, 'rejected_reports': 1},
+    'ai_stats': {'일치': {'count': 6, 'avg_confidence': 88.2}},
+    'type_stats': {'도배 및 광고': 7},
+    'daily_trends': [{'date': '2025-11-14', 'total': 8, 'completed': 4, 'rejected': 1}],
+    'avg_processing_hours': 2.3,
+}
+
+
+def test_reports_stats_summarises_dashboard_stats(client, monkeypatch):
+    monkeypatch.setattr(routes_match, 'get_dashboard_stats', lambda: _STATS)
+    
+    response = client.get('/api/reports/stats')
+    
+    assert response.status_code == 200
+    data = response.json()['data']
+    assert data['status_stats'] == {'pending': 4, 'completed': 5, 'rejected': 1, 'total': 10}
+    assert data['ai_result_stats'] == _STATS['ai_stats']
+    assert data['avg_processing_hours'] == 2.3
+
+
+def test_dashboard_stats_returns_stats(client, monkeypatch):
+    monkeypatch.setattr(routes_match, 'get_dashboard_stats', lambda: _STATS)
+    
+    response = client.get('/api/dashboard/stats')
+    
+    assert response.status_code == 200
+    assert response.json() == {'success': True, 'data': _STATS}
+
+
+def test_dashboard_stats_error_is_500(client, monkeypatch):
+    def broken():
+        raise Exception("대시보드 통계 조회 오류: down")
+    monkeypatch.setattr(routes_match, 'get_dashboard_stats', broken)
+    
+    response = client.get('/api/dashboard/stats')
+    
+    assert response.status_code == 500
+    assert 'down' in response.json()['detail']
+
+
+def test_reports_list_paged_mode(client, monkeypatch):
+    calls = []
+    
+    def fake_get_reports_with_filters(**kwargs):
+        calls.append(kwargs)
+        return {'reports': [_report(3, priority='high')], 'total': 3, 'limit': kwargs['limit'], 'offset': kwargs['offset']}
+    
+    monkeypatch.setattr(routes_match, 'get_reports_with_filters', fake_get_reports_with_filters)
+    monkeypatch.setattr(routes_match, 'load_reports_db', lambda: pytest.fail('전체 목록을 읽으면 안 됨'))
+    
+    response = client.get('/api/reports/list', params={'priority': 'high', 'limit': 2, 'offset': 2})
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert body['data'] == [_report(3, priority='high')]
+    assert body['total'] == 3
+    assert body['pagination'] == {'total': 3, 'limit': 2, 'offset': 2, 'has_more': False}
+    assert calls == [{
+        'status_filter': None, 'priority_filter': 'high', 'limit': 2, 'offset': 2, 'post_action_message': False
+    }]
+
+
+def test_reports_list_rejects_invalid_limit(client):
+    assert client.get('/api/reports/list', params={'limit': 0}).status_code == 422
+
+
+@pytest.mark.parametrize('count', [0, 1, 5])
+def test_reports_list_streams_full_list_as_json(client, monkeypatch, count):
+    reports = [_report(i) for i in range(count)]
+    monkeypatch.setattr(routes_match, '_STREAM_CHUNK_SIZE', 2)
+    monkeypatch.setattr(routes_match, 'load_reports_db', lambda: reports)
+    
+    response = client.get('/api/reports/list')
+    
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/json')
+    assert response.json() == {'success': True, 'data': reports, 'total': count}
+
+
+def test_reports_list_streams_status_and_priority_filters(client, monkeypatch):
+    pending = [_report(1, priority='high'), _report(2), _report(3, priority='high')]
+    monkeypatch.setattr(routes_match, 'list_reports_by_status', lambda status: pending if status == 'pending' else [])
+    monkeypatch.setattr(routes_match, 'list_reports_by_priority', lambda priority: [_report(9, priority=priority)])
+    
+    both = client.get('/api/reports/list', params={'status': 'pending', 'priority': 'high'}).json()
+    assert [r['id'] for r in both['data']] == [1, 3]
+    assert both['total'] == 2
+    
+    by_priority = client.get('/api/reports/list', params={'priority': 'low'}).json()
+    assert by_priority['data'] == [_report(9, priority='low')]
+
+
+def test_reports_export_streams_ndjson(client, monkeypatch):
+    from datetime import datetime
+    
+    calls = []
+    
+    def fake_iter_reports_with_filters(**kwargs):
+        calls.append(kwargs)
+        yield {**_report(1), 'processedDate': datetime(2025, 11, 14, 12, 0)}
+        yield _report(2, status='completed')
+    
+    monkeypatch.setattr(routes_match, 'iter_reports_with_filters', fake_iter_reports_with_filters)
+    
+    response = client.get('/api/reports/export', params={'status': 'pending', 'report_type': '욕설 및 비방'})
+    
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line['id'] for line in lines] == [1, 2]
+    assert lines[0]['processedDate'] == '2025-11-14 12:00:00'
+    assert lines[0]['reportType'] == '욕설 및 비방'
+    assert calls == [{
+        'status_filter': 'pending',
+        'type_filter': '욕설 및 비방',
+        'ai_result_filter': None,
+        'start_date': None,
+        'end_date': None,
+    }]
+
+
+_ANALYSIS = {'type': '일치', 'score': 92, 'analysis': '욕설 포함', 'css_class': 'match'}
+
+
+@pytest.fixture
+def fake_saved(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')
+    saved = []
+    
+    def fake_save_analysis_only_to_db(result):
+        saved.append(result)
+        return {'id': 7, 'reportDate': '2025-11-14T10:00:00'}
+    
+    monkeypatch.setattr(routes_match, 'save_analysis_only_to_db', fake_save_analysis_only_to_db)
+    return saved
+
+
+def test_analyze_returns_batched_result(client, monkeypatch, fake_saved):
+    calls = []
+    
+    async def fake_analyze_with_ai_batched(post_content, reason):
+        calls.append((post_content, reason))
+        return dict(_ANALYSIS)
+    
+    monkeypatch.setattr(routes_match, 'analyze_with_ai_batched', fake_analyze_with_ai_batched)
+    
+    response = client.post('/api/analyze', json={'post_content': '게시글', 'reason': '욕설'})
+    
+    assert response.status_code == 200
+    assert response.json() == {
+        'id': 7,
+        'post_content': '게시글',
+        'reason': '욕설',
+        'result_type': '일치',
+        'score': 92,
+        'analysis': '욕설 포함',
+        'css_class': 'match',
+        'timestamp': '2025-11-14T10:00:00',
+        'status': 'test_analysis',
+        'post_action': '테스트 분석 완료',
+    }
+    assert calls == [('게시글', '욕설')]
+    assert fake_saved == [_ANALYSIS]
+
+
+def test_analyze_without_api_key_returns_500(client, monkeypatch, fake_saved):
+    monkeypatch.setenv('OPENAI_API_KEY', '')
+    
+    response = client.post('/api/analyze', json={'post_content': '게시글', 'reason': '욕설'})
+    
+    assert response.status_code == 500
+    assert 'API 키' in response.json()['detail']
+    assert fake_saved == []
+
+
+def test_analyze_stream_sends_score_then_result(client, monkeypatch, fake_saved):
+    async def fake_analyze_with_ai_stream(post_content, reason):
+        yield {'event': 'score', 'score': 92}
+        yield {'event': 'result', 'result': dict(_ANALYSIS)}
+    
+    monkeypatch.setattr(routes_match, 'analyze_with_ai_stream', fake_analyze_with_ai_stream)
+    
+    response = client.post('/api/analyze/stream', json={'post_content': '게시글', 'reason': '욕설'})
+    
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event['event'] for event in events] == ['score', 'result']
+    assert events[0]['score'] == 92
+    assert events[1]['data']['id'] == 7
+    assert events[1]['data']['result_type'] == '일치'
+    assert events[1]['data']['timestamp'] == '2025-11-14T10:00:00'
+    assert fake_saved == [_ANALYSIS]
+
+
+def test_analyze_stream_reports_error_event(client, monkeypatch, fake_saved):
+    async def fake_analyze_with_ai_stream(post_content, reason):
+        yield {'event': 'score', 'score': 40}
+        raise RuntimeError('응답 파싱 실패')
+    
+    monkeypatch.setattr(routes_match, 'analyze_with_ai_stream', fake_analyze_with_ai_stream)
+    
+    response = client.post('/api/analyze/stream', json={'post_content': '게시글', 'reason': '욕설'})
+    
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events == [
+        {'event': 'score', 'score': 40},
+        {'event': 'error', 'detail': '응답 파싱 실패'},
+    ]
+    assert fake_saved == []
+
+
+def test_report_detail_found_and_missing(client, monkeypatch):
+    monkeypatch.setattr(routes_match, 'get_report_by_id', lambda report_id: _report(report_id) if report_id == 3 else None)
+    
+    found = client.get('/api/reports/detail/3')
+    assert found.status_code == 200
+    assert found.json() == {'success': True, 'data': _report(3)}
+    
+    missing = client.get('/api/reports/detail/4')
+    assert missing.status_code == 404
+    assert missing.json()['detail'] == '신고를 찾을 수 없습니다.'
+
+
+def test_report_update_validates_status_and_missing_report(client, monkeypatch):
+    calls = []
+    
+    def fake_update_report_status(report_id, status, processing_note):
+        calls.append((report_id, status, processing_note))
+        if report_id != 3:
+            raise ValueError(f"신고 ID {report_id}를 찾을 수 없습니다.")
+        return _report(report_id, status=status)
+    
+    monkeypatch.setattr(routes_match, 'update_report_status', fake_update_report_status)
+    
+    invalid = client.put('/api/reports/update/3', params={'status': 'done'})
+    assert invalid.status_code == 400
+    assert calls == []
+    
+    missing = client.put('/api/reports/update/4', params={'status': 'rejected'})
+    assert missing.status_code == 404
+    assert '4' in missing.json()['detail']
+    
+    updated = client.put('/api/reports/update/3', params={'status': 'completed', 'processing_note': '승인'})
+    assert updated.status_code == 200
+    assert updated.json()['data'] == _report(3, status='completed')
+    assert calls[-1] == (3, 'completed', '승인')